@@ -0,0 +1,340 @@
+"""
+Local Adzuna stand-in for offline tests, benchmarks and load tests.
+
+Serves `GET /v1/api/jobs/{country}/search/{page}` like the real API, from
+recorded fixtures or deterministic synthetic listings, with optional latency,
+error and HTTP 429 injection. Record mode forwards requests to the real API
+and saves each successful response as a fixture for later replay.
+
+    cd backend
+    python -m devtools.adzuna_standin --port 8765 --latency 0.3 --throttle-rate 0.05
+    export ADZUNA_BASE_URL=http://127.0.0.1:8765/v1/api/jobs
+
+`GET /__stats` returns request counts by status.
+"""
+import os
+import json
+import time
+import random
+import hashlib
+import logging
+import argparse
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SEARCH_PREFIX = "/v1/api/jobs/"
+DEFAULT_UPSTREAM = "https://api.adzuna.com"
+MODES = ("synthetic", "replay", "record")
+
+# Query params that never affect the response (and must never reach a fixture)
+CREDENTIAL_PARAMS = ("app_id", "app_key")
+
+_COMPANIES = (
+    "Acme Analytics", "Brightwave", "Northwind Labs", "Harbour & Co", "Kestrel Systems",
+    "Lumen Health", "Oakridge Partners", "Pinnacle Retail", "Quantum Freight", "Riverside Council",
+)
+_CITIES = {
+    "gb": ("London", "Manchester", "Leeds", "Bristol", "Edinburgh", "Birmingham"),
+    "us": ("New York", "Austin", "Chicago", "Seattle", "Boston", "Denver"),
+    "de": ("Berlin", "Munich", "Hamburg", "Frankfurt", "Cologne"),
+    "fr": ("Paris", "Lyon", "Toulouse", "Lille"),
+    "au": ("Sydney", "Melbourne", "Brisbane", "Perth"),
+    "ca": ("Toronto", "Vancouver", "Montreal", "Calgary"),
+}
+_SENIORITY = ("", "Junior ", "Senior ", "Lead ", "Graduate ", "Principal ")
+_CONTRACT_TIMES = ("full_time", "full_time", "part_time", None)
+_FILLER = (
+    "join a growing team delivering reliable services to customers across the region while "
+    "working with modern tools, supportive colleagues and flexible hybrid arrangements. "
+    "You will own day to day delivery, collaborate with stakeholders, mentor others and help "
+    "shape how the team works. We offer training, a pension scheme, generous leave and a "
+    "clear path to progression for the right candidate who enjoys solving problems."
+)
+
+
+def fixture_key(country: str, page: int, params: Dict[str, str]) -> str:
+    """File name of the fixture for a search (credentials excluded)."""
+    query = sorted((name, value) for name, value in params.items() if name not in CREDENTIAL_PARAMS)
+    digest = hashlib.sha1(json.dumps([country, page, query]).encode()).hexdigest()[:16]
+    return f"{country}-p{page}-{digest}.json"
+
+
+def synthetic_search(country: str, page: int, params: Dict[str, str], total: int) -> Dict[str, Any]:
+    """
+    Deterministic Adzuna-shaped search response: the same query always yields
+    the same `total` listings, split into pages of `results_per_page`. Jobs
+    carry the unused fields (category, area, adref, coordinates...) of real
+    responses so decoding costs are realistic.
+    """
+    what = params.get("what", "jobs")
+    per_page = max(1, min(int(params.get("results_per_page", 10)), 50))
+    query = sorted((name, value) for name, value in params.items()
+                   if name not in CREDENTIAL_PARAMS and name != "results_per_page")
+    seed = int(hashlib.sha1(json.dumps([country, query]).encode()).hexdigest()[:12], 16)
+    cities = _CITIES.get(country, _CITIES["gb"])
+
+    results = []
+    for index in range((page - 1) * per_page, min(page * per_page, total)):
+        rng = random.Random(seed + index)
+        job_id = str(4_000_000_000 + (seed + index) % 1_000_000_000)
+        city = params.get("where") or rng.choice(cities)
+        salary_min = rng.randrange(22, 90) * 1000
+        results.append({
+            "__CLASS__": "Adzuna::API::Response::Job",
+            "id": job_id,
+            "adref": hashlib.sha1(job_id.encode()).hexdigest() * 3,
+            "title": f"{rng.choice(_SENIORITY)}{what.title()}",
+            "company": {"__CLASS__": "Adzuna::API::Response::Company",
+                        "display_name": params.get("company") or rng.choice(_COMPANIES)},
+            "location": {"__CLASS__": "Adzuna::API::Response::Location",
+                         "display_name": city, "area": [country.upper(), city]},
+            "category": {"__CLASS__": "Adzuna::API::Response::Category",
+                         "label": "IT Jobs", "tag": "it-jobs"},
+            "contract_time": rng.choice(_CONTRACT_TIMES),
+            "contract_type": rng.choice(("permanent", "contract")),
+            "salary_min": salary_min,
+            "salary_max": salary_min + rng.randrange(5, 30) * 1000,
+            "salary_is_predicted": rng.choice(("0", "1")),
+            "description": f"As a {what} you will {_FILLER} " * 2,
+            "redirect_url": f"https://www.adzuna.co.uk/jobs/land/ad/{job_id}",
+            "created": "2025-06-01T09:00:00Z",
+            "latitude": round(rng.uniform(-60, 60), 5),
+            "longitude": round(rng.uniform(-120, 120), 5),
+        })
+    return {
+        "__CLASS__": "Adzuna::API::Response::JobSearchResults",
+        "count": total,
+        "mean": 45000.0,
+        "results": results,
+    }
+
+
+class AdzunaStandin:
+    """
+    In-process stand-in server. `start()` returns the base URL to use as
+    ADZUNA_BASE_URL; `stats()` reports what was served.
+
+    Modes: "synthetic" generates listings; "replay" serves fixtures from
+    `fixtures_dir` (falling back to synthetic data unless `strict`, which
+    answers 404); "record" proxies to `upstream` and saves 200 responses.
+    Latency, error and throttle injection apply to synthetic and replay.
+    """
+
+    def __init__(
+        self,
+        mode: str = "synthetic",
+        fixtures_dir: Optional[str] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        total: int = 120,
+        strict: bool = False,
+        upstream: str = DEFAULT_UPSTREAM,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int = 0,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}, got {mode!r}")
+        if mode in ("replay", "record") and not fixtures_dir:
+            raise ValueError(f"{mode} mode needs a fixtures directory")
+        self.mode = mode
+        self.fixtures_dir = fixtures_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.total = total
+        self.strict = strict
+        self.upstream = upstream.rstrip("/")
+        self.host = host
+        self.port = port
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._counts: Dict[str, int] = {}
+        self.bytes_sent = 0
+        if fixtures_dir:
+            os.makedirs(fixtures_dir, exist_ok=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1/api/jobs"
+
+    def start(self) -> str:
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                status, headers, body = standin.handle(self.path)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(f"[standin] {self.address_string()} {format % args}")
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="adzuna-standin", daemon=True).start()
+        logger.info(f"[standin] Serving {self.mode} Adzuna responses at {self.base_url}")
+        return self.base_url
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "AdzunaStandin":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": sum(self._counts.values()),
+                "by_outcome": dict(self._counts),
+                "bytes_sent": self.bytes_sent,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self.bytes_sent = 0
+
+    def _count(self, outcome: str, body: bytes) -> None:
+        with self._lock:
+            self._counts[outcome] = self._counts.get(outcome, 0) + 1
+            self.bytes_sent += len(body)
+
+    def handle(self, path: str) -> Tuple[int, Dict[str, str], bytes]:
+        """Status, extra headers and body for one GET request."""
+        parsed = urllib.parse.urlsplit(path)
+        if parsed.path == "/__stats":
+            return 200, {}, json.dumps(self.stats()).encode()
+
+        parts = parsed.path[len(SEARCH_PREFIX):].split("/") if parsed.path.startswith(SEARCH_PREFIX) else []
+        if len(parts) != 3 or parts[1] != "search" or not parts[2].isdigit():
+            return self._reply("not_found", 404, {"error": f"unknown path {parsed.path}"})
+        country, page = parts[0].lower(), int(parts[2])
+        params = dict(urllib.parse.parse_qsl(parsed.query))
+
+        if self.mode == "record":
+            return self._record(path, country, page, params)
+
+        with self._lock:
+            roll = self._rng.random()
+            delay = max(0.0, self._rng.gauss(self.latency, self.jitter)) if self.latency else 0.0
+        if delay:
+            time.sleep(delay)
+        if roll < self.throttle_rate:
+            return self._reply("throttled", 429, {"error": "rate limited"}, {"Retry-After": f"{self.retry_after:g}"})
+        if roll < self.throttle_rate + self.error_rate:
+            return self._reply("error", 503, {"error": "injected failure"})
+
+        if self.mode == "replay":
+            fixture = self._load_fixture(country, page, params)
+            if fixture is not None:
+                return self._reply("replayed", fixture.get("status", 200), fixture["body"])
+            if self.strict:
+                return self._reply("missing_fixture", 404, {"error": "no fixture for this search"})
+        return self._reply("synthetic", 200, synthetic_search(country, page, params, self.total))
+
+    def _reply(self, outcome: str, status: int, payload: Any, headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload).encode()
+        self._count(outcome, body)
+        return status, headers or {}, body
+
+    def _fixture_path(self, country: str, page: int, params: Dict[str, str]) -> str:
+        return os.path.join(self.fixtures_dir, fixture_key(country, page, params))
+
+    def _load_fixture(self, country: str, page: int, params: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._fixture_path(country, page, params), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _record(self, path: str, country: str, page: int, params: Dict[str, str]):
+        try:
+            with urllib.request.urlopen(f"{self.upstream}{path}", timeout=30) as response:
+                status, body = response.status, response.read()
+        except urllib.error.HTTPError as e:
+            status, body = e.code, e.read()
+        except OSError as e:
+            return self._reply("upstream_error", 502, {"error": str(e)})
+
+        if status == 200:
+            fixture = {
+                "request": {
+                    "country": country,
+                    "page": page,
+                    "params": {k: v for k, v in params.items() if k not in CREDENTIAL_PARAMS},
+                },
+                "status": status,
+                "body": json.loads(body),
+            }
+            with open(self._fixture_path(country, page, params), "w", encoding="utf-8") as f:
+                json.dump(fixture, f, ensure_ascii=False, indent=1)
+            logger.info(f"[standin] Recorded {country} page {page} for {params.get('what')!r}")
+        self._count("recorded" if status == 200 else f"upstream_{status}", body)
+        return status, {}, body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local Adzuna-compatible stand-in server.")
+    parser.add_argument("--mode", choices=MODES, default="synthetic")
+    parser.add_argument("--fixtures", help="fixture directory (replay/record)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="mean response delay, seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="standard deviation of the delay")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of requests answered 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After sent with 429s")
+    parser.add_argument("--total", type=int, default=120, help="synthetic listings per query")
+    parser.add_argument("--strict", action="store_true", help="replay: 404 instead of synthetic data when no fixture matches")
+    parser.add_argument("--upstream", default=DEFAULT_UPSTREAM, help="real API host for record mode")
+    parser.add_argument("--seed", type=int, default=0, help="seed for latency and fault injection")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    standin = AdzunaStandin(
+        mode=args.mode, fixtures_dir=args.fixtures, latency=args.latency, jitter=args.jitter,
+        error_rate=args.error_rate, throttle_rate=args.throttle_rate, retry_after=args.retry_after,
+        total=args.total, strict=args.strict, upstream=args.upstream,
+        host=args.host, port=args.port, seed=args.seed,
+    )
+    base_url = standin.start()
+    print(f"export ADZUNA_BASE_URL={base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        standin.stop()
+
+
+if __name__ == "__main__":
+    main()
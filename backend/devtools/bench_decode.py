@@ -0,0 +1,85 @@
+"""
+Decode benchmark for Adzuna search responses.
+
+Times parsing a stand-in search page and formatting every job into a
+JobListing, as the client does per response, with each JSON backend
+against plain `json.loads`. Reports seconds for `--iterations` pages and
+the peak traced memory of one page.
+
+    cd backend
+    python -m devtools.bench_decode
+    python -m devtools.bench_decode --page-size 50 --iterations 300 --output decode.json
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from devtools.adzuna_standin import synthetic_search
+
+
+def _measure(decode: Callable[[bytes], List[Any]], body: bytes, iterations: int) -> Dict[str, float]:
+    for _ in range(min(iterations, 20)):
+        decode(body)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        decode(body)
+    seconds = time.perf_counter() - started
+
+    tracemalloc.start()
+    decode(body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"seconds": round(seconds, 4), "peak_kb": round(peak / 1024, 1)}
+
+
+def run(page_size: int, iterations: int) -> Dict[str, Any]:
+    from workmatch.utils import adzuna_decode
+    from workmatch.utils.adzuna import AsyncAdzunaAPI
+
+    api = AsyncAdzunaAPI("bench", "bench", cache=None, store=None)
+    search = synthetic_search("gb", 1, {"what": "data analyst", "results_per_page": str(page_size)}, page_size)
+    body = json.dumps(search).encode()
+
+    def baseline(raw: bytes) -> List[Any]:
+        return [api._format_job_listing(job) for job in json.loads(raw)["results"]]
+
+    def client(raw: bytes) -> List[Any]:
+        return [api._format_job_listing(job) for job in adzuna_decode.decode_search_response(raw)["results"]]
+
+    results = {"json.loads": _measure(baseline, body, iterations)}
+    backends = ["stdlib"] + (["orjson"] if adzuna_decode.orjson is not None else [])
+    for backend in backends:
+        os.environ["ADZUNA_JSON_BACKEND"] = backend
+        results[f"decode_search_response ({backend})"] = _measure(client, body, iterations)
+    os.environ.pop("ADZUNA_JSON_BACKEND", None)
+    return {"page_bytes": len(body), "page_size": page_size, "iterations": iterations, "results": results}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare Adzuna response decoding backends.")
+    parser.add_argument("--page-size", type=int, default=50, help="jobs per search page (at most 50)")
+    parser.add_argument("--iterations", type=int, default=300, help="pages decoded per timing")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    report = run(args.page_size, args.iterations)
+    baseline = report["results"]["json.loads"]["seconds"]
+    print(f"{report['page_size']} jobs, {report['page_bytes']} bytes per page, {report['iterations']} pages\n")
+    print(f"{'decoder':<34} {'seconds':>8} {'vs json.loads':>14} {'peak KB':>8}")
+    for name, stats in report["results"].items():
+        print(f"{name:<34} {stats['seconds']:>8.4f} {stats['seconds'] / baseline:>13.2f}x {stats['peak_kb']:>8.1f}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+Benchmarks summarise_expanded_job_roles_tool against the local Adzuna stand-in.
+
+Runs the tool for every combination of title fan-out, page size and employer
+filter, and reports wall time, p50/p95/p99 latency, Adzuna requests issued,
+bytes decoded and peak traced memory per scenario. Results are written as
+JSON; pass `--baseline` to compare against an earlier run.
+
+    cd backend
+    python -m devtools.bench_job_search --latency 0.2 --output bench.json
+    python -m devtools.bench_job_search --latency 0.2 --baseline bench.json
+
+The response cache is off and the local rate limit is raised by default, so
+every iteration really calls the stand-in; `--cache` turns the cache back on.
+"""
+import os
+import sys
+import json
+import math
+import time
+import asyncio
+import logging
+import argparse
+import platform
+import statistics
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+from devtools.adzuna_standin import AdzunaStandin
+
+logger = logging.getLogger(__name__)
+
+TITLE_POOL = (
+    "data analyst", "business analyst", "data scientist", "analytics engineer", "bi developer",
+    "reporting analyst", "insights analyst", "data engineer", "product analyst", "marketing analyst",
+    "financial analyst", "operations analyst", "research analyst", "quantitative analyst", "data consultant",
+    "machine learning engineer", "statistician", "crm analyst", "pricing analyst", "risk analyst",
+)
+BENCH_EMPLOYER = "Acme Analytics"
+
+# Relative slowdown (p50/p95) that counts as a regression against the baseline
+DEFAULT_TOLERANCE = 0.2
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of `values` (which must not be empty)."""
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), math.ceil(pct / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def scenario_name(titles: int, page_size: int, employer: bool) -> str:
+    return f"titles={titles},page_size={page_size},employer={'yes' if employer else 'no'}"
+
+
+async def run_scenario(
+    tool,
+    api,
+    standin: AdzunaStandin,
+    titles: int,
+    page_size: int,
+    employer: bool,
+    iterations: int,
+    warmup: int,
+) -> Dict[str, Any]:
+    """Times `iterations` tool calls for one scenario (after `warmup` untimed calls)."""
+    kwargs = {
+        "job_title": TITLE_POOL[0],
+        "expanded_titles": list(TITLE_POOL[1:titles]),
+        "expand": False,  # exactly `titles` titles, never the offline index's variants
+        "employer": BENCH_EMPLOYER if employer else None,
+        "results_per_title": page_size if page_size > 5 else None,
+    }
+    for _ in range(warmup):
+        await tool(**kwargs)
+
+    standin.reset_stats()
+    bytes_before = api.metrics()["decode"]["bytes"]
+    tracemalloc.reset_peak()
+    traced_before = tracemalloc.get_traced_memory()[0]
+
+    latencies = []
+    listings = 0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        result = await tool(**kwargs)
+        latencies.append(time.perf_counter() - call_started)
+        listings += result["total_listings_found"]
+    wall = time.perf_counter() - started
+
+    served = standin.stats()
+    return {
+        "titles": titles,
+        "page_size": page_size,
+        "employer": employer,
+        "iterations": iterations,
+        "wall_s": round(wall, 4),
+        "mean_s": round(statistics.fmean(latencies), 4),
+        "p50_s": round(percentile(latencies, 50), 4),
+        "p95_s": round(percentile(latencies, 95), 4),
+        "p99_s": round(percentile(latencies, 99), 4),
+        "requests": served["requests"],
+        "requests_by_outcome": served["by_outcome"],
+        "bytes_decoded": api.metrics()["decode"]["bytes"] - bytes_before,
+        "peak_memory_kb": round((tracemalloc.get_traced_memory()[1] - traced_before) / 1024, 1),
+        "listings_per_call": round(listings / iterations, 1),
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Prints a p50/p95 comparison with `baseline` and returns the regressed scenarios."""
+    regressions = []
+    print(f"\n{'scenario':<45} {'p50 base':>9} {'p50 now':>9} {'p95 base':>9} {'p95 now':>9}")
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            print(f"{name:<45} {'(new)':>9}")
+            continue
+        print(f"{name:<45} {previous['p50_s']:>9.4f} {current['p50_s']:>9.4f} "
+              f"{previous['p95_s']:>9.4f} {current['p95_s']:>9.4f}")
+        if any(current[stat] > previous[stat] * (1 + tolerance) for stat in ("p50_s", "p95_s")):
+            regressions.append(name)
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    from workmatch.tools.career_tools import summarise_expanded_job_roles_tool
+    from workmatch.utils.adzuna import get_async_adzuna_api
+    from workmatch.utils.adzuna_decode import json_backend
+
+    api = get_async_adzuna_api()
+    tracemalloc.start()
+    scenarios = {}
+    for titles in args.titles:
+        for page_size in args.page_sizes:
+            for employer in args.employer:
+                name = scenario_name(titles, page_size, employer)
+                scenarios[name] = await run_scenario(
+                    summarise_expanded_job_roles_tool, api, args.standin,
+                    titles, page_size, employer, args.iterations, args.warmup,
+                )
+                stats = scenarios[name]
+                print(f"{name:<45} p50={stats['p50_s']:.4f}s p95={stats['p95_s']:.4f}s "
+                      f"p99={stats['p99_s']:.4f}s requests={stats['requests']} "
+                      f"decoded={stats['bytes_decoded']}B peak={stats['peak_memory_kb']}KB")
+    tracemalloc.stop()
+    await api.aclose()
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "json_backend": json_backend(),
+            "latency_s": args.latency,
+            "jitter_s": args.jitter,
+            "iterations": args.iterations,
+            "cache": args.cache,
+        },
+        "scenarios": scenarios,
+    }
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the job-search tool against a local Adzuna stand-in.")
+    parser.add_argument("--titles", type=_int_list, default=[1, 5, 10, 20], help="title fan-outs, e.g. 1,5,10,20")
+    parser.add_argument("--page-sizes", type=_int_list, default=[5, 50],
+                        help="listings per title; above 5 uses bulk mode (results_per_title)")
+    parser.add_argument("--employer", choices=("both", "yes", "no"), default="both", help="employer filter scenarios")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.1, help="stand-in mean response delay, seconds")
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--cache", action="store_true", help="keep the Adzuna response cache on")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare with a JSON file from an earlier run")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="relative p50/p95 slowdown that fails the comparison")
+    args = parser.parse_args(argv)
+    args.employer = {"both": [False, True], "yes": [True], "no": [False]}[args.employer]
+
+    logging.basicConfig(level=logging.WARNING)
+    standin = AdzunaStandin(latency=args.latency, jitter=args.jitter)
+    args.standin = standin
+    os.environ.update({
+        "ADZUNA_BASE_URL": standin.start(),
+        "ADZUNA_APP_ID": os.getenv("ADZUNA_APP_ID") or "bench",
+        "ADZUNA_APP_KEY": os.getenv("ADZUNA_APP_KEY") or "bench",
+        "ADZUNA_RATE_PER_SECOND": "1000",
+        "ADZUNA_RATE_BURST": "1000",
+    })
+    if not args.cache:
+        os.environ["ADZUNA_CACHE_TTL"] = "0"
+    os.environ.pop("ADZUNA_STORE_PATH", None)
+
+    try:
+        results = asyncio.run(run(args))
+    finally:
+        standin.stop()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} scenario(s) slower than baseline by more than {args.tolerance:.0%}:")
+            for name in regressions:
+                print(f"  {name}")
+            return 1
+        print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+"""
+Load generator for a WorkMatch ADK API server.
+
+Virtual users arrive at a configurable rate (Poisson arrivals). Each one
+creates a session and replays a scripted persona conversation turn by turn
+through `/run`. Reports per-turn latency percentiles, error rate and
+throughput, optionally as JSON.
+
+    adk api_server            # from backend/, serves http://127.0.0.1:8000
+    cd backend
+    python -m devtools.loadgen --users 50 --rate 5 --output load.json
+    python -m devtools.loadgen --users 500 --rate 50 --think-time 1,3 --script personas.json
+
+A script is a JSON list of `{"name": ..., "turns": ["Hi", ...]}` personas.
+Virtual users cycle through them.
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import random
+import asyncio
+import logging
+import argparse
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from devtools.bench_job_search import percentile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "http://127.0.0.1:8000"
+APP_NAME = "workmatch"
+ROOT_AGENT_NAME = "workmatch_root_agent"
+
+# Scripted versions of the personas in tests/test_workmatch.py
+DEFAULT_SCRIPT = [
+    {
+        "name": "Senior Business Analyst",
+        "turns": [
+            "Hi",
+            "I'm a Senior Business Analyst with 10 years of experience looking for remote leadership opportunities in the financial sector.",
+            "Show me live jobs for business analysis lead roles in London",
+            "Next page",
+        ],
+    },
+    {
+        "name": "Product Owner (E-commerce to Fintech)",
+        "turns": [
+            "Hi",
+            "I'm a Product Owner in the e-commerce space. I want to see what skills I need to move into a Product Owner role at a fintech company.",
+            "What certifications would help?",
+        ],
+    },
+    {
+        "name": "Entry-Level UX Designer",
+        "turns": [
+            "Hi",
+            "I just finished a UX bootcamp and I'm looking for my first job.",
+            "Find junior UX designer jobs in Manchester",
+            "Give me a motivational quote",
+        ],
+    },
+    {
+        "name": "Data Analyst in Berlin",
+        "turns": [
+            "Hi",
+            "I need a job as a data analyst in Berlin.",
+            "Search gb and de for data analyst roles",
+        ],
+    },
+]
+
+
+class LoadStats:
+    """Collects per-turn outcomes from all virtual users."""
+
+    def __init__(self):
+        self.turn_latencies: List[float] = []
+        self.latencies_by_turn: Dict[int, List[float]] = {}
+        self.session_latencies: List[float] = []
+        self.errors: Dict[str, int] = {}
+        self.turns = 0
+        self.skipped_turns = 0
+        self.failed_sessions = 0
+        self.users_started = 0
+        self.users_completed = 0
+
+    def turn(self, index: int, latency: float, error: Optional[str]) -> None:
+        self.turns += 1
+        if error:
+            self.errors[error] = self.errors.get(error, 0) + 1
+            return
+        self.turn_latencies.append(latency)
+        self.latencies_by_turn.setdefault(index, []).append(latency)
+
+    def error(self, kind: str) -> None:
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    def session_failed(self, kind: str, turns: int) -> None:
+        """A session could not be created, so none of its `turns` ran."""
+        self.error(kind)
+        self.failed_sessions += 1
+        self.skipped_turns += turns
+
+    def skip(self, turns: int) -> None:
+        """Turns a user abandoned after the server failed its session."""
+        self.skipped_turns += turns
+
+    def summary(self, wall: float) -> Dict[str, Any]:
+        """
+        Outcome counts and latency distributions. `error_rate` is over every
+        scripted turn: failed turns plus turns that never ran because their
+        session could not be created or an earlier turn got a 5xx.
+        """
+        def distribution(values: List[float]) -> Dict[str, float]:
+            if not values:
+                return {}
+            return {
+                "count": len(values),
+                "p50_s": round(percentile(values, 50), 4),
+                "p90_s": round(percentile(values, 90), 4),
+                "p95_s": round(percentile(values, 95), 4),
+                "p99_s": round(percentile(values, 99), 4),
+                "max_s": round(max(values), 4),
+            }
+
+        failed_turns = self.turns - len(self.turn_latencies)
+        planned_turns = self.turns + self.skipped_turns
+        return {
+            "wall_s": round(wall, 2),
+            "users_started": self.users_started,
+            "users_completed": self.users_completed,
+            "failed_sessions": self.failed_sessions,
+            "turns": self.turns,
+            "failed_turns": failed_turns,
+            "skipped_turns": self.skipped_turns,
+            "error_rate": round((failed_turns + self.skipped_turns) / planned_turns, 4) if planned_turns else 0.0,
+            "errors": dict(self.errors),
+            "throughput_turns_per_s": round(len(self.turn_latencies) / wall, 3) if wall else 0.0,
+            "turn_latency": distribution(self.turn_latencies),
+            "turn_latency_by_index": {
+                str(index): distribution(values) for index, values in sorted(self.latencies_by_turn.items())
+            },
+            "session_create_latency": distribution(self.session_latencies),
+        }
+
+
+def agent_reply(events: Any) -> str:
+    """Text the root agent sent back in a /run response."""
+    if not isinstance(events, list):
+        return ""
+    return "".join(
+        part.get("text", "")
+        for event in events
+        if isinstance(event, dict) and event.get("author") == ROOT_AGENT_NAME
+        for part in (event.get("content") or {}).get("parts", [])
+        if "text" in part
+    )
+
+
+async def virtual_user(
+    client: httpx.AsyncClient,
+    persona: Dict[str, Any],
+    stats: LoadStats,
+    think_time: Tuple[float, float],
+    timeout: float,
+) -> None:
+    """Creates a session and plays every turn of `persona`, recording each outcome."""
+    user_id = f"loadgen-user-{uuid.uuid4().hex[:8]}"
+    session_id = f"s_{uuid.uuid4().hex[:12]}"
+    stats.users_started += 1
+
+    started = time.perf_counter()
+    try:
+        response = await client.post(
+            f"/apps/{APP_NAME}/users/{user_id}/sessions/{session_id}",
+            json={"state": {"testing": True, "scenario_name": persona["name"], "load_test": True}},
+            timeout=timeout,
+        )
+    except httpx.HTTPError as e:
+        stats.session_failed(f"session_{type(e).__name__}", len(persona["turns"]))
+        return
+    if response.status_code != 200:
+        stats.session_failed(f"session_http_{response.status_code}", len(persona["turns"]))
+        return
+    stats.session_latencies.append(time.perf_counter() - started)
+
+    for index, text in enumerate(persona["turns"]):
+        if index and think_time[1] > 0:
+            await asyncio.sleep(random.uniform(*think_time))
+        payload = {
+            "appName": APP_NAME,
+            "userId": user_id,
+            "sessionId": session_id,
+            "newMessage": {"role": "user", "parts": [{"text": text}]},
+        }
+        started = time.perf_counter()
+        error = None
+        try:
+            response = await client.post("/run", json=payload, timeout=timeout)
+            if response.status_code != 200:
+                error = f"http_{response.status_code}"
+            elif not agent_reply(response.json()).strip():
+                error = "empty_reply"
+        except httpx.TimeoutException:
+            error = "timeout"
+        except (httpx.HTTPError, ValueError) as e:
+            error = type(e).__name__
+        stats.turn(index, time.perf_counter() - started, error)
+        if error and error.startswith("http_5"):
+            # The server failed this session; later turns would only compound it
+            stats.skip(len(persona["turns"]) - index - 1)
+            return
+    stats.users_completed += 1
+
+
+async def run_load(args: argparse.Namespace, script: List[Dict[str, Any]]) -> Dict[str, Any]:
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    limits = httpx.Limits(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+    stats = LoadStats()
+    users: List[asyncio.Task] = []
+    rng = random.Random(args.seed)
+
+    async with httpx.AsyncClient(base_url=args.base_url, headers=headers, limits=limits) as client:
+        started = time.perf_counter()
+        for number in range(args.users):
+            persona = script[number % len(script)]
+            users.append(asyncio.create_task(
+                virtual_user(client, persona, stats, args.think_time, args.timeout)
+            ))
+            if args.rate > 0 and number < args.users - 1:
+                # Open-loop arrivals: exponential gaps, independent of how fast users finish
+                await asyncio.sleep(rng.expovariate(args.rate))
+        await asyncio.gather(*users)
+        wall = time.perf_counter() - started
+
+    return {
+        "meta": {
+            "base_url": args.base_url,
+            "users": args.users,
+            "arrival_rate_per_s": args.rate,
+            "think_time_s": list(args.think_time),
+            "personas": [persona["name"] for persona in script],
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": stats.summary(wall),
+    }
+
+
+def _think_time(value: str) -> Tuple[float, float]:
+    low, _, high = value.partition(",")
+    return float(low), float(high or low)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Concurrent multi-session load generator for the ADK API server.")
+    parser.add_argument("--base-url", default=os.getenv("WORKMATCH_BASE_URL", DEFAULT_BASE_URL))
+    parser.add_argument("--users", type=int, default=50, help="virtual users to start")
+    parser.add_argument("--rate", type=float, default=5.0, help="user arrivals per second (0 starts all at once)")
+    parser.add_argument("--think-time", type=_think_time, default=(0.0, 0.0),
+                        help="pause between a user's turns, seconds: 'N' or 'MIN,MAX'")
+    parser.add_argument("--timeout", type=float, default=120.0, help="per-request timeout, seconds")
+    parser.add_argument("--max-connections", type=int, default=1000)
+    parser.add_argument("--script", help="JSON file of personas: [{\"name\": ..., \"turns\": [...]}]")
+    parser.add_argument("--token", default=os.getenv("WORKMATCH_IDENTITY_TOKEN"),
+                        help="bearer token (defaults to $WORKMATCH_IDENTITY_TOKEN)")
+    parser.add_argument("--seed", type=int, default=None, help="seed for arrival and think-time randomness")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    if args.seed is not None:
+        random.seed(args.seed)
+    script = DEFAULT_SCRIPT
+    if args.script:
+        with open(args.script, encoding="utf-8") as f:
+            script = json.load(f)
+
+    report = asyncio.run(run_load(args, script))
+    print(json.dumps(report["results"], indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
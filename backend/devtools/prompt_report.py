@@ -0,0 +1,82 @@
+"""
+Prompt-token report for the Workmatch agent tree.
+
+Builds every registered agent and estimates the fixed prompt cost each one
+sends on every model call: its instruction (and how much of that is the
+shared fragment prefix from `workmatch.prompt`) plus its tool declarations.
+
+    cd backend
+    python -m devtools.prompt_report
+    python -m devtools.prompt_report --sort --output prompt_tokens.json
+"""
+import os
+import sys
+import json
+import asyncio
+import logging
+import argparse
+from typing import Any, Dict, List, Optional
+
+
+async def _tool_tokens(agent) -> int:
+    from workmatch.utils.token_budget import estimate_tokens
+
+    tokens = 0
+    for tool in await agent.canonical_tools():
+        declaration = tool._get_declaration()
+        if declaration is not None:  # built-in tools such as google_search declare nothing
+            tokens += estimate_tokens(declaration.model_dump(mode="json", exclude_none=True))
+    return tokens
+
+
+def measure() -> List[Dict[str, Any]]:
+    """Instruction, shared-prefix and tool-declaration tokens per registered agent, in tree order."""
+    from workmatch.prompt import prompts
+    from workmatch.registry import AGENT_TREE, get_agent
+    from workmatch.utils.token_budget import estimate_tokens
+
+    rows = []
+    for name in AGENT_TREE:
+        agent = get_agent(name)
+        instruction = agent.instruction if isinstance(agent.instruction, str) else ""
+        tools = asyncio.run(_tool_tokens(agent))
+        rows.append({
+            "agent": name,
+            "instruction_tokens": estimate_tokens(instruction),
+            "shared_prefix_tokens": estimate_tokens(prompts.shared_prefix(instruction)),
+            "tool_tokens": tools,
+            "total_tokens": estimate_tokens(instruction) + tools,
+        })
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Report the estimated prompt tokens each agent sends per call.")
+    parser.add_argument("--sort", action="store_true", help="list the most expensive agents first")
+    parser.add_argument("--output", help="write the rows as JSON to this file")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    # Building agents needs no model access; the fake model avoids loading secrets
+    os.environ.setdefault("WORKMATCH_FAKE_LLM", "true")
+
+    rows = measure()
+    if args.sort:
+        rows.sort(key=lambda row: -row["total_tokens"])
+    width = max(len(row["agent"]) for row in rows)
+    print(f"{'agent':<{width}}  {'instruction':>11}  {'shared':>6}  {'tools':>5}  {'total':>6}")
+    for row in rows:
+        print(f"{row['agent']:<{width}}  {row['instruction_tokens']:>11}  {row['shared_prefix_tokens']:>6}  "
+              f"{row['tool_tokens']:>5}  {row['total_tokens']:>6}")
+    print(f"{'all agents':<{width}}  {sum(row['instruction_tokens'] for row in rows):>11}  "
+          f"{sum(row['shared_prefix_tokens'] for row in rows):>6}  {sum(row['tool_tokens'] for row in rows):>5}  "
+          f"{sum(row['total_tokens'] for row in rows):>6}")
+    print("\nTokens are estimates (about four characters per token).")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"agents": rows}, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+Startup-time report for the Workmatch agent tree.
+
+Times importing the package, loading the environment and tracer, and
+building the root agent, then (with `--build-all`) every sub-agent, which
+shows what a cold start pays now and what lazy building defers.
+
+    cd backend
+    python -m devtools.startup_report
+    python -m devtools.startup_report --build-all --output startup.json
+"""
+import sys
+import json
+import time
+import logging
+import argparse
+from typing import List, Optional
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Report how long each agent import and build step takes.")
+    parser.add_argument("--build-all", action="store_true", help="also build every sub-agent (what an eager start costs)")
+    parser.add_argument("--output", help="write the steps as JSON to this file")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    started = time.perf_counter()
+    import workmatch
+    from workmatch.utils.startup import startup_timer
+    import_seconds = time.perf_counter() - started
+
+    # The framework itself, which every start pays whatever the agent tree does
+    with startup_timer.step("import google.adk"):
+        import google.adk.agents  # noqa: F401
+
+    with startup_timer.step("import workmatch.agent"):
+        agent_module = workmatch.agent
+    agent_module.root_agent
+    first_request_ready = time.perf_counter() - started
+    if args.build_all:
+        from workmatch.registry import build_all
+        build_all()
+
+    steps = [{"step": "import workmatch", "seconds": round(import_seconds, 4)}, *startup_timer.steps()]
+    print(f"import workmatch  {import_seconds * 1000:.1f} ms\n")
+    print(startup_timer.report())
+    print(f"\nroot agent ready after {first_request_ready * 1000:.1f} ms")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"steps": steps, "root_agent_ready_s": round(first_request_ready, 4)}, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
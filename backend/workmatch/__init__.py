@@ -1 +1,6 @@
-from . import agent
\ No newline at end of file
+def __getattr__(name):
+    # `workmatch.agent` is imported on first access, so importing the package stays cheap
+    if name == "agent":
+        import importlib
+        return importlib.import_module(".agent", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
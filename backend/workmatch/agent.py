@@ -1,27 +1,18 @@
 import logging
-from google.adk.agents import LlmAgent 
-from workmatch.utils.env import load_env, get_model
-from workmatch.utils.traced_tools import TracedAgentTool
-from workmatch.utils.tracing import langfuse_span, get_langfuse, init_tracer
+from typing import List
 
-from .sub_agents import (
-    entry_level_agent,
-    advanced_pathways_agent,
-    expanded_insights_agent, 
-    title_variants_agent,   
-)
+from google.adk.agents import LlmAgent
+from google.adk.tools import BaseTool
+from workmatch.registry import ROOT_AGENT, AgentSpec, builds, get_agent
+from workmatch.utils.env import get_model
+from workmatch.utils.tracing import langfuse_span
 
 from .tools.motivational_quotes_tool import get_motivational_quote
 
-from .prompt import CAREER_GUIDANCE_PROMPT 
+from .prompt import CAREER_GUIDANCE_PROMPT
 
-# Setup
+# Setup (environment and tracer are loaded by the registry before the first agent is built)
 logger = logging.getLogger(__name__)
-load_env()
-
-langfuse_sdk = get_langfuse()
-otel_tracer_instance = init_tracer(service_name="workmatch-coordinator-agent")
-MODEL = get_model()
 
 class TracedWorkmatchAgent(LlmAgent):
     def run(self, input_data, *args, **kwargs):
@@ -46,19 +37,23 @@ class TracedWorkmatchAgent(LlmAgent):
                 logger.error(f"[trace] Error in agent {self.name}: {e}")
                 raise
 
-# Instantiate the root Workmatch agent
-root_agent = TracedWorkmatchAgent(
-    name="workmatch_root_agent",
-    model=MODEL,
-    description="Workmatch: your smart, supportive career coach powered by real-time listings, sub-agent guidance, and structured exploration.",
-    instruction=CAREER_GUIDANCE_PROMPT,
-    tools=[
-        TracedAgentTool(agent=title_variants_agent),     
-        TracedAgentTool(agent=expanded_insights_agent), 
-        TracedAgentTool(agent=entry_level_agent),
-        TracedAgentTool(agent=advanced_pathways_agent),
-        get_motivational_quote     
-    ],
-)
-
-agent = root_agent
\ No newline at end of file
+# The root Workmatch agent; sub-agents arrive as lazy traced tools
+@builds(ROOT_AGENT)
+def _root_agent(spec: AgentSpec, tools: List[BaseTool]) -> TracedWorkmatchAgent:
+    return TracedWorkmatchAgent(
+        name=spec.name,
+        model=get_model(),
+        description=spec.description,
+        instruction=CAREER_GUIDANCE_PROMPT,
+        tools=[
+            *tools,
+            get_motivational_quote
+        ],
+    )
+
+
+def __getattr__(name):
+    # `root_agent` (and its `agent` alias) are built on first access
+    if name in ("root_agent", "agent"):
+        return get_agent(ROOT_AGENT)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
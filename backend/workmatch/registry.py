@@ -0,0 +1,200 @@
+"""
+Declarative description of the Workmatch agent tree.
+
+Every agent is an AgentSpec: the module that builds it, its description and
+the registered agents it calls as tools. Nothing is built at import time:
+`get_agent()` loads the environment and tracer once, imports the agent's
+module and builds it on first use. A coordinator's sub-agents are offered
+as LazyAgentTools, which only build their agent the first time they are
+called, so a cold start pays only for the agents a conversation touches.
+Each step is recorded in `startup_timer`.
+"""
+import sys
+import logging
+import importlib
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.tools import BaseTool
+
+from workmatch.utils.startup import startup_timer
+from workmatch.utils.traced_tools import TracedAgentTool
+
+logger = logging.getLogger(__name__)
+
+ROOT_AGENT = "workmatch_root_agent"
+
+
+@dataclass(frozen=True)
+class AgentSpec:
+    name: str
+    module: str
+    description: str
+    tools: Tuple[str, ...] = ()  # registered agents this one calls as traced tools
+
+
+AGENT_TREE: Dict[str, AgentSpec] = {spec.name: spec for spec in (
+    AgentSpec(
+        ROOT_AGENT, "workmatch.agent",
+        "Workmatch: your smart, supportive career coach powered by real-time listings, sub-agent guidance, and structured exploration.",
+        tools=("title_variants_agent", "expanded_insights_agent", "entry_level_agent", "advanced_pathways_agent"),
+    ),
+    AgentSpec(
+        "title_variants_agent", "workmatch.sub_agents.title_variants",
+        "Generates keyword-optimised and skill-based variants for job titles.",
+    ),
+    AgentSpec(
+        "expanded_insights_agent", "workmatch.sub_agents.expanded_insights",
+        "Expanded role insights tool — analyses job listings for a role and its variants.",
+        tools=("title_variants_agent",),
+    ),
+    AgentSpec(
+        "entry_level_agent", "workmatch.sub_agents.entry_level",
+        "Helps users explore beginner-friendly job roles, required skills, and job content while staying motivated.",
+        tools=("starter_titles_agent", "beginner_skills_agent", "job_overview_agent",
+               "entry_motivation_agent", "expanded_insights_agent"),
+    ),
+    AgentSpec(
+        "starter_titles_agent", "workmatch.sub_agents.entry_level",
+        "Recommends beginner-friendly job titles based on a user's interests or keywords.",
+    ),
+    AgentSpec(
+        "beginner_skills_agent", "workmatch.sub_agents.entry_level",
+        "Suggests technical and soft skills useful for entry-level roles.",
+    ),
+    AgentSpec(
+        "job_overview_agent", "workmatch.sub_agents.entry_level",
+        "Provides easy-to-understand explanations of job responsibilities for entry-level roles.",
+    ),
+    AgentSpec(
+        "entry_motivation_agent", "workmatch.sub_agents.entry_level",
+        "Offers encouragement and mindset advice for users starting their career journey.",
+    ),
+    AgentSpec(
+        "advanced_pathways_agent", "workmatch.sub_agents.advanced_pathways",
+        "Guides users in career advancement, promotions, and future planning.",
+        tools=("next_level_roles_agent", "skill_suggestions_agent", "leadership_agent", "lateral_pivot_agent",
+               "certification_agent", "expanded_insights_agent", "networking_agent"),
+    ),
+    AgentSpec(
+        "job_title_expansion_agent", "workmatch.sub_agents.advanced_pathways",
+        "Suggests related or alternative job titles based on user input (e.g. if no results found).",
+    ),
+    AgentSpec(
+        "next_level_roles_agent", "workmatch.sub_agents.advanced_pathways",
+        "Suggests career advancement titles based on the user's current role.",
+    ),
+    AgentSpec(
+        "skill_suggestions_agent", "workmatch.sub_agents.advanced_pathways",
+        "Provides technical and soft skills for excelling in a target job role.",
+    ),
+    AgentSpec(
+        "leadership_agent", "workmatch.sub_agents.advanced_pathways",
+        "Evaluates leadership readiness and outlines preparation steps for management or executive roles.",
+    ),
+    AgentSpec(
+        "lateral_pivot_agent", "workmatch.sub_agents.advanced_pathways",
+        "Advises on lateral career pivots to related domains with strong growth opportunities.",
+    ),
+    AgentSpec(
+        "certification_agent", "workmatch.sub_agents.advanced_pathways",
+        "Suggests certifications or credentials to support job promotions and upskilling.",
+    ),
+    AgentSpec(
+        "networking_agent", "workmatch.sub_agents.advanced_pathways",
+        "Provides targeted networking strategies, communities, and resources for advancing career goals.",
+    ),
+)}
+
+# Builder per agent name, registered by each agent module with @builds(name)
+AgentBuilder = Callable[[AgentSpec, List[BaseTool]], BaseAgent]
+_builders: Dict[str, AgentBuilder] = {}
+_agents: Dict[str, BaseAgent] = {}
+_lock = threading.RLock()
+_bootstrapped = False
+
+
+def builds(name: str) -> Callable[[AgentBuilder], AgentBuilder]:
+    """Registers the decorated function as the builder of agent `name`."""
+    def register(builder: AgentBuilder) -> AgentBuilder:
+        _builders[name] = builder
+        return builder
+    return register
+
+
+def bootstrap() -> None:
+    """Loads the environment (secrets) and starts the tracer, once, before the first agent is built."""
+    global _bootstrapped
+    with _lock:
+        if _bootstrapped:
+            return
+        from workmatch.utils.env import load_env
+        from workmatch.utils.tracing import init_tracer
+
+        with startup_timer.step("load_env"):
+            try:
+                load_env()
+            except Exception as e:
+                logger.warning(f"[registry] Could not load secrets: {e}")
+        with startup_timer.step("init_tracer"):
+            init_tracer(service_name="workmatch-coordinator-agent")
+        _bootstrapped = True
+
+
+class LazyAgentTool(TracedAgentTool):
+    """
+    TracedAgentTool for a registered agent that is only built when the tool
+    first runs; until then its declaration comes from the spec alone.
+    """
+
+    def __init__(self, spec: AgentSpec):
+        # A bare stand-in gives AgentTool the name, description and (absent)
+        # input schema it needs for the declaration
+        super().__init__(agent=LlmAgent(name=spec.name, description=spec.description))
+        self.spec = spec
+        self._built = False
+
+    def _ensure_built(self) -> None:
+        if not self._built:
+            self.agent = get_agent(self.spec.name)
+            self._built = True
+
+    async def run_async(self, *, args, tool_context):
+        self._ensure_built()
+        return await super().run_async(args=args, tool_context=tool_context)
+
+    async def __call__(self, tool_input):
+        self._ensure_built()
+        return await super().__call__(tool_input)
+
+
+def agent_tools(name: str) -> List[BaseTool]:
+    """Lazy traced tools for the sub-agents `name` calls, in spec order."""
+    return [LazyAgentTool(AGENT_TREE[tool]) for tool in AGENT_TREE[name].tools]
+
+
+def get_agent(name: str) -> BaseAgent:
+    """The registered agent `name`, built on first use."""
+    agent = _agents.get(name)
+    if agent is not None:
+        return agent
+    spec = AGENT_TREE[name]
+    bootstrap()
+    with _lock:
+        if name not in _agents:
+            if spec.module not in sys.modules:
+                with startup_timer.step(f"import {spec.module}"):
+                    importlib.import_module(spec.module)
+            else:
+                importlib.import_module(spec.module)
+            with startup_timer.step(f"build {name}"):
+                _agents[name] = _builders[name](spec, agent_tools(name))
+            logger.info(f"[registry] Built {name}")
+        return _agents[name]
+
+
+def build_all() -> Dict[str, BaseAgent]:
+    """Builds every registered agent now (e.g. to warm an instance before traffic)."""
+    return {name: get_agent(name) for name in AGENT_TREE}
@@ -1,4 +1,13 @@
-from .entry_level import entry_level_agent
-from .advanced_pathways import advanced_pathways_agent
-from .expanded_insights import expanded_insights_agent
-from .title_variants import title_variants_agent
\ No newline at end of file
+"""
+Sub-agent builders. Agents are built on first use by workmatch.registry;
+`from workmatch.sub_agents import entry_level_agent` still works and builds
+that agent (and only that agent) when first imported this way.
+"""
+
+
+def __getattr__(name):
+    from workmatch.registry import AGENT_TREE, get_agent
+
+    if name in AGENT_TREE and name != "workmatch_root_agent":
+        return get_agent(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
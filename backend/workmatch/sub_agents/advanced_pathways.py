@@ -1,8 +1,10 @@
+from typing import List
+
 from google.adk.agents import LlmAgent
-from google.adk.tools import google_search
+from google.adk.tools import BaseTool, google_search
+from workmatch.registry import AgentSpec, builds
 from workmatch.utils.env import get_model
-from workmatch.utils.traced_tools import TracedAgentTool
-from .expanded_insights import expanded_insights_agent
+from ..tools.career_plan_tool import make_career_plan_tool
 
 from ..prompt import (
     ADVANCED_PATHWAYS_PROMPT,
@@ -15,82 +17,112 @@ from ..prompt import (
     NETWORKING_PROMPT,
 )
 
+
 # Sub-agent to suggest related job titles for fallback or exploration
-job_title_expansion_agent = LlmAgent(
-    name="job_title_expansion_agent",
-    model=get_model(),
-    description="Suggests related or alternative job titles based on user input (e.g. if no results found).",
-    instruction=JOB_TITLE_EXPANSION_PROMPT,
-    tools=[google_search]
-)
+@builds("job_title_expansion_agent")
+def _job_title_expansion_agent(spec: AgentSpec, tools: List[BaseTool]) -> LlmAgent:
+    return LlmAgent(
+        name=spec.name,
+        model=get_model(),
+        description=spec.description,
+        instruction=JOB_TITLE_EXPANSION_PROMPT,
+        tools=[google_search]
+    )
+
 
 # Sub-agent to suggest next-level roles
-next_level_roles_agent = LlmAgent(
-    name="next_level_roles_agent",
-    model=get_model(),
-    description="Suggests career advancement titles based on the user's current role.",
-    instruction=NEXT_LEVEL_ROLES_PROMPT,
-    tools=[google_search]
-)
+@builds("next_level_roles_agent")
+def _next_level_roles_agent(spec: AgentSpec, tools: List[BaseTool]) -> LlmAgent:
+    return LlmAgent(
+        name=spec.name,
+        model=get_model(),
+        description=spec.description,
+        instruction=NEXT_LEVEL_ROLES_PROMPT,
+        tools=[google_search]
+    )
+
 
 # Sub-agent to suggest skill improvements for a target role
-skill_suggestions_agent = LlmAgent(
-    name="skill_suggestions_agent",
-    model=get_model(),
-    description="Provides technical and soft skills for excelling in a target job role.",
-    instruction=SKILL_SUGGESTIONS_PROMPT,
-    tools=[google_search]
-)
+@builds("skill_suggestions_agent")
+def _skill_suggestions_agent(spec: AgentSpec, tools: List[BaseTool]) -> LlmAgent:
+    return LlmAgent(
+        name=spec.name,
+        model=get_model(),
+        description=spec.description,
+        instruction=SKILL_SUGGESTIONS_PROMPT,
+        tools=[google_search]
+    )
+
 
 # Sub-agent to advise on leadership preparation
-leadership_agent = LlmAgent(
-    name="leadership_agent",
-    model=get_model(),
-    description="Evaluates leadership readiness and outlines preparation steps for management or executive roles.",
-    instruction=LEADERSHIP_PROMPT,
-    tools=[google_search]
-)
+@builds("leadership_agent")
+def _leadership_agent(spec: AgentSpec, tools: List[BaseTool]) -> LlmAgent:
+    return LlmAgent(
+        name=spec.name,
+        model=get_model(),
+        description=spec.description,
+        instruction=LEADERSHIP_PROMPT,
+        tools=[google_search]
+    )
+
 
 # Sub-agent to recommend lateral career pivot options
-lateral_pivot_agent = LlmAgent(
-    name="lateral_pivot_agent",
-    model=get_model(),
-    description="Advises on lateral career pivots to related domains with strong growth opportunities.",
-    instruction=LATERAL_PIVOT_PROMPT,
-    tools=[google_search]
-)
+@builds("lateral_pivot_agent")
+def _lateral_pivot_agent(spec: AgentSpec, tools: List[BaseTool]) -> LlmAgent:
+    return LlmAgent(
+        name=spec.name,
+        model=get_model(),
+        description=spec.description,
+        instruction=LATERAL_PIVOT_PROMPT,
+        tools=[google_search]
+    )
+
 
 # Sub-agent to recommend certifications for advancement
-certification_agent = LlmAgent(
-    name="certification_agent",
-    model=get_model(),
-    description="Suggests certifications or credentials to support job promotions and upskilling.",
-    instruction=CERTIFICATION_PROMPT,
-    tools=[google_search]
-)
+@builds("certification_agent")
+def _certification_agent(spec: AgentSpec, tools: List[BaseTool]) -> LlmAgent:
+    return LlmAgent(
+        name=spec.name,
+        model=get_model(),
+        description=spec.description,
+        instruction=CERTIFICATION_PROMPT,
+        tools=[google_search]
+    )
+
 
 # Sub-agent to provide a networking strategy (with GoogleSearch)
-networking_agent = LlmAgent(
-    name="networking_agent",
-    model=get_model(),
-    description="Provides targeted networking strategies, communities, and resources for advancing career goals.",
-    instruction=NETWORKING_PROMPT,
-    tools=[google_search]
-)
+@builds("networking_agent")
+def _networking_agent(spec: AgentSpec, tools: List[BaseTool]) -> LlmAgent:
+    return LlmAgent(
+        name=spec.name,
+        model=get_model(),
+        description=spec.description,
+        instruction=NETWORKING_PROMPT,
+        tools=[google_search]
+    )
 
-# Main advanced pathways agent with traced tools
-advanced_pathways_agent = LlmAgent(
-    name="advanced_pathways_agent",
-    model=get_model(),
-    description="Guides users in career advancement, promotions, and future planning.",
-    instruction=ADVANCED_PATHWAYS_PROMPT,
-    tools=[
-        TracedAgentTool(agent=next_level_roles_agent),
-        TracedAgentTool(agent=skill_suggestions_agent),
-        TracedAgentTool(agent=leadership_agent),
-        TracedAgentTool(agent=lateral_pivot_agent),
-        TracedAgentTool(agent=certification_agent),
-        TracedAgentTool(agent=expanded_insights_agent),
-        TracedAgentTool(agent=networking_agent),
-    ]
-)
+
+# Main advanced pathways agent; its sub-agents arrive as lazy traced tools
+@builds("advanced_pathways_agent")
+def _advanced_pathways_agent(spec: AgentSpec, tools: List[BaseTool]) -> LlmAgent:
+    by_agent = {tool.name: tool for tool in tools}
+    # Plan sections, each one of the sub-agent tools also offered to the model one by one
+    plan_section_tools = {
+        "next_level_roles": by_agent["next_level_roles_agent"],
+        "skills": by_agent["skill_suggestions_agent"],
+        "leadership": by_agent["leadership_agent"],
+        "lateral_pivot": by_agent["lateral_pivot_agent"],
+        "certifications": by_agent["certification_agent"],
+        "job_market": by_agent["expanded_insights_agent"],
+        "networking": by_agent["networking_agent"],
+    }
+    return LlmAgent(
+        name=spec.name,
+        model=get_model(),
+        description=spec.description,
+        instruction=ADVANCED_PATHWAYS_PROMPT,
+        tools=[
+            *tools,
+            make_career_plan_tool(plan_section_tools),
+        ]
+    )
@@ -1,8 +1,9 @@
+from typing import List
+
 from google.adk.agents import LlmAgent
-from google.adk.tools import google_search
+from google.adk.tools import BaseTool, google_search
+from workmatch.registry import AgentSpec, builds
 from workmatch.utils.env import get_model
-from workmatch.utils.traced_tools import TracedAgentTool  
-from .expanded_insights import expanded_insights_agent
 
 from ..prompt import (
     ENTRY_LEVEL_PROMPT,
@@ -12,53 +13,62 @@ from ..prompt import (
     ENTRY_MOTIVATION_PROMPT,
 )
 
+
 # Sub-agent to recommend beginner-friendly job titles
-starter_titles_agent = LlmAgent(
-    name="starter_titles_agent",
-    model=get_model(),
-    description="Recommends beginner-friendly job titles based on a user's interests or keywords.",
-    instruction=STARTER_TITLES_PROMPT,
-    tools=[google_search]  # Optional, adds real job reference
-)
+@builds("starter_titles_agent")
+def _starter_titles_agent(spec: AgentSpec, tools: List[BaseTool]) -> LlmAgent:
+    return LlmAgent(
+        name=spec.name,
+        model=get_model(),
+        description=spec.description,
+        instruction=STARTER_TITLES_PROMPT,
+        tools=[google_search]  # Optional, adds real job reference
+    )
+
 
 # Sub-agent to suggest beginner-appropriate skills
-beginner_skills_agent = LlmAgent(
-    name="beginner_skills_agent",
-    model=get_model(),
-    description="Suggests technical and soft skills useful for entry-level roles.",
-    instruction=BEGINNER_SKILLS_PROMPT,
-    tools=[google_search]  # ✅ For finding free learning resources
-)
+@builds("beginner_skills_agent")
+def _beginner_skills_agent(spec: AgentSpec, tools: List[BaseTool]) -> LlmAgent:
+    return LlmAgent(
+        name=spec.name,
+        model=get_model(),
+        description=spec.description,
+        instruction=BEGINNER_SKILLS_PROMPT,
+        tools=[google_search]  # ✅ For finding free learning resources
+    )
+
 
 # Sub-agent to explain job responsibilities
-job_overview_agent = LlmAgent(
-    name="job_overview_agent",
-    model=get_model(),
-    description="Provides easy-to-understand explanations of job responsibilities for entry-level roles.",
-    instruction=JOB_OVERVIEW_PROMPT,
-    tools=[]  # Optional: could add search later if desired
-)
+@builds("job_overview_agent")
+def _job_overview_agent(spec: AgentSpec, tools: List[BaseTool]) -> LlmAgent:
+    return LlmAgent(
+        name=spec.name,
+        model=get_model(),
+        description=spec.description,
+        instruction=JOB_OVERVIEW_PROMPT,
+        tools=[]  # Optional: could add search later if desired
+    )
+
 
 # Sub-agent to provide motivational support to early-career users
-entry_motivation_agent = LlmAgent(
-    name="entry_motivation_agent",
-    model=get_model(),
-    description="Offers encouragement and mindset advice for users starting their career journey.",
-    instruction=ENTRY_MOTIVATION_PROMPT,
-    tools=[]
-)
+@builds("entry_motivation_agent")
+def _entry_motivation_agent(spec: AgentSpec, tools: List[BaseTool]) -> LlmAgent:
+    return LlmAgent(
+        name=spec.name,
+        model=get_model(),
+        description=spec.description,
+        instruction=ENTRY_MOTIVATION_PROMPT,
+        tools=[]
+    )
 
-# Main entry-level agent with traced tools
-entry_level_agent = LlmAgent(
-    name="entry_level_agent",
-    model=get_model(),
-    description="Helps users explore beginner-friendly job roles, required skills, and job content while staying motivated.",
-    instruction=ENTRY_LEVEL_PROMPT,
-    tools=[
-        TracedAgentTool(agent=starter_titles_agent),
-        TracedAgentTool(agent=beginner_skills_agent),
-        TracedAgentTool(agent=job_overview_agent),
-        TracedAgentTool(agent=entry_motivation_agent),
-        TracedAgentTool(agent=expanded_insights_agent),
-    ]
-)
+
+# Main entry-level agent; its sub-agents arrive as lazy traced tools
+@builds("entry_level_agent")
+def _entry_level_agent(spec: AgentSpec, tools: List[BaseTool]) -> LlmAgent:
+    return LlmAgent(
+        name=spec.name,
+        model=get_model(),
+        description=spec.description,
+        instruction=ENTRY_LEVEL_PROMPT,
+        tools=tools,
+    )
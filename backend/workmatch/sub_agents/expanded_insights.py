@@ -1,12 +1,19 @@
-from google.adk.agents import LlmAgent
-from workmatch.utils.env import get_model
-from ..tools.career_tools import summarise_expanded_job_roles_tool
-from ..prompt import EXPANDED_ROLE_INSIGHTS_PROMPT_WITH_LISTINGS
-
-expanded_insights_agent = LlmAgent(
-    name="expanded_insights_agent",
-    model=get_model(),
-    description="Expanded role insights tool — analyses job listings for a role and its variants.",
-    instruction=EXPANDED_ROLE_INSIGHTS_PROMPT_WITH_LISTINGS,
-    tools=[summarise_expanded_job_roles_tool]
-)
+from typing import List
+
+from google.adk.agents import LlmAgent
+from google.adk.tools import BaseTool
+from workmatch.registry import AgentSpec, builds
+from workmatch.utils.env import get_model
+from ..tools.career_tools import summarise_expanded_job_roles_tool
+from ..prompt import EXPANDED_ROLE_INSIGHTS_PROMPT_WITH_LISTINGS
+
+
+@builds("expanded_insights_agent")
+def _expanded_insights_agent(spec: AgentSpec, tools: List[BaseTool]) -> LlmAgent:
+    return LlmAgent(
+        name=spec.name,
+        model=get_model(),
+        description=spec.description,
+        instruction=EXPANDED_ROLE_INSIGHTS_PROMPT_WITH_LISTINGS,
+        tools=[summarise_expanded_job_roles_tool, *tools],
+    )
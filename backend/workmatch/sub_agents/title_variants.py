@@ -1,11 +1,77 @@
+import asyncio
+import logging
+from typing import List, Optional
+
 from google.adk.agents import LlmAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.tools import BaseTool
+from google.genai import types
+
+from workmatch.registry import AgentSpec, builds
 from workmatch.utils.env import get_model
+from workmatch.utils.title_index import learn_variants
+from workmatch.utils.title_variant_cache import format_variants, get_title_variant_cache, parse_variants, requested_title
 from ..prompt import TITLE_VARIANTS_PROMPT
 
-title_variants_agent = LlmAgent(
-    name="title_variants_agent",
-    model=get_model(),
-    description="Generates keyword-optimised and skill-based variants for job titles.",
-    instruction=TITLE_VARIANTS_PROMPT,
-    tools=[],
-)
\ No newline at end of file
+logger = logging.getLogger(__name__)
+
+
+def _requested_title(callback_context: CallbackContext) -> str:
+    """The title in the agent's request, so phrasings of the same request share a cache entry."""
+    content = callback_context.user_content
+    return requested_title(" ".join(part.text for part in (content.parts or []) if part.text)) if content else ""
+
+
+def _use_cached_variants(callback_context: CallbackContext) -> Optional[types.Content]:
+    """Answers from the title-variant cache, skipping the model call on a hit."""
+    cache = get_title_variant_cache()
+    title = _requested_title(callback_context)
+    if cache is None or not title:
+        return None
+    variants = cache.get(title)
+    if variants is None:
+        return None
+    logger.info(f"[title_variants] Cache hit for '{title}' ({len(variants)} variants)")
+    return types.Content(role="model", parts=[types.Part.from_text(text=format_variants(variants))])
+
+
+def _store_variants(cache, title: str, variants: List[str]) -> None:
+    cache.put(title, variants)
+    learn_variants(title, variants)
+
+
+async def _remember_variants(callback_context: CallbackContext) -> Optional[types.Content]:
+    """
+    Caches the variants the model just produced and teaches them to the title
+    index, off the event loop (clarifying questions are not kept).
+    """
+    cache = get_title_variant_cache()
+    title = _requested_title(callback_context)
+    if cache is None or not title:
+        return None
+    reply = next(
+        (
+            event for event in reversed(callback_context.session.events)
+            if event.author == callback_context.agent_name and event.content and event.content.parts
+        ),
+        None,
+    )
+    if reply is None or reply.invocation_id != callback_context.invocation_id:
+        return None
+    variants = parse_variants("".join(part.text or "" for part in reply.content.parts))
+    if variants:
+        await asyncio.to_thread(_store_variants, cache, title, variants)
+    return None
+
+
+@builds("title_variants_agent")
+def _title_variants_agent(spec: AgentSpec, tools: List[BaseTool]) -> LlmAgent:
+    return LlmAgent(
+        name=spec.name,
+        model=get_model(),
+        description=spec.description,
+        instruction=TITLE_VARIANTS_PROMPT,
+        tools=[],
+        before_agent_callback=_use_cached_variants,
+        after_agent_callback=_remember_variants,
+    )
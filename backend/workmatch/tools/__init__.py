@@ -1,7 +1,12 @@
-from .career_tools import (
-    summarise_expanded_job_roles_tool
-)
+# Tools are imported on first access, so agents only load the tools they use
+_EXPORTS = {
+    "summarise_expanded_job_roles_tool": ".career_tools",
+    "get_motivational_quote": ".motivational_quotes_tool",
+}
 
-from .motivational_quotes_tool import (
-    get_motivational_quote
-)
\ No newline at end of file
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        import importlib
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
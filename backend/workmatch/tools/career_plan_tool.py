@@ -0,0 +1,98 @@
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from google.adk.tools import ToolContext
+from google.adk.tools.agent_tool import AgentTool
+
+from workmatch.utils.env import get_env_float
+from workmatch.utils.tracing import langfuse_span
+
+logger = logging.getLogger(__name__)
+
+# Sections of a full plan when the caller doesn't choose
+DEFAULT_PLAN_SECTIONS = ("next_level_roles", "skills", "leadership", "certifications", "networking")
+# Seconds each section may take before the plan is returned without it (WORKMATCH_PLAN_SECTION_TIMEOUT)
+DEFAULT_SECTION_TIMEOUT = 60.0
+
+
+def plan_request(current_role: str, goal: Optional[str], location: Optional[str]) -> str:
+    """The one request every section agent receives."""
+    parts = [f"Current role: {current_role}."]
+    if goal:
+        parts.append(f"Goal: {goal}.")
+    if location:
+        parts.append(f"Location: {location}.")
+    return " ".join(parts)
+
+
+def make_career_plan_tool(
+    section_tools: Dict[str, AgentTool],
+) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """
+    Builds `build_career_plan_tool` over `section_tools` (section name ->
+    sub-agent tool), so the plan can reuse the tools its coordinator already
+    holds.
+    """
+
+    async def build_career_plan_tool(
+        current_role: str,
+        goal: Optional[str] = None,
+        location: Optional[str] = None,
+        sections: Optional[List[str]] = None,
+        tool_context: Optional[ToolContext] = None,
+    ) -> Dict[str, Any]:
+        """
+        Builds several sections of a career plan at once: the chosen section
+        agents run concurrently, so the plan takes about as long as the
+        slowest of them. Each section has a time limit; a section that runs
+        out of time or fails is listed under `timed_out` / `failed` and left
+        out of `sections`, which holds each finished section's text in the
+        order requested.
+
+        Sections: next_level_roles, skills, leadership, lateral_pivot,
+        certifications, job_market, networking. Defaults to next_level_roles,
+        skills, leadership, certifications and networking.
+        """
+        chosen = list(dict.fromkeys(sections or DEFAULT_PLAN_SECTIONS))
+        unknown = [name for name in chosen if name not in section_tools]
+        chosen = [name for name in chosen if name in section_tools]
+        timeout = get_env_float("WORKMATCH_PLAN_SECTION_TIMEOUT", DEFAULT_SECTION_TIMEOUT)
+        request = plan_request(current_role, goal, location)
+        durations: Dict[str, float] = {}
+
+        async def run_section(name: str) -> Any:
+            started = time.perf_counter()
+            try:
+                return await asyncio.wait_for(
+                    section_tools[name].run_async(args={"request": request}, tool_context=tool_context),
+                    timeout=timeout,
+                )
+            finally:
+                durations[name] = round(time.perf_counter() - started, 2)
+
+        logger.info(f"[CareerPlan] Running {len(chosen)} sections concurrently: {chosen}")
+        started = time.perf_counter()
+        with langfuse_span("tool_call.build_career_plan_tool", input_data={"request": request, "sections": chosen}):
+            outcomes = await asyncio.gather(*(run_section(name) for name in chosen), return_exceptions=True)
+
+        result: Dict[str, Any] = {"sections": {}, "timed_out": [], "failed": {}}
+        for name, outcome in zip(chosen, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                logger.warning(f"[CareerPlan] Section '{name}' timed out after {timeout}s")
+                result["timed_out"].append(name)
+            elif isinstance(outcome, BaseException):
+                logger.error(f"[CareerPlan] Section '{name}' failed: {outcome}")
+                result["failed"][name] = str(outcome)
+            else:
+                result["sections"][name] = outcome
+        if unknown:
+            result["unknown_sections"] = unknown
+        result["section_seconds"] = durations
+        result["elapsed_seconds"] = round(time.perf_counter() - started, 2)
+        logger.info(f"[CareerPlan] Plan ready in {result['elapsed_seconds']}s "
+                    f"({len(result['sections'])} sections, {len(result['timed_out'])} timed out)")
+        return result
+
+    return build_career_plan_tool
@@ -1,13 +1,135 @@
+import os
+import uuid
 import logging
 import asyncio
 import random
 from itertools import chain
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
 
-from workmatch.utils.adzuna import get_adzuna_api, JobListing
+from google.adk.tools import ToolContext
+
+from workmatch.utils.adzuna import bulk_max_results, get_async_adzuna_api, JobListing
+from workmatch.utils.dedup import ListingDeduplicator, dedupe_listings_by_title
+from workmatch.utils.env import get_env_bool, get_env_int
+from workmatch.utils.listing_table import pack_listings
+from workmatch.utils.market_stats import market_stats
+from workmatch.utils.pagination import decode_cursor, encode_cursor, normalise_title, seeded_rng
+from workmatch.utils.prefetch import get_prefetcher
+from workmatch.utils.title_index import expand_title, get_title_index
+from workmatch.utils.token_budget import fit_to_budget
 
 logger = logging.getLogger(__name__)
 
+# Session state key holding the seed for this session's listing order
+ORDER_SEED_STATE_KEY = "listing_order_seed"
+
+# Session state key holding, per paged search and page, the keys of listings shown
+SEEN_LISTINGS_STATE_KEY = "seen_listings"
+# Paged searches remembered per session, and listing keys kept per search
+MAX_SEEN_SEARCHES = 5
+MAX_SEEN_KEYS = 2000
+
+
+def _cursor_slot(title: str, country_code: str) -> str:
+    """Cursor entry for one title searched in one country."""
+    return f"{country_code}:{normalise_title(title)}"
+
+
+def _seen_listings(tool_context: Optional[ToolContext], search_id: str, page: int) -> List[str]:
+    """Listing keys shown on the pages before `page` of the search `search_id`."""
+    if tool_context is None:
+        return []
+    pages = (tool_context.state.get(SEEN_LISTINGS_STATE_KEY) or {}).get(search_id) or {}
+    return [key for number, keys in pages.items() if int(number) < page for key in keys]
+
+
+def _remember_seen(tool_context: Optional[ToolContext], search_id: str, page: int, keys: List[str]) -> None:
+    """
+    Stores the keys of listings shown on `page` of the search, so later pages
+    skip them while the same page asked for again comes back unchanged. Pages
+    after `page` were built on an older copy of it and are dropped. Searches
+    are kept newest last and the oldest make way; within a search the
+    earliest pages go first once it holds more than MAX_SEEN_KEYS keys.
+    """
+    if tool_context is None:
+        return
+    seen = dict(tool_context.state.get(SEEN_LISTINGS_STATE_KEY) or {})
+    pages = {number: shown for number, shown in (seen.pop(search_id, None) or {}).items() if int(number) < page}
+    pages[str(page)] = keys[-MAX_SEEN_KEYS:]
+    while sum(len(shown) for shown in pages.values()) > MAX_SEEN_KEYS:
+        pages.pop(min(pages, key=int))
+    seen[search_id] = pages
+    while len(seen) > MAX_SEEN_SEARCHES:
+        seen.pop(next(iter(seen)))
+    tool_context.state[SEEN_LISTINGS_STATE_KEY] = seen
+
+
+def _observe_titles(searches: List[Tuple[str, str]], all_results: List[List[Dict[str, Any]]]) -> None:
+    """Teaches the title index each searched title's listing titles (builds the index on first use)."""
+    title_index = get_title_index()
+    if title_index is not None:
+        for (title, _), results in zip(searches, all_results):
+            title_index.observe(title, (listing["title"] for listing in results))
+
+
+def _listing_rng(tool_context: Optional[ToolContext], *query_parts: Any) -> random.Random:
+    """
+    Random source for listing order. By default it is seeded from a per-session
+    seed (kept in session state) plus the query, so repeating a request in the
+    same session shows the same jobs in the same order.
+    WORKMATCH_LISTING_ORDER=random restores unseeded shuffling.
+    """
+    if os.getenv("WORKMATCH_LISTING_ORDER", "seeded").lower() == "random":
+        return random.Random()
+    seed = ""
+    if tool_context is not None:
+        seed = tool_context.state.get(ORDER_SEED_STATE_KEY)
+        if not seed:
+            seed = uuid.uuid4().hex
+            tool_context.state[ORDER_SEED_STATE_KEY] = seed
+    return seeded_rng(seed, query_parts)
+
+
+def _title_search(
+    job_title: str,
+    country_code: str,
+    location: Optional[str],
+    salary_min: Optional[int],
+    employment_type: Optional[str],
+    results_offset: Optional[int],
+    freshness_days: Optional[int],
+    employer: Optional[str],
+    page: Optional[int] = None,
+) -> Dict[str, Any]:
+    """AdzunaAPI.search_jobs arguments for one title and page."""
+    # Determine results_limit and override freshness if filtering by employer
+    if employer:
+        freshness_days = None
+        results_limit = 10
+    else:
+        results_limit = 5
+
+    # An explicit page wins; otherwise derive it from results_offset (legacy) or default to 1
+    if page is None:
+        if results_offset is not None:
+            page = (results_offset // results_limit) + 1
+        else:
+            page = 1
+
+    return {
+        "what": job_title,
+        "country": country_code,
+        "page": page,
+        "results_limit": results_limit,
+        "location": location,
+        "salary_min": salary_min,
+        "employment_type": employment_type,
+        "freshness_days": freshness_days,
+        "employer": employer,
+    }
+
+
 async def get_job_listings_for_title(
     job_title: str,
     country_code: str,
@@ -17,53 +139,50 @@ async def get_job_listings_for_title(
     results_offset: Optional[int] = None,    # backwards-compatible offset
     freshness_days: Optional[int] = 3,       # Default freshness to 3 days
     employer: Optional[str] = None,
-) -> List[JobListing]:
+    page: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+    bulk_count: Optional[int] = None,
+) -> Dict[str, Any]:
     """
     Optimized function to fetch a small, clean list of jobs for a single title.
     Supports both 'results_offset' (legacy) and 'page' (new).
+    With `bulk_count`, fetches up to that many jobs over several pages in parallel.
+    Returns the search response: `results`, plus `error` (and `rate_limited`)
+    when the search failed, so a failure is not mistaken for a short page.
     """
     try:
-        adzuna_api = get_adzuna_api()
-
-        # Determine results_limit and override freshness if filtering by employer
-        if employer:
-            freshness_days = None
-            results_limit = 10
-        else:
-            results_limit = 5
+        search = _title_search(
+            job_title, country_code, location, salary_min,
+            employment_type, results_offset, freshness_days, employer, page,
+        )
 
-        # Calculate page number from results_offset (legacy) or default to 1
-        if results_offset is not None:
-            page = (results_offset // results_limit) + 1
+        # A "next page" request may already have been fetched in the background
+        prefetcher = get_prefetcher()
+        listings = prefetcher.take(search) if prefetcher is not None and not bulk_count else None
+        if listings is not None:
+            response = {"results": listings}
+        elif bulk_count:
+            search.pop("results_limit")
+            adzuna_api = get_async_adzuna_api()
+            response = await adzuna_api.search_jobs_bulk(target_count=bulk_count, **search)
         else:
-            page = 1
-
-        response = adzuna_api.search_jobs(
-            what=job_title,
-            country=country_code,
-            page=page,
-            results_limit=results_limit,
-            location=location,
-            salary_min=salary_min,
-            employment_type=employment_type,
-            freshness_days=freshness_days,
-            employer=employer,
-        )
+            adzuna_api = get_async_adzuna_api()
+            response = await adzuna_api.search_jobs(**search)
         listings = response.get("results", [])
 
         # Smart randomization: shuffle per-title if no specific employer
         if listings and not employer:
-            random.shuffle(listings)
+            (rng or random).shuffle(listings)
 
-        return listings
+        return {"results": listings, **{field: response[field] for field in ("error", "rate_limited") if field in response}}
 
     except Exception as e:
         logger.error(f"[Search] Error searching for '{job_title}': {e}", exc_info=True)
-        return []
+        return {"results": [], "error": str(e)}
 
 async def summarise_expanded_job_roles_tool(
     job_title: str,
-    expanded_titles: List[str],
+    expanded_titles: Optional[List[str]] = None,  # empty: expand from the offline title index
     country_code: str = "gb",
     location: Optional[str] = None,
     salary_min: Optional[int] = None,
@@ -71,71 +190,206 @@ async def summarise_expanded_job_roles_tool(
     results_offset: Optional[int] = None,    # backwards-compatible offset
     freshness_days: Optional[int] = 3,       # Default to 3-day freshness
     employer: Optional[str] = None,
+    cursor: Optional[str] = None,            # `next_cursor` from the previous page
+    results_per_title: Optional[int] = None, # bulk mode, e.g. 50-100 for reports
+    country_codes: Optional[List[str]] = None,  # several countries at once, e.g. ["gb", "de"]
+    token_budget: Optional[int] = None,      # cap on the response size, in estimated tokens
+    expand: bool = True,                     # False: search exactly the titles given
+    tool_context: Optional[ToolContext] = None,
 ) -> Dict[str, Any]:
     """
     A high-speed tool that fetches and synthesizes job data for
     multiple related titles. Backwards-compatible via results_offset,
-    uses path-based paging and smart randomization.
+    uses path-based paging and seeded randomization.
+
+    For the next page pass the previous result's `next_cursor` as `cursor`:
+    it tracks the next page of every title and skips titles that have run
+    out, so each page brings new jobs; listings already shown on an earlier
+    page (kept in session state) are dropped. `next_cursor` is None once
+    every title is exhausted.
+
+    Set `results_per_title` (up to 100) when many listings are needed at once:
+    each title's pages are then fetched in parallel and merged into one list,
+    and the whole result comes back in this single call. Larger values are
+    capped at ADZUNA_BULK_MAX_RESULTS. A title whose search failed keeps its
+    page in `next_cursor`, so the next call tries it again.
+
+    `country_codes` searches every title in each listed country concurrently
+    and merges the results; listings then carry a `country` and
+    `country_counts` gives the listings found per country.
+
+    `market_stats` summarises every listing fetched (not just the sample):
+    per-title salary min / median / p90, employment-type mix, top locations
+    and employers, and predicted-vs-listed salary counts and ratio.
+
+    With no `expanded_titles`, variants come from the offline title index
+    and `title_expansion` reports them (`source` "index"), or `source` is
+    "none" when the index does not know the title. `expand=False` searches
+    just `job_title` and `expanded_titles`, as given.
+
+    `token_budget` (default WORKMATCH_TOOL_TOKEN_BUDGET, 0 for none) caps the
+    response's estimated size: lower-ranked listings go first, then the
+    per-title detail, while the summary counts always stay. A trimmed
+    response says what was cut under `trimmed`.
+
+    Searches that failed are listed under `errors` (by title); `rate_limited`
+    is True when any were refused for quota, so the user can try again shortly.
     """
-    country_code = country_code.lower()
+    # No variants given: expand offline; an unknown title is searched on its own
+    title_expansion = None
+    expanded_titles = list(expanded_titles or [])
+    if expand and not expanded_titles:
+        expanded_titles = await asyncio.to_thread(expand_title, job_title)
+        title_expansion = {"source": "index" if expanded_titles else "none", "titles": expanded_titles}
+
+    countries = list(dict.fromkeys(c.lower() for c in (country_codes or [country_code])))
     all_titles = [job_title] + expanded_titles
+    # One search per title and country
+    all_searches = [(title, country) for title in all_titles for country in countries]
 
     if employer:
         per_title_limit = 10
     else:
         per_title_limit = 5
 
-    if results_offset is not None:
-        page = (results_offset // per_title_limit) + 1
+    # Bulk mode: several Adzuna pages per title in one call; a page of the cursor
+    # then covers `results_per_title` jobs (at most the bulk cap), so pass the same value with it
+    bulk_count = None
+    if results_per_title and results_per_title > per_title_limit:
+        bulk_count = per_title_limit = max(per_title_limit, min(results_per_title, bulk_max_results()))
+
+    # Adzuna page per search: from the cursor, else the same page for every search
+    cursor_state = decode_cursor(cursor)
+    # Every page of one search shares an id, so listings shown earlier are not repeated
+    search_id = (cursor_state or {}).get("q") or uuid.uuid4().hex[:12]
+    if cursor_state is not None:
+        page = cursor_state["n"] + 1
+        search_pages = {(t, c): cursor_state["p"].get(_cursor_slot(t, c), 1) for t, c in all_searches}
     else:
-        page = 1
+        if results_offset is not None:
+            page = (results_offset // per_title_limit) + 1
+        else:
+            page = 1
+        search_pages = {search: page for search in all_searches}
 
-    logger.info(f"[Tool] Searching {len(all_titles)} titles "
+    logger.info(f"[Tool] Searching {len(all_titles)} titles in {len(countries)} countries "
                 f"(page={page}, freshness_days={freshness_days})")
 
-    async def fetch(title: str):
+    rng = _listing_rng(
+        tool_context, normalise_title(job_title), sorted(normalise_title(t) for t in all_titles),
+        countries, location, salary_min, employment_type, freshness_days, employer, page,
+    )
+
+    # Optionally randomize the order of titles searched for extra variety;
+    # searches with no pages left are skipped
+    searches = [search for search in all_searches if search_pages[search]]
+    if not employer:
+        rng.shuffle(searches)
+    # One generator per search, drawn up front, so the order does not depend on which search finishes first
+    search_rngs = [random.Random(rng.getrandbits(64)) for _ in searches]
+
+    async def fetch(title: str, country: str, title_rng: random.Random):
         return await get_job_listings_for_title(
             job_title=title,
-            country_code=country_code,
+            country_code=country,
             location=location,
             salary_min=salary_min,
             employment_type=employment_type,
             results_offset=results_offset,
             freshness_days=freshness_days,
             employer=employer,
+            page=search_pages[(title, country)],
+            rng=title_rng,
+            bulk_count=bulk_count,
         )
 
-    # Optionally randomize the order of titles searched for extra variety
-    titles_to_search = list(all_titles)
-    if not employer:
-        random.shuffle(titles_to_search)
+    # Fetch concurrently: every title in every country, under the client's one concurrency limit
+    responses = await asyncio.gather(*(fetch(t, c, r) for (t, c), r in zip(searches, search_rngs)))
+    all_results = [response["results"] for response in responses]
+    search_errors = {
+        title if len(countries) == 1 else f"{title} ({country})": response["error"]
+        for (title, country), response in zip(searches, responses)
+        if "error" in response
+    }
+    rate_limited = any(response.get("rate_limited") for response in responses)
+    if len(countries) > 1:
+        for (_, country), results in zip(searches, all_results):
+            for listing in results:
+                listing["country"] = country
 
-    # Fetch concurrently
-    all_results = await asyncio.gather(*(fetch(t) for t in titles_to_search))
+    # Every search teaches the title index which listing titles go with it
+    await asyncio.to_thread(_observe_titles, searches, all_results)
 
-    # Build mapping and combine
-    listings_by_title = {
-        title: results
-        for title, results in zip(titles_to_search, all_results)
-        if results
-    }
+    # A short page means the search has no more results; a failed one is tried again next time
+    next_pages = {_cursor_slot(t, c): 0 for t, c in all_searches}
+    for (title, country), response in zip(searches, responses):
+        if "error" in response:
+            next_pages[_cursor_slot(title, country)] = search_pages[(title, country)]
+        elif len(response["results"]) >= per_title_limit:
+            next_pages[_cursor_slot(title, country)] = search_pages[(title, country)] + 1
+    next_cursor = encode_cursor(next_pages, page, search_id) if any(next_pages.values()) else None
+
+    # Opt-in: fetch the next page in the background for titles that filled this one
+    prefetcher = get_prefetcher()
+    if prefetcher is not None and not bulk_count:
+        prefetcher.schedule(
+            _title_search(
+                title, country, location, salary_min,
+                employment_type, None, freshness_days, employer, search_pages[(title, country)] + 1,
+            )
+            for (title, country), results in zip(searches, all_results)
+            if len(results) >= per_title_limit
+        )
+
+    # Build mapping (each title's countries together), drop the same posting
+    # returned under several titles or shown on an earlier page, and combine
+    results_by_title: Dict[str, List[JobListing]] = {}
+    for (title, _), results in zip(searches, all_results):
+        results_by_title.setdefault(title, []).extend(results)
+    earlier_pages = _seen_listings(tool_context, search_id, page)
+    dedup = ListingDeduplicator(seen=earlier_pages)
+    listings_by_title, duplicates_removed = dedupe_listings_by_title(results_by_title, dedup)
+    _remember_seen(tool_context, search_id, page, dedup.seen_keys()[len(earlier_pages):])
     combined = list(chain.from_iterable(listings_by_title.values()))
 
     # Final shuffle of combined list if no employer filter
     if not employer:
-        random.shuffle(combined)
+        rng.shuffle(combined)
 
     # Take first 10 as sample
     sample = combined[:10]
+    country_counts = Counter(listing.get("country", countries[0]) for listing in combined)
 
     logger.info(f"[Tool] Found {len(combined)} listings "
-                f"across {len(listings_by_title)} titles.")
+                f"across {len(listings_by_title)} titles "
+                f"({duplicates_removed} duplicates removed).")
 
-    return {
-        "job_title": job_title,
-        "listings_by_title": listings_by_title,
-        "all_listings": sample,
-        "total_titles_found": len(listings_by_title),
-        "total_listings_found": len(combined),
-        "page": page,
-    }
+    stats = market_stats(listings_by_title, countries)
+    tabular = get_env_bool("WORKMATCH_TABULAR_LISTINGS", default=True)
+
+    def build(shown_by_title: Dict[str, List[JobListing]], shown_sample: List[JobListing]) -> Dict[str, Any]:
+        # Table form sends each listing once instead of repeating keys and sample items
+        if tabular:
+            listings_payload = pack_listings(shown_by_title, shown_sample)
+        else:
+            listings_payload = {"listings_by_title": shown_by_title, "all_listings": shown_sample}
+        return {
+            "job_title": job_title,
+            **listings_payload,
+            "total_titles_found": len(listings_by_title),
+            "total_listings_found": len(combined),
+            "duplicates_removed": duplicates_removed,
+            "country_counts": {country: country_counts[country] for country in countries},
+            "market_stats": stats,
+            **({"title_expansion": title_expansion} if title_expansion else {}),
+            **({"errors": search_errors} if search_errors else {}),
+            **({"rate_limited": True} if rate_limited else {}),
+            "page": page,
+            "next_cursor": next_cursor,
+        }
+
+    if token_budget is None:
+        token_budget = get_env_int("WORKMATCH_TOOL_TOKEN_BUDGET", 0)
+    if token_budget and token_budget > 0:
+        return fit_to_budget(build, listings_by_title, sample, token_budget)
+    return build(listings_by_title, sample)
@@ -1,6 +1,28 @@
 import os
-import requests
-from typing import Optional, List, Dict, Any, TypedDict
+import math
+import time
+import asyncio
+import logging
+import sqlite3
+import threading
+import httpx
+from typing import Optional, List, Dict, Any, Tuple, TypedDict, NamedTuple, Sequence, Union
+
+from workmatch.utils.env import get_env_int, get_env_float, load_env
+from workmatch.utils.cache import TTLCache, MISS, STALE
+from workmatch.utils.singleflight import AsyncSingleFlight
+from workmatch.utils.resilience import RetryPolicy, CircuitBreaker
+from workmatch.utils.listing_store import ListingStore
+from workmatch.utils.adzuna_decode import decode_search_response, json_backend, SNIPPET_WORDS
+from workmatch.utils.rate_limit import (
+    QuotaLimiter,
+    RateLimitExceeded,
+    AIMDController,
+    AsyncConcurrencyLimiter,
+)
+from workmatch.utils.tracing import annotate_current_span
+
+logger = logging.getLogger(__name__)
 
 
 class JobListing(TypedDict):
@@ -12,40 +34,404 @@ class JobListing(TypedDict):
     salary: str
     description_snippet: str
     url: str
+    # Numeric salary (annual, local currency) for market statistics
+    salary_min: Optional[float]
+    salary_max: Optional[float]
+    salary_is_predicted: bool
+
+
+class CompactListing(NamedTuple):
+    """
+    Tuple-backed form of a JobListing (`__slots__ = ()`, so no per-item dict
+    or repeated key strings), used for cached results. Convert back with
+    `to_listing()`.
+    """
+    id: str
+    title: str
+    company: str
+    location: str
+    employment_type: str
+    salary: str
+    description_snippet: str
+    url: str
+    salary_min: Optional[float] = None
+    salary_max: Optional[float] = None
+    salary_is_predicted: bool = False
+
+    @classmethod
+    def from_listing(cls, listing: JobListing) -> "CompactListing":
+        return cls(*(listing.get(field, cls._field_defaults.get(field, "")) for field in cls._fields))
+
+    def to_listing(self) -> JobListing:
+        return dict(zip(self._fields, self))
 
 
+# Override with ADZUNA_BASE_URL, e.g. to point at devtools/adzuna_standin.py
 ADZUNA_BASE_URL = "https://api.adzuna.com/v1/api/jobs"
 
+# Connection pool defaults (overridable via ADZUNA_POOL_SIZE / ADZUNA_TIMEOUT)
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 5.0
+# Max Adzuna requests in flight per client (ADZUNA_MAX_CONCURRENCY)
+DEFAULT_MAX_CONCURRENCY = 10
+# Response cache defaults (ADZUNA_CACHE_TTL / ADZUNA_CACHE_STALE_TTL / ADZUNA_CACHE_MAX_ENTRIES)
+DEFAULT_CACHE_TTL = 300.0
+DEFAULT_CACHE_STALE_TTL = 300.0
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+# Quota defaults (ADZUNA_RATE_PER_SECOND / ADZUNA_RATE_BURST / ADZUNA_RATE_PER_DAY /
+# ADZUNA_RATE_MAX_WAIT); a per-day budget of 0 means "not enforced locally".
+DEFAULT_RATE_PER_SECOND = 5.0
+DEFAULT_RATE_BURST = 10.0
+DEFAULT_RATE_PER_DAY = 0
+DEFAULT_RATE_MAX_WAIT = 10.0
+# Responses slower than this (ADZUNA_LATENCY_TARGET, seconds) shrink the concurrency limit
+DEFAULT_LATENCY_TARGET = 2.0
+# How often a throttled (HTTP 429) request is queued again before giving up
+MAX_THROTTLE_RETRIES = 3
+# Retry/backoff for transient errors (ADZUNA_RETRY_ATTEMPTS / ADZUNA_RETRY_BASE_DELAY /
+# ADZUNA_RETRY_MAX_DELAY) and circuit breaker (ADZUNA_BREAKER_FAILURES / ADZUNA_BREAKER_RESET)
+DEFAULT_RETRY_ATTEMPTS = 3
+DEFAULT_RETRY_BASE_DELAY = 0.2
+DEFAULT_RETRY_MAX_DELAY = 2.0
+DEFAULT_BREAKER_FAILURES = 5
+DEFAULT_BREAKER_RESET = 30.0
+# Optional persistent listing store (ADZUNA_STORE_PATH / ADZUNA_STORE_MAX_AGE)
+DEFAULT_STORE_MAX_AGE = 3600.0
+# Bulk searches: Adzuna serves at most 50 results per page; ADZUNA_BULK_MAX_RESULTS caps one bulk search
+MAX_RESULTS_PER_PAGE = 50
+DEFAULT_BULK_MAX_RESULTS = 100
 
-class AdzunaAPI:
-    def __init__(self, app_id: str, app_key: str):
+# Salary prefix per Adzuna country; unknown countries get bare amounts
+COUNTRY_CURRENCY_SYMBOLS = {
+    "gb": "£",
+    "us": "$",
+    "ca": "C$",
+    "au": "A$",
+    "nz": "NZ$",
+    "sg": "S$",
+    "br": "R$",
+    "mx": "MX$",
+    "in": "₹",
+    "za": "R",
+    "ch": "CHF ",
+    "pl": "PLN ",
+    "at": "€",
+    "be": "€",
+    "de": "€",
+    "es": "€",
+    "fr": "€",
+    "it": "€",
+    "nl": "€",
+}
+
+QueryKey = Tuple[Tuple[str, Any], ...]
+
+
+def build_response_cache() -> Optional[TTLCache]:
+    """Builds the search response cache from env vars; a TTL of 0 disables caching."""
+    ttl = get_env_float("ADZUNA_CACHE_TTL", DEFAULT_CACHE_TTL)
+    if ttl <= 0:
+        return None
+    return TTLCache(
+        max_entries=get_env_int("ADZUNA_CACHE_MAX_ENTRIES", DEFAULT_CACHE_MAX_ENTRIES),
+        ttl=ttl,
+        stale_ttl=get_env_float("ADZUNA_CACHE_STALE_TTL", DEFAULT_CACHE_STALE_TTL),
+    )
+
+
+_quota_limiter: Optional[QuotaLimiter] = None
+_quota_limiter_lock = threading.Lock()
+
+
+def bulk_max_results() -> int:
+    """Most listings one bulk search may fetch (ADZUNA_BULK_MAX_RESULTS)."""
+    return get_env_int("ADZUNA_BULK_MAX_RESULTS", DEFAULT_BULK_MAX_RESULTS)
+
+
+def get_quota_limiter() -> QuotaLimiter:
+    """The Adzuna quota is per app, so every client in the process shares one limiter."""
+    global _quota_limiter
+    with _quota_limiter_lock:
+        if _quota_limiter is None:
+            _quota_limiter = QuotaLimiter(
+                per_second=get_env_float("ADZUNA_RATE_PER_SECOND", DEFAULT_RATE_PER_SECOND),
+                burst=get_env_float("ADZUNA_RATE_BURST", DEFAULT_RATE_BURST),
+                per_day=get_env_int("ADZUNA_RATE_PER_DAY", DEFAULT_RATE_PER_DAY),
+                max_wait=get_env_float("ADZUNA_RATE_MAX_WAIT", DEFAULT_RATE_MAX_WAIT),
+            )
+        return _quota_limiter
+
+
+_listing_store: Optional[ListingStore] = None
+_listing_store_lock = threading.Lock()
+
+
+def get_listing_store() -> Optional[ListingStore]:
+    """The shared SQLite listing store, or None unless ADZUNA_STORE_PATH is set."""
+    global _listing_store
+    path = os.getenv("ADZUNA_STORE_PATH")
+    if not path:
+        return None
+    with _listing_store_lock:
+        if _listing_store is None or _listing_store.path != path:
+            try:
+                _listing_store = ListingStore(path, max_age=get_env_float("ADZUNA_STORE_MAX_AGE", DEFAULT_STORE_MAX_AGE))
+            except sqlite3.Error as e:
+                logger.error(f"[AdzunaAPI] Could not open listing store at {path}: {e}")
+                return None
+        return _listing_store
+
+
+class AdzunaThrottled(Exception):
+    """Adzuna answered HTTP 429; `retry_after` is the suggested wait in seconds."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Adzuna rate limit hit (HTTP 429); retry in {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+def _retry_after(headers: Any, attempt: int) -> float:
+    """Seconds to wait after a 429: the Retry-After header if numeric, else 1s, 2s, 4s..."""
+    try:
+        return max(0.0, float(headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return float(2 ** (attempt - 1))
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Timeouts, connection failures and 5xx responses are transient; other errors are not."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response is not None and error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def _normalise(value: Any) -> Any:
+    if isinstance(value, str):
+        return " ".join(value.lower().split())
+    return value
+
+
+def _copy_listings(listings: List[JobListing]) -> List[JobListing]:
+    """Callers shuffle and annotate results, so never hand out shared objects."""
+    return [dict(listing) for listing in listings]
+
+
+def _compact(listings: Sequence[JobListing]) -> Tuple[CompactListing, ...]:
+    return tuple(CompactListing.from_listing(listing) for listing in listings)
+
+
+def _expand(listings: Sequence[CompactListing]) -> List[JobListing]:
+    return [listing.to_listing() for listing in listings]
+
+
+class AsyncAdzunaAPI:
+    """
+    asyncio-native Adzuna client. Requests run on a pooled httpx.AsyncClient,
+    so a gather() over many titles really overlaps; at most `max_concurrency`
+    requests are in flight at once (fewer while Adzuna is throttling us).
+    Searches go through the response cache, in-flight coalescing, the shared
+    quota limiter, retries, a circuit breaker and the optional listing store.
+    """
+
+    def __init__(
+        self,
+        app_id: str,
+        app_key: str,
+        pool_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        cache: Optional[TTLCache] = None,
+        max_concurrency: Optional[int] = None,
+        rate_limiter: Optional[QuotaLimiter] = None,
+        store: Optional[ListingStore] = None,
+    ):
         if not app_id or not app_key:
             raise ValueError("Adzuna App ID and App Key are required.")
         self.app_id = app_id
         self.app_key = app_key
+        self.base_url = (os.getenv("ADZUNA_BASE_URL") or ADZUNA_BASE_URL).rstrip("/")
+        self.pool_size = pool_size or get_env_int("ADZUNA_POOL_SIZE", DEFAULT_POOL_SIZE)
+        self.timeout = timeout or get_env_float("ADZUNA_TIMEOUT", DEFAULT_TIMEOUT)
+        self.max_concurrency = max_concurrency or get_env_int("ADZUNA_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)
+        self.cache = cache if cache is not None else build_response_cache()
+        self.rate_limiter = rate_limiter or get_quota_limiter()
+        self.store = store if store is not None else get_listing_store()
+        # Adaptive in-flight limit: halves on 429s or slow responses, creeps back up on fast ones.
+        self.aimd = AIMDController(
+            maximum=self.max_concurrency,
+            latency_target=get_env_float("ADZUNA_LATENCY_TARGET", DEFAULT_LATENCY_TARGET),
+        )
+        self.retry = RetryPolicy(
+            attempts=get_env_int("ADZUNA_RETRY_ATTEMPTS", DEFAULT_RETRY_ATTEMPTS),
+            base_delay=get_env_float("ADZUNA_RETRY_BASE_DELAY", DEFAULT_RETRY_BASE_DELAY),
+            max_delay=get_env_float("ADZUNA_RETRY_MAX_DELAY", DEFAULT_RETRY_MAX_DELAY),
+        )
+        self.breaker = CircuitBreaker(
+            f"adzuna.{type(self).__name__}",
+            failure_threshold=get_env_int("ADZUNA_BREAKER_FAILURES", DEFAULT_BREAKER_FAILURES),
+            reset_timeout=get_env_float("ADZUNA_BREAKER_RESET", DEFAULT_BREAKER_RESET),
+        )
+        self.bulk_max_results = bulk_max_results()
+        self.throttled = 0
+        self.bytes_decoded = 0
+        self._refreshing: set = set()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._slots: Optional[AsyncConcurrencyLimiter] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._active = 0
+        self._opened = 0
+        self._requests = 0
+        self._background: set = set()
+        self._flights = AsyncSingleFlight()
 
-    def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Internal GET request with error handling and timeout."""
-        default_params = {"app_id": self.app_id, "app_key": self.app_key}
-        try:
-            response = requests.get(url, params={**default_params, **(params or {})}, timeout=5)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"[AdzunaAPI] Request error: {e}")
-            return {"results": []}
-
-    def _format_job_listing(self, job: Dict[str, Any]) -> JobListing:
+    def _build_search_request(
+        self,
+        what: str,
+        country: str,
+        page: int,
+        results_limit: int,
+        salary_min: Optional[int],
+        location: Optional[str],
+        employment_type: Optional[str],
+        freshness_days: Optional[int],
+        employer: Optional[str],
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Returns the search URL and query params (credentials included)."""
+        url = f"{self.base_url}/{country}/search/{page}"
+        params: Dict[str, Any] = {
+            "app_id": self.app_id,
+            "app_key": self.app_key,
+            "what": what,
+            "results_per_page": results_limit
+        }
+        if salary_min:
+            params["salary_min"] = salary_min
+        if location:
+            params["where"] = location
+        if freshness_days:
+            params["max_days_old"] = freshness_days
+        if employer:
+            params["company"] = employer
+        if employment_type in {"full_time", "part_time", "contract", "permanent"}:
+            params[employment_type] = 1
+        return url, params
+
+    def _query_key(self, url: str, params: Dict[str, Any]) -> QueryKey:
+        """
+        Normalised cache key for a search: country and page (from the URL) plus
+        every query param except the credentials, case- and whitespace-folded.
+        """
+        path = url.rsplit("/", 3)
+        items = [("country", path[-3].lower()), ("page", int(path[-1]))]
+        items.extend(
+            (name, _normalise(value))
+            for name, value in params.items()
+            if name not in ("app_id", "app_key")
+        )
+        return tuple(sorted(items))
+
+    def search_key(
+        self,
+        what: str,
+        country: str = "gb",
+        page: int = 1,
+        results_limit: int = 5,
+        salary_min: Optional[int] = None,
+        location: Optional[str] = None,
+        employment_type: Optional[str] = None,
+        freshness_days: Optional[int] = None,
+        employer: Optional[str] = None,
+    ) -> QueryKey:
+        """The normalised cache key `search_jobs` would use for these arguments."""
+        url, params = self._build_search_request(
+            what, country, page, results_limit, salary_min,
+            location, employment_type, freshness_days, employer,
+        )
+        return self._query_key(url, params)
+
+    def _bulk_plan(self, target_count: int, per_page: Optional[int]) -> Tuple[int, int, int]:
+        """
+        (target, per_page, pages) for a bulk search: the fewest pages that
+        cover the target, sized evenly, e.g. 60 listings -> 2 pages of 30.
+        """
+        target = max(1, min(target_count, self.bulk_max_results))
+        per_page = max(1, min(per_page or MAX_RESULTS_PER_PAGE, MAX_RESULTS_PER_PAGE))
+        pages = math.ceil(target / per_page)
+        return target, math.ceil(target / pages), pages
+
+    @staticmethod
+    def _merge_countries(countries: Sequence[str], responses: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Interleaves per-country results (first of each country, then second...)
+        so every country is represented near the top, tags each listing with
+        its `country`, and counts listings per country. Per-country errors are
+        joined into one `error`, prefixed with the country code.
+        """
+        per_country = [response.get("results", []) for response in responses]
+        for country, listings in zip(countries, per_country):
+            for listing in listings:
+                listing["country"] = country
+        merged = [
+            listing
+            for rank in range(max(map(len, per_country), default=0))
+            for listings in per_country
+            if rank < len(listings)
+            for listing in (listings[rank],)
+        ]
+        merged_response: Dict[str, Any] = {
+            "results": merged,
+            "country_counts": {country: len(listings) for country, listings in zip(countries, per_country)},
+        }
+        errors = [f"{country}: {response['error']}" for country, response in zip(countries, responses) if "error" in response]
+        if errors:
+            merged_response["error"] = "; ".join(errors)
+        for flag in ("stale", "rate_limited"):
+            if any(response.get(flag) for response in responses):
+                merged_response[flag] = True
+        return merged_response
+
+    @staticmethod
+    def _merge_pages(responses: List[Dict[str, Any]], per_page: int, target: int) -> Dict[str, Any]:
+        """
+        Concatenates page responses (in page order) up to the first short or
+        failed page, dropping listings repeated across pages, and trims to
+        `target`. Only a short page that did not fail marks the search exhausted.
+        """
+        merged: List[JobListing] = []
+        seen: set = set()
+        failed: Dict[str, Any] = {}
+        pages_fetched = 0
+        exhausted = False
+        for pages_fetched, response in enumerate(responses, start=1):
+            results = response.get("results", [])
+            for listing in results:
+                listing_id = listing.get("id")
+                if listing_id and listing_id in seen:
+                    continue
+                seen.add(listing_id)
+                merged.append(listing)
+            if "error" in response:
+                failed = response
+                break
+            if len(results) < per_page:
+                exhausted = True
+                break
+        bulk = {"results": merged[:target], "pages_fetched": pages_fetched, "exhausted": exhausted}
+        bulk.update((field, failed[field]) for field in ("error", "rate_limited") if field in failed)
+        return bulk
+
+    def _format_job_listing(self, job: Dict[str, Any], country: str = "gb") -> JobListing:
         """Extract and clean up job details into a compact, LLM-ready object."""
-        # Salary formatting
+        # Salary formatting, in the currency of the country searched
+        symbol = COUNTRY_CURRENCY_SYMBOLS.get(country.lower(), "")
         s_min = job.get("salary_min")
         s_max = job.get("salary_max")
         salary = "Not listed"
         if s_min and s_max:
-            salary = f"£{int(s_min):,} - £{int(s_max):,}"
+            salary = f"{symbol}{int(s_min):,} - {symbol}{int(s_max):,}"
         elif s_min:
-            salary = f"From £{int(s_min):,}"
-        if job.get("salary_is_predicted") == "1" and salary != "Not listed":
+            salary = f"From {symbol}{int(s_min):,}"
+        is_predicted = str(job.get("salary_is_predicted")) == "1"
+        if is_predicted and salary != "Not listed":
             salary += " (est.)"
 
         # Employment type
@@ -56,9 +442,9 @@ class AdzunaAPI:
         }
         employment_type = contract_map.get(job.get("contract_time"), "Permanent")
 
-        # Description snippet (~20 words)
-        desc_words = (job.get("description") or "").strip().split()
-        snippet = " ".join(desc_words[:20]) + ("..." if len(desc_words) > 20 else "")
+        # Description snippet (~20 words); split no further than needed
+        desc_words = (job.get("description") or "").split(None, SNIPPET_WORDS)
+        snippet = " ".join(desc_words[:SNIPPET_WORDS]) + ("..." if len(desc_words) > SNIPPET_WORDS else "")
 
         return {
             "id": job.get("id", ""),
@@ -69,12 +455,248 @@ class AdzunaAPI:
             "salary": salary,
             "description_snippet": snippet,
             "url": job.get("redirect_url", ""),
+            "salary_min": float(s_min) if s_min else None,
+            "salary_max": float(s_max) if s_max else None,
+            "salary_is_predicted": is_predicted,
+        }
+
+    def _format_results(self, data: Dict[str, Any], results_limit: int, country: str = "gb") -> List[JobListing]:
+        return [
+            self._format_job_listing(job, country)
+            for job in data.get("results", [])[:results_limit]
+        ]
+
+    def _lookup_cache(self, key: QueryKey) -> Tuple[Optional[Tuple[CompactListing, ...]], str]:
+        """Cache lookup that also records the outcome on the active trace span."""
+        if self.cache is None:
+            return None, MISS
+        cached, state = self.cache.get(key)
+        annotate_current_span({"lookup": state, **self.cache.stats()}, prefix="adzuna.cache.")
+        return cached, state
+
+    def _remember(self, key: QueryKey, data: Dict[str, Any], listings: List[JobListing]) -> Dict[str, Any]:
+        """
+        Caches a successful response; failed requests are never cached. If the
+        request failed, the last cached listings for the key (however old) are
+        returned instead, marked `stale`, so an Adzuna outage degrades to older
+        results; with nothing cached the response carries the `error` (and
+        `rate_limited`).
+        """
+        if "error" not in data:
+            if self.cache is not None:
+                self.cache.set(key, _compact(listings))
+            return {"results": listings}
+        fallback = self.cache.peek(key) if self.cache is not None else None
+        if fallback is not None:
+            annotate_current_span({"adzuna.cache.fallback": True})
+            return {"results": _expand(fallback), "stale": True}
+        return {"results": listings, **{field: data[field] for field in ("error", "rate_limited") if field in data}}
+
+    def _from_store(self, key: QueryKey, results_limit: int) -> Optional[List[JobListing]]:
+        """Fresh results for the query from the persistent store (exact or narrowed match), if any."""
+        if self.store is None:
+            return None
+        query = dict(key)
+        try:
+            listings = self.store.lookup(query, results_limit)
+            if listings is None:
+                listings = self.store.lookup_narrowed(query, results_limit)
+        except sqlite3.Error as e:
+            logger.warning(f"[AdzunaAPI] Listing store lookup failed: {e}")
+            return None
+        if listings is not None:
+            annotate_current_span({"adzuna.store.hit": True})
+            if self.cache is not None:
+                self.cache.set(key, _compact(listings))
+        return listings
+
+    def _persist(self, key: QueryKey, data: Dict[str, Any], listings: List[JobListing]) -> None:
+        """Upserts successfully fetched listings into the persistent store."""
+        if self.store is None or "error" in data:
+            return
+        try:
+            self.store.save(dict(key), listings)
+        except sqlite3.Error as e:
+            logger.warning(f"[AdzunaAPI] Listing store write failed: {e}")
+
+    def _circuit_open(self) -> Optional[Dict[str, Any]]:
+        """Fail-fast result while the breaker is open, or None if the call may proceed."""
+        if self.breaker.allow():
+            return None
+        annotate_current_span({"adzuna.breaker.state": self.breaker.state})
+        return {"results": [], "error": "Adzuna circuit breaker is open"}
+
+    def _on_error(self, error: Exception, attempt: int) -> Optional[float]:
+        """
+        Books a failed attempt. Returns the backoff delay if the request should
+        be retried, or None once it has failed for good.
+        """
+        retryable = _is_retryable(error)
+        if retryable and self.retry.should_retry(attempt):
+            return self.retry.delay(attempt)
+        if retryable:
+            self.breaker.record_failure()
+        else:
+            # Adzuna answered (e.g. 4xx), so it is up even though this request failed.
+            self.breaker.record_success()
+        return None
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Pool, cache, coalescing, quota and concurrency counters, shaped for annotate_current_span()."""
+        return {
+            "pool": self.pool_stats(),
+            "cache": self.cache.stats() if self.cache is not None else {},
+            "singleflight": self._flights.stats(),
+            "rate_limit": {**self.rate_limiter.stats(), "throttled": self.throttled},
+            "concurrency": {**self.aimd.stats(), "in_flight": self._active},
+            "retry": {"retries": self.retry.retries},
+            "breaker": self.breaker.stats(),
+            "store": self.store.stats() if self.store is not None else {},
+            "decode": {"backend": json_backend(), "bytes": self.bytes_decoded},
+        }
+
+    def _bind_loop(self) -> Tuple[httpx.AsyncClient, AsyncConcurrencyLimiter]:
+        """Returns the HTTP client and slot gate for the running loop, creating them on first use."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Pooled connections and asyncio primitives belong to a single event loop.
+            self._retire_client()
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                ),
+            )
+            self._slots = AsyncConcurrencyLimiter(self.aimd)
+            self._flights.clear()
+            self._loop = loop
+        return self._client, self._slots
+
+    def _retire_client(self) -> None:
+        """
+        Closes the client bound to a previous event loop: on that loop if it
+        is still running elsewhere, otherwise (e.g. after an earlier
+        asyncio.run()) by closing its pooled sockets directly.
+        """
+        client, loop = self._client, self._loop
+        self._client = None
+        if client is None:
+            return
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        pool = getattr(client._transport, "_pool", None)
+        for conn in (pool.connections if pool is not None else []):
+            stream = getattr(getattr(conn, "_connection", None), "_network_stream", None)
+            sock = stream.get_extra_info("socket") if stream is not None else None
+            if sock is not None:
+                # asyncio hands out a TransportSocket wrapper; close the socket it wraps
+                getattr(sock, "_sock", sock).close()
+
+    async def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace hook used to count newly opened connections."""
+        if event_name == "connection.connect_tcp.complete":
+            self._opened += 1
+
+    async def _send(self, url: str, params: Optional[Dict[str, Any]], attempt: int) -> Dict[str, Any]:
+        """One request: waits for quota and a concurrency slot, raises AdzunaThrottled on HTTP 429."""
+        client, slots = self._bind_loop()
+        await self.rate_limiter.acquire_async()
+        async with slots:
+            self._active += 1
+            self._requests += 1
+            started = time.monotonic()
+            try:
+                response = await client.get(url, params=params, extensions={"trace": self._trace})
+                if response.status_code == 429:
+                    self.aimd.on_overload()
+                    raise AdzunaThrottled(_retry_after(response.headers, attempt))
+                response.raise_for_status()
+                self.aimd.on_success(time.monotonic() - started)
+                body = response.content
+                self.bytes_decoded += len(body)
+                return decode_search_response(body)
+            finally:
+                self._active -= 1
+
+    async def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Internal GET request with quota queueing, 429 back-off, jittered retries
+        for transient errors, a circuit breaker, error handling and timeout.
+        Failures return an `error`, plus `rate_limited` when the request was
+        refused for quota (ours or Adzuna's) and is worth retrying shortly.
+        """
+        rejected = self._circuit_open()
+        if rejected is not None:
+            return rejected
+        try:
+            return await self._attempt(url, params)
+        except BaseException:
+            # Cancelled or failed unexpectedly: no verdict on Adzuna, but free a half-open probe slot
+            self.breaker.release()
+            raise
+
+    async def _attempt(self, url: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """The request/retry loop of _get(); every outcome it returns is booked with the breaker."""
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                data = await self._send(url, params, attempt)
+                self.breaker.record_success()
+                return data
+            except AdzunaThrottled as e:
+                self.throttled += 1
+                if attempt > MAX_THROTTLE_RETRIES or e.retry_after > self.rate_limiter.max_wait:
+                    logger.warning(f"[AsyncAdzunaAPI] {e}; giving up after {attempt} attempts")
+                    self.breaker.record_success()
+                    return {"results": [], "error": str(e), "rate_limited": True}
+                await asyncio.sleep(e.retry_after)
+            except RateLimitExceeded as e:
+                logger.warning(f"[AsyncAdzunaAPI] {e}")
+                self.breaker.record_success()
+                return {"results": [], "error": str(e), "rate_limited": True}
+            except (httpx.HTTPError, ValueError) as e:
+                delay = self._on_error(e, attempt)
+                if delay is None:
+                    logger.warning(f"[AsyncAdzunaAPI] Request error after {attempt} attempts: {e}")
+                    return {"results": [], "error": str(e)}
+                await asyncio.sleep(delay)
+
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Snapshot of the connection pool: requests in flight (`active`), open
+        connections parked in the pool (`idle`), connections opened so far
+        (`opened`) and requests served on an already-open connection (`reused`).
+        """
+        idle = 0
+        if self._client is not None:
+            pool = getattr(self._client._transport, "_pool", None)
+            if pool is not None:
+                idle = sum(1 for conn in pool.connections if conn.is_idle())
+        return {
+            "pool_size": self.pool_size,
+            "active": self._active,
+            "idle": idle,
+            "opened": self._opened,
+            "reused": max(self._requests - self._opened, 0),
         }
 
-    def search_jobs(
+    async def aclose(self) -> None:
+        """Closes all pooled connections."""
+        if self._client is not None:
+            if self._loop is asyncio.get_running_loop():
+                await self._client.aclose()
+                self._client = None
+            else:
+                self._retire_client()
+            self._loop = None
+
+    async def search_jobs(
         self,
         what: str,
-        country: str = "gb",
+        country: Union[str, Sequence[str]] = "gb",
         page: int = 1,
         results_limit: int = 5,
         salary_min: Optional[int] = None,
@@ -82,38 +704,194 @@ class AdzunaAPI:
         employment_type: Optional[str] = None,
         freshness_days: Optional[int] = None,
         employer: Optional[str] = None,
-    ) -> Dict[str, List[JobListing]]:
+    ) -> Dict[str, Any]:
         """
         Fetches up to `results_limit` jobs matching the criteria and returns formatted listings.
+        Given a list of countries, searches them all concurrently (up to `results_limit`
+        each) and returns one merged result with per-country `country_counts`.
+        A failed search returns no results and an `error`; older cached results
+        served in its place are marked `stale`.
         """
-        url = f"{ADZUNA_BASE_URL}/{country}/search/{page}"
-        params: Dict[str, Any] = {
-            "what": what,
-            "results_per_page": results_limit
-        }
-        if salary_min:
-            params["salary_min"] = salary_min
-        if location:
-            params["where"] = location
-        if freshness_days:
-            params["max_days_old"] = freshness_days
-        if employer:
-            params["company"] = employer
-        if employment_type in {"full_time", "part_time", "contract", "permanent"}:
-            params[employment_type] = 1
+        if not isinstance(country, str):
+            countries = list(dict.fromkeys(c.lower() for c in country))
+            responses = await asyncio.gather(*(
+                self.search_jobs(
+                    what, c, page, results_limit, salary_min,
+                    location, employment_type, freshness_days, employer,
+                )
+                for c in countries
+            ))
+            return self._merge_countries(countries, responses)
 
-        raw_results = self._get(url, params).get("results", [])
-        return {
-            "results": [
-                self._format_job_listing(job)
-                for job in raw_results[:results_limit]
-            ]
-        }
+        url, params = self._build_search_request(
+            what, country, page, results_limit, salary_min,
+            location, employment_type, freshness_days, employer,
+        )
+        key = self._query_key(url, params)
+        cached, state = self._lookup_cache(key)
+        if state != MISS:
+            if state == STALE:
+                self._revalidate(key, url, params, results_limit)
+            return {"results": _expand(cached)}
+
+        # Identical searches already in flight share one request.
+        self._bind_loop()
+        response = await self._flights.do(key, lambda: self._fetch(key, url, params, results_limit))
+        return {**response, "results": _copy_listings(response["results"])}
+
+    async def search_jobs_bulk(
+        self,
+        what: str,
+        target_count: int = 50,
+        country: str = "gb",
+        page: int = 1,
+        per_page: Optional[int] = None,
+        salary_min: Optional[int] = None,
+        location: Optional[str] = None,
+        employment_type: Optional[str] = None,
+        freshness_days: Optional[int] = None,
+        employer: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetches up to `target_count` jobs by requesting the Adzuna pages needed
+        in parallel; `page` counts in blocks of `target_count` jobs. Pages after
+        the first short or failed page are dropped (and cancelled if still
+        running). Returns the merged, deduplicated listings plus `pages_fetched`,
+        `exhausted` (True when Adzuna has no more results) and any `error`.
+        """
+        target, per_page, page_count = self._bulk_plan(target_count, per_page)
+        first = (page - 1) * page_count + 1
+        tasks = [
+            asyncio.ensure_future(self.search_jobs(
+                what, country, page, per_page, salary_min,
+                location, employment_type, freshness_days, employer,
+            ))
+            for page in range(first, first + page_count)
+        ]
+        responses = []
+        try:
+            for task in tasks:
+                responses.append(await task)
+                if "error" in responses[-1] or len(responses[-1]["results"]) < per_page:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+        return self._merge_pages(responses, per_page, target)
+
+    async def _fetch(self, key: QueryKey, url: str, params: Dict[str, Any], results_limit: int) -> Dict[str, Any]:
+        if self.store is not None:
+            stored = await asyncio.to_thread(self._from_store, key, results_limit)
+            if stored is not None:
+                return {"results": stored}
+        data = await self._get(url, params)
+        listings = self._format_results(data, results_limit, dict(key)["country"])
+        if self.store is not None:
+            await asyncio.to_thread(self._persist, key, data, listings)
+        return self._remember(key, data, listings)
+
+    def _revalidate(self, key: QueryKey, url: str, params: Dict[str, Any], results_limit: int) -> None:
+        """Refreshes a stale cache entry in a background task (one refresh per key)."""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+
+        async def refresh():
+            try:
+                await self._flights.do(key, lambda: self._fetch(key, url, params, results_limit))
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+
+class AdzunaAPI:
+    """
+    Blocking wrapper around AsyncAdzunaAPI for scripts and threads with no
+    event loop. Calls run on the wrapper's own loop thread, so they share
+    one client, cache, limiter and breaker; other attributes (`cache`,
+    `metrics()`, `search_key()`...) are the wrapped client's.
+    """
+
+    def __init__(self, app_id: str, app_key: str, **options: Any):
+        self._api = AsyncAdzunaAPI(app_id, app_key, **options)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="adzuna-sync", daemon=True)
+        self._thread.start()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._api, name)
+
+    def _run(self, coroutine) -> Any:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def search_jobs(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Blocking AsyncAdzunaAPI.search_jobs()."""
+        return self._run(self._api.search_jobs(*args, **kwargs))
+
+    def search_jobs_bulk(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Blocking AsyncAdzunaAPI.search_jobs_bulk()."""
+        return self._run(self._api.search_jobs_bulk(*args, **kwargs))
+
+    def close(self) -> None:
+        """Closes all pooled connections and stops the loop thread."""
+        if self._loop.is_closed():
+            return
+        self._run(self._api.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+_shared_api: Optional[AdzunaAPI] = None
+_shared_api_lock = threading.Lock()
+_shared_async_api: Optional[AsyncAdzunaAPI] = None
 
 
 def get_adzuna_api() -> AdzunaAPI:
-    """Helper to instantiate API with env vars."""
-    return AdzunaAPI(
-        os.getenv("ADZUNA_APP_ID"),
-        os.getenv("ADZUNA_APP_KEY")
-    )
+    """
+    Returns the process-wide AdzunaAPI client (and its connection pool),
+    creating it from env vars on first use. The client is rebuilt only if
+    the credentials in the environment change.
+    """
+    global _shared_api
+    if not (os.getenv("ADZUNA_APP_ID") and os.getenv("ADZUNA_APP_KEY")):
+        # Called outside the agents, which load the environment first
+        try:
+            load_env()
+        except Exception as e:
+            logger.warning(f"[AdzunaAPI] Could not load secrets: {e}")
+    app_id, app_key = os.getenv("ADZUNA_APP_ID"), os.getenv("ADZUNA_APP_KEY")
+    api = _shared_api
+    if api is not None and (api.app_id, api.app_key) == (app_id, app_key):
+        return api
+
+    with _shared_api_lock:
+        if _shared_api is None or (_shared_api.app_id, _shared_api.app_key) != (app_id, app_key):
+            previous = _shared_api
+            _shared_api = AdzunaAPI(app_id, app_key)
+            if previous is not None:
+                previous.close()
+        return _shared_api
+
+
+def get_async_adzuna_api() -> AsyncAdzunaAPI:
+    """Async counterpart of get_adzuna_api(): one shared AsyncAdzunaAPI per process."""
+    global _shared_async_api
+    if not (os.getenv("ADZUNA_APP_ID") and os.getenv("ADZUNA_APP_KEY")):
+        # Called outside the agents, which load the environment first
+        try:
+            load_env()
+        except Exception as e:
+            logger.warning(f"[AdzunaAPI] Could not load secrets: {e}")
+    app_id, app_key = os.getenv("ADZUNA_APP_ID"), os.getenv("ADZUNA_APP_KEY")
+    api = _shared_async_api
+    if api is not None and (api.app_id, api.app_key) == (app_id, app_key):
+        return api
+
+    with _shared_api_lock:
+        if _shared_async_api is None or (_shared_async_api.app_id, _shared_async_api.app_key) != (app_id, app_key):
+            _shared_async_api = AsyncAdzunaAPI(app_id, app_key)
+        return _shared_async_api
@@ -0,0 +1,34 @@
+import os
+import json
+from typing import Any, Dict
+
+try:  # Optional fast JSON backend
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# JobListing snippets show 20 words; `_format_job_listing` splits no further than that
+SNIPPET_WORDS = 20
+
+
+def json_backend() -> str:
+    """
+    'orjson' when ADZUNA_JSON_BACKEND=orjson and it is installed, else 'stdlib'.
+    orjson cuts decoding time by about a quarter but briefly allocates
+    several times the response size (see devtools/bench_decode.py), so the
+    stdlib parser stays the default.
+    """
+    if orjson is not None and os.getenv("ADZUNA_JSON_BACKEND", "").lower() == "orjson":
+        return "orjson"
+    return "stdlib"
+
+
+def decode_search_response(body: bytes) -> Dict[str, Any]:
+    """
+    Decodes a raw Adzuna search response into `{"results": [...], "count": n}`.
+    Only the two top-level fields the client reads are kept; jobs are left as
+    parsed, since `_format_job_listing` reads just the fields it needs and a
+    per-job copy would cost more than it saves.
+    """
+    data = orjson.loads(body) if json_backend() == "orjson" else json.loads(body)
+    return {"results": data.get("results") or [], "count": data.get("count")}
@@ -0,0 +1,100 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# Lookup outcomes returned by TTLCache.get()
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+
+class TTLCache:
+    """
+    Thread-safe in-process LRU cache with a per-entry TTL and a
+    stale-while-revalidate window.
+
+    An entry younger than `ttl` is FRESH. Between `ttl` and `ttl + stale_ttl`
+    it is STALE: still returned, but the caller is expected to refresh it in
+    the background. Older entries are reported as a MISS but kept (until LRU
+    eviction or overwrite) so `peek()` can still serve them as a last resort,
+    e.g. while the upstream API is unavailable. Once `max_entries` is
+    reached, the least recently used entry is evicted.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 300.0,
+        stale_ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.stale_ttl = max(0.0, stale_ttl)
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Tuple[Optional[Any], str]:
+        """Returns `(value, FRESH | STALE)` for a cached key, or `(None, MISS)`."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, MISS
+            value, stored_at = entry
+            age = now - stored_at
+            if age >= self.ttl + self.stale_ttl:
+                self.expirations += 1
+                self.misses += 1
+                return None, MISS
+            self._entries.move_to_end(key)
+            if age >= self.ttl:
+                self.stale_hits += 1
+                return value, STALE
+            self.hits += 1
+            return value, FRESH
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Returns the cached value regardless of age, without touching counters or LRU order."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry is not None else None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Stores `value` as a fresh entry, evicting the LRU entry if full."""
+        with self._lock:
+            self._entries[key] = (value, self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for tracing: hits, stale hits, misses, evictions, expirations and size."""
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+        }
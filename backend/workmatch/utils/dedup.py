@@ -0,0 +1,103 @@
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from workmatch.utils.adzuna import JobListing
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def _normalise(text: Optional[str]) -> str:
+    return _NON_WORD.sub(" ", (text or "").lower()).strip()
+
+
+def listing_fingerprint(listing: JobListing) -> Tuple[str, str, str]:
+    """Normalised (title, company, location), used to spot the same job posted under different ids."""
+    return (
+        _normalise(listing.get("title")),
+        _normalise(listing.get("company")),
+        _normalise(listing.get("location")),
+    )
+
+
+def listing_keys(listing: JobListing) -> List[str]:
+    """String keys (id and fingerprint) identifying a listing, compact enough to keep in session state."""
+    keys = []
+    if listing.get("id"):
+        keys.append(f"id:{listing['id']}")
+    fingerprint = listing_fingerprint(listing)
+    if any(fingerprint):
+        keys.append("fp:" + "|".join(fingerprint))
+    return keys
+
+
+class ListingDeduplicator:
+    """
+    Keeps the first copy of each listing and drops later duplicates: exact
+    duplicates by Adzuna `id`, near-duplicates by normalised (title,
+    company, location). The kept listing records every source (e.g. the
+    expanded titles) that returned it in `matched_titles`.
+
+    `seen` holds the listing_keys() of listings already shown (e.g. on
+    earlier pages of the same search); those are dropped too. `seen_keys()`
+    returns them plus the keys of every listing kept since.
+    """
+
+    def __init__(self, seen: Iterable[str] = ()):
+        self._by_id: Dict[str, JobListing] = {}
+        self._by_fingerprint: Dict[Tuple[str, str, str], JobListing] = {}
+        self._seen_keys: List[str] = list(seen)
+        self._seen = set(self._seen_keys)
+        self.removed = 0
+
+    def add(self, listing: JobListing, source: Optional[str] = None) -> bool:
+        """Returns True if `listing` is new; otherwise merges its source into the kept copy."""
+        keys = listing_keys(listing)
+        if self._seen.intersection(keys):
+            self.removed += 1
+            return False
+
+        listing_id = listing.get("id")
+        fingerprint = listing_fingerprint(listing)
+        kept = (self._by_id.get(listing_id) if listing_id else None) or self._by_fingerprint.get(fingerprint)
+
+        if kept is None:
+            if source is not None:
+                listing["matched_titles"] = [source]
+            if listing_id:
+                self._by_id[listing_id] = listing
+            if any(fingerprint):
+                self._by_fingerprint[fingerprint] = listing
+            self._seen_keys.extend(keys)
+            return True
+
+        self.removed += 1
+        if source is not None and source not in kept.setdefault("matched_titles", []):
+            kept["matched_titles"].append(source)
+        return False
+
+    def seen_keys(self) -> List[str]:
+        return list(self._seen_keys)
+
+
+def dedupe_listings_by_title(
+    listings_by_title: Dict[str, List[JobListing]],
+    dedup: Optional[ListingDeduplicator] = None,
+) -> Tuple[Dict[str, List[JobListing]], int]:
+    """
+    Removes duplicates across (and within) the per-title result lists. Each
+    unique listing stays under the first title that found it; titles left
+    with no listings are dropped. `matched_titles` is only kept on listings
+    found by more than one title. Pass a `dedup` seeded with earlier pages'
+    keys to also drop listings already shown. Returns the deduplicated
+    mapping and the number of duplicates removed.
+    """
+    dedup = dedup or ListingDeduplicator()
+    unique_by_title = {
+        title: [listing for listing in listings if dedup.add(listing, source=title)]
+        for title, listings in listings_by_title.items()
+    }
+    for listings in unique_by_title.values():
+        for listing in listings:
+            if len(listing.get("matched_titles", ())) < 2:
+                listing.pop("matched_titles", None)
+    return {title: listings for title, listings in unique_by_title.items() if listings}, dedup.removed
@@ -2,9 +2,12 @@ import os
 import base64
 import logging
 from functools import lru_cache
-from google.cloud import secretmanager
+from typing import TYPE_CHECKING, Union
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from google.adk.models import BaseLlm
+
 # --- Logging setup ---
 logger = logging.getLogger(__name__)
 
@@ -37,18 +40,24 @@ def load_env(project_id: str = "workmatch-hackathon", secret_map: dict = None):
     else:
         logger.debug("[env] No .env file found.")
 
-    secret_map = secret_map or DEFAULT_SECRET_MAP
-    client = secretmanager.SecretManagerServiceClient()
+    # Offline runs with the fake model need no secrets (and may have no GCP credentials)
+    if fake_model_requested():
+        logger.info("[env] Fake model selected; skipping Secret Manager.")
+    else:
+        from google.cloud import secretmanager  # imported here: it is slow to import and unused offline
+
+        secret_map = secret_map or DEFAULT_SECRET_MAP
+        client = secretmanager.SecretManagerServiceClient()
 
-    logger.debug("[env] Fetching secrets from Secret Manager...")
-    for env_var, secret_name in secret_map.items():
-        try:
-            name = f"projects/{project_id}/secrets/{secret_name}/versions/latest"
-            response = client.access_secret_version(request={"name": name})
-            os.environ[env_var] = response.payload.data.decode("utf-8").strip()
-            logger.debug(f"[env] Loaded {env_var} from Secret Manager.")
-        except Exception as e:
-            logger.warning(f"[env] Failed to load {env_var} from '{secret_name}': {e}")
+        logger.debug("[env] Fetching secrets from Secret Manager...")
+        for env_var, secret_name in secret_map.items():
+            try:
+                name = f"projects/{project_id}/secrets/{secret_name}/versions/latest"
+                response = client.access_secret_version(request={"name": name})
+                os.environ[env_var] = response.payload.data.decode("utf-8").strip()
+                logger.debug(f"[env] Loaded {env_var} from Secret Manager.")
+            except Exception as e:
+                logger.warning(f"[env] Failed to load {env_var} from '{secret_name}': {e}")
 
     if os.getenv("ENABLE_LANGFUSE", "").lower() == "true":
         pub, sec = os.getenv("LANGFUSE_PUBLIC_KEY"), os.getenv("LANGFUSE_SECRET_KEY")
@@ -63,16 +72,53 @@ def load_env(project_id: str = "workmatch-hackathon", secret_map: dict = None):
     _env_loaded = True
 
 
+def get_env_int(name: str, default: int) -> int:
+    """Returns an integer setting from the environment, or `default` if unset or invalid."""
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"[env] Ignoring non-integer {name}={value!r}; using {default}.")
+        return default
+
+
+def get_env_float(name: str, default: float) -> float:
+    """Returns a float setting from the environment, or `default` if unset or invalid."""
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"[env] Ignoring non-numeric {name}={value!r}; using {default}.")
+        return default
+
+
+def get_env_bool(name: str, default: bool = False) -> bool:
+    """Returns a boolean setting from the environment ("true"/"1"/"yes" are truthy)."""
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in {"true", "1", "yes", "on"}
+
+
 @lru_cache(maxsize=1)
-def get_model(default: str = "gemini-2.5-flash") -> str:
-    """Returns Gemini model from environment or fallback."""
+def fake_model_requested() -> bool:
+    """True when GEMINI_MODEL=fake or WORKMATCH_FAKE_LLM=true selects the offline fake model."""
+    return os.getenv("GEMINI_MODEL") == "fake" or get_env_bool("WORKMATCH_FAKE_LLM")
+
+
+def get_model(default: str = "gemini-2.5-flash") -> Union[str, "BaseLlm"]:
+    """
+    Returns Gemini model from environment or fallback. GEMINI_MODEL=fake or
+    WORKMATCH_FAKE_LLM=true returns the offline fake model instead.
+    """
     model = os.getenv("GEMINI_MODEL", default)
+    if fake_model_requested():
+        from workmatch.utils.fake_llm import get_fake_llm
+        logger.debug("[env] Using offline fake model")
+        return get_fake_llm()
     logger.debug(f"[env] Using Gemini model: {model}")
     return model
-
-
-# Safe preload (optional for ADK Web usage)
-try:
-    load_env()
-except Exception as e:
-    logger.warning(f"[env] Could not load secrets on import: {e}")
@@ -0,0 +1,224 @@
+import os
+import re
+import json
+import asyncio
+import logging
+import threading
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.genai import types
+from pydantic import PrivateAttr
+
+from workmatch.utils.env import get_env_float, get_env_int
+from workmatch.utils.token_budget import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Name the fake reports as its model; it starts with "gemini-" so built-in
+# tools such as google_search accept it (the fake simply ignores them).
+FAKE_MODEL_NAME = "gemini-fake"
+
+# ADK puts the agent's name in its system instruction
+_AGENT_NAME = re.compile(r'internal name is "([^"]+)"')
+_JOB_TITLE = re.compile(
+    r"(?:jobs?|roles?|work|position)\s+(?:as|for)\s+(?:an?\s+)?(.+?)(?:\s+(?:jobs?|roles?))?(?:\s+in\s+.+)?[.?!]*$"
+    r"|(?:find|search|show me)\s+(?:live\s+|junior\s+|senior\s+)?(.+?)\s+(?:jobs?|roles?)",
+    re.IGNORECASE,
+)
+_LOCATION = re.compile(r"\bin\s+([A-Z][\w-]+(?:\s+[A-Z][\w-]+)*)")
+
+# Root-agent routing: first tool whose keywords appear in the user's message
+_ROUTES = (
+    ("get_motivational_quote", ("quote", "motivat", "inspir")),
+    ("entry_level_agent", ("first job", "graduate", "bootcamp", "entry", "beginner")),
+    ("expanded_insights_agent", ("job", "listing", "vacanc", "hiring", "search", "next page")),
+    ("advanced_pathways_agent", ("promotion", "leadership", "senior", "certification", "interview", "pivot", "network")),
+)
+
+
+def _request_text(llm_request: LlmRequest) -> str:
+    parts = [str(llm_request.config.system_instruction or "")] if llm_request.config else []
+    for content in llm_request.contents:
+        for part in content.parts or []:
+            if part.text:
+                parts.append(part.text)
+            elif part.function_call:
+                parts.append(json.dumps(part.function_call.args or {}, default=str))
+            elif part.function_response:
+                parts.append(json.dumps(part.function_response.response or {}, default=str))
+    return "\n".join(parts)
+
+
+class FakeGeminiLlm(BaseLlm):
+    """
+    Offline stand-in for Gemini: answers from scripted rules or simple
+    keyword rules without any network call, so the agent tree can run end
+    to end on a developer box or benchmark machine.
+
+    On a user turn it calls the tool the rules pick (the job search tool,
+    a sub-agent tool or the quote tool); after a tool response it replies
+    with text. Each call waits `latency` seconds plus output tokens divided
+    by `tokens_per_second`, and reports estimated token counts in
+    `usage_metadata`.
+
+    Script rules are tried first. get_fake_llm() loads them from the JSON
+    file named by WORKMATCH_FAKE_LLM_SCRIPT, which holds a list of
+    `{"agent": regex, "match": regex, "after_tool": bool,
+    "text": str | "tool_call": {"name": str, "args": {...}}}`.
+    """
+
+    model: str = FAKE_MODEL_NAME
+    latency: float = 0.0
+    tokens_per_second: float = 0.0
+    output_tokens: int = 0
+    rules: List[Dict[str, Any]] = []
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _stats: Dict[str, int] = PrivateAttr(
+        default_factory=lambda: {"calls": 0, "tool_calls": 0, "prompt_tokens": 0, "output_tokens": 0}
+    )
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        agent = self._agent_name(llm_request)
+        part = self._respond(agent, llm_request)
+        reply_text = part.text or json.dumps(part.function_call.args or {}, default=str)
+        prompt_tokens = estimate_tokens(_request_text(llm_request))
+        output_tokens = self.output_tokens or estimate_tokens(reply_text)
+
+        delay = self.latency + (output_tokens / self.tokens_per_second if self.tokens_per_second else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+
+        with self._lock:
+            self._stats["calls"] += 1
+            self._stats["tool_calls"] += part.function_call is not None
+            self._stats["prompt_tokens"] += prompt_tokens
+            self._stats["output_tokens"] += output_tokens
+
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[part]),
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=prompt_tokens,
+                candidates_token_count=output_tokens,
+                total_token_count=prompt_tokens + output_tokens,
+            ),
+            model_version=self.model,
+            turn_complete=True,
+        )
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    @staticmethod
+    def _agent_name(llm_request: LlmRequest) -> str:
+        instruction = str(llm_request.config.system_instruction or "") if llm_request.config else ""
+        match = _AGENT_NAME.search(instruction)
+        return match.group(1) if match else "agent"
+
+    def _respond(self, agent: str, llm_request: LlmRequest) -> types.Part:
+        last = llm_request.contents[-1] if llm_request.contents else None
+        tool_results = [p.function_response for p in (last.parts or []) if p.function_response] if last else []
+        user_text = next(
+            (p.text for content in reversed(llm_request.contents) if content.role == "user"
+             for p in (content.parts or []) if p.text),
+            "",
+        )
+        tools = list(llm_request.tools_dict)
+
+        for rule in self.rules:
+            if bool(rule.get("after_tool")) != bool(tool_results):
+                continue
+            if rule.get("agent") and not re.search(rule["agent"], agent):
+                continue
+            if rule.get("match") and not re.search(rule["match"], user_text, re.IGNORECASE):
+                continue
+            if "tool_call" in rule:
+                return types.Part.from_function_call(name=rule["tool_call"]["name"], args=rule["tool_call"].get("args", {}))
+            return types.Part.from_text(text=rule.get("text", ""))
+
+        if tool_results:
+            return types.Part.from_text(text=self._summarise(agent, tool_results))
+        call = self._choose_tool(agent, user_text, tools)
+        if call is not None:
+            name, args = call
+            return types.Part.from_function_call(name=name, args=args)
+        return types.Part.from_text(text=self._reply(agent, user_text))
+
+    @staticmethod
+    def _choose_tool(agent: str, text: str, tools: List[str]) -> Optional[tuple]:
+        if not tools:
+            return None
+        if "summarise_expanded_job_roles_tool" in tools:
+            match = _JOB_TITLE.search(text)
+            title = next((group for group in match.groups() if group), None) if match else None
+            location = _LOCATION.search(text)
+            return "summarise_expanded_job_roles_tool", {
+                "job_title": (title or text[:40] or "analyst").strip(),
+                "expanded_titles": [],
+                "location": location.group(1) if location else None,
+            }
+        lowered = text.lower()
+        for tool, keywords in _ROUTES:
+            if tool in tools and any(keyword in lowered for keyword in keywords):
+                return tool, ({} if tool == "get_motivational_quote" else {"request": text})
+        if agent == "workmatch_root_agent":
+            return None  # greetings and small talk get a text reply
+        # Coordinators delegate to their first sub-agent
+        return tools[0], {"request": text}
+
+    @staticmethod
+    def _summarise(agent: str, tool_results: List[types.FunctionResponse]) -> str:
+        lines = []
+        for result in tool_results:
+            response = result.response or {}
+            if "total_listings_found" in response:
+                lines.append(
+                    f"**📋 Jobs** — found {response['total_listings_found']} listings across "
+                    f"{response.get('total_titles_found', 0)} titles for {response.get('job_title', 'your search')}."
+                )
+            else:
+                text = str(response.get("result", response))
+                lines.append(f"**{result.name}** — {text[:200]}")
+        return f"[{agent}] " + "\n".join(lines)
+
+    @staticmethod
+    def _reply(agent: str, text: str) -> str:
+        if "title_variants" in agent:
+            title = text.strip().strip(".") or "analyst"
+            return json.dumps([title, f"senior {title}", f"junior {title}", f"{title} lead"])
+        return (
+            f"[{agent}] Here is some guidance on: {text[:120]}\n\n"
+            "**User Commands (choose one):**\n1. **Find jobs**\n2. **Return to main menu**"
+        )
+
+
+_fake_llm: Optional[FakeGeminiLlm] = None
+_fake_llm_lock = threading.Lock()
+
+
+def get_fake_llm() -> FakeGeminiLlm:
+    """
+    The shared fake model, configured from WORKMATCH_FAKE_LLM_LATENCY,
+    WORKMATCH_FAKE_LLM_TOKENS_PER_SECOND, WORKMATCH_FAKE_LLM_OUTPUT_TOKENS
+    and WORKMATCH_FAKE_LLM_SCRIPT.
+    """
+    global _fake_llm
+    with _fake_llm_lock:
+        if _fake_llm is None:
+            rules: List[Dict[str, Any]] = []
+            script = os.getenv("WORKMATCH_FAKE_LLM_SCRIPT")
+            if script:
+                with open(script, encoding="utf-8") as f:
+                    rules = json.load(f)
+            _fake_llm = FakeGeminiLlm(
+                latency=get_env_float("WORKMATCH_FAKE_LLM_LATENCY", 0.0),
+                tokens_per_second=get_env_float("WORKMATCH_FAKE_LLM_TOKENS_PER_SECOND", 0.0),
+                output_tokens=get_env_int("WORKMATCH_FAKE_LLM_OUTPUT_TOKENS", 0),
+                rules=rules,
+            )
+            logger.info(f"[fake_llm] Using offline fake model ({len(rules)} script rules)")
+        return _fake_llm
@@ -0,0 +1,245 @@
+import json
+import time
+import sqlite3
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LISTING_FIELDS = (
+    "id",
+    "title",
+    "company",
+    "location",
+    "employment_type",
+    "salary",
+    "description_snippet",
+    "url",
+    "salary_min",
+    "salary_max",
+    "salary_is_predicted",
+)
+
+# Columns added after the first release; older databases gain them on open
+NUMERIC_COLUMNS = {"salary_min": "REAL", "salary_max": "REAL", "salary_is_predicted": "INTEGER"}
+
+# Filters a stored, broader query can be narrowed by locally (Adzuna param -> listing column)
+NARROWABLE_FILTERS = {"where": "location", "company": "company"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    company TEXT,
+    location TEXT,
+    employment_type TEXT,
+    salary TEXT,
+    description_snippet TEXT,
+    url TEXT,
+    salary_min REAL,
+    salary_max REAL,
+    salary_is_predicted INTEGER,
+    query_key TEXT,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_listings_title ON listings (title COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_listings_company ON listings (company COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_listings_location ON listings (location COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_listings_fetched_at ON listings (fetched_at);
+
+CREATE TABLE IF NOT EXISTS queries (
+    query_key TEXT PRIMARY KEY,
+    what TEXT,
+    country TEXT,
+    params TEXT NOT NULL,
+    result_count INTEGER NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_queries_what ON queries (country, what, fetched_at);
+
+CREATE TABLE IF NOT EXISTS query_results (
+    query_key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    listing_id TEXT NOT NULL,
+    PRIMARY KEY (query_key, position)
+);
+"""
+
+
+class ListingStore:
+    """
+    Persistent SQLite (WAL mode) store of every JobListing the Adzuna client
+    has fetched, upserted by listing `id`, plus the query that found each
+    batch and when. Several workers can share one database file.
+
+    `lookup()` answers a repeated query from local data while it is fresh;
+    `lookup_narrowed()` answers a page-1 query that only adds a location or
+    company filter to a fresh, broader stored query.
+    """
+
+    def __init__(self, path: str, max_age: float = 3600.0):
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            existing = {row["name"] for row in self._conn.execute("PRAGMA table_info(listings)")}
+            for column, kind in NUMERIC_COLUMNS.items():
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE listings ADD COLUMN {column} {kind}")
+        self.hits = 0
+        self.narrowed_hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @staticmethod
+    def _key_text(query: Dict[str, Any]) -> str:
+        return json.dumps(sorted(query.items()), separators=(",", ":"), default=str)
+
+    def save(self, query: Dict[str, Any], listings: Iterable[Dict[str, Any]], fetched_at: Optional[float] = None) -> None:
+        """Upserts `listings` and records them, in order, as the result of `query`."""
+        fetched_at = fetched_at or time.time()
+        key = self._key_text(query)
+        listings = [listing for listing in listings if listing.get("id")]
+        rows = [
+            tuple(listing.get(field, None if field in NUMERIC_COLUMNS else "") for field in LISTING_FIELDS)
+            + (key, fetched_at)
+            for listing in listings
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"""
+                INSERT INTO listings ({", ".join(LISTING_FIELDS)}, query_key, fetched_at)
+                VALUES ({", ".join("?" * (len(LISTING_FIELDS) + 2))})
+                ON CONFLICT(id) DO UPDATE SET
+                    {", ".join(f"{field} = excluded.{field}" for field in LISTING_FIELDS[1:])},
+                    query_key = excluded.query_key,
+                    fetched_at = excluded.fetched_at
+                """,
+                rows,
+            )
+            self._conn.execute("DELETE FROM query_results WHERE query_key = ?", (key,))
+            self._conn.executemany(
+                "INSERT INTO query_results (query_key, position, listing_id) VALUES (?, ?, ?)",
+                [(key, position, listing["id"]) for position, listing in enumerate(listings)],
+            )
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO queries (query_key, what, country, params, result_count, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (key, query.get("what"), query.get("country"), json.dumps(query, default=str), len(listings), fetched_at),
+            )
+            self.writes += 1
+
+    def _results_for(self, key: str, filters: Dict[str, str], limit: int) -> List[Dict[str, Any]]:
+        clauses = "".join(f" AND l.{column} LIKE ?" for column in filters)
+        rows = self._conn.execute(
+            f"""
+            SELECT {", ".join(f"l.{field}" for field in LISTING_FIELDS)}
+            FROM query_results q JOIN listings l ON l.id = q.listing_id
+            WHERE q.query_key = ?{clauses}
+            ORDER BY q.position
+            LIMIT ?
+            """,
+            (key, *(f"%{value}%" for value in filters.values()), limit),
+        ).fetchall()
+        results = [dict(row) for row in rows]
+        for listing in results:
+            listing["salary_is_predicted"] = bool(listing["salary_is_predicted"])
+        return results
+
+    def lookup(self, query: Dict[str, Any], limit: int, max_age: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+        """Stored results for exactly this query, if fetched within `max_age` seconds."""
+        key = self._key_text(query)
+        oldest = time.time() - (self.max_age if max_age is None else max_age)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at FROM queries WHERE query_key = ? AND fetched_at >= ?", (key, oldest)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return self._results_for(key, {}, limit)
+
+    def lookup_narrowed(self, query: Dict[str, Any], limit: int, max_age: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Answers a page-1 query carrying `where`/`company` filters from a fresh
+        stored query that is identical except for having none of those filters,
+        by filtering its listings locally. Only returns if at least `limit`
+        stored listings match, since fewer could mean Adzuna has more.
+        """
+        narrowing = {name: query[name] for name in NARROWABLE_FILTERS if query.get(name)}
+        if query.get("page") != 1 or not narrowing:
+            return None
+        ignored = {"results_per_page", *NARROWABLE_FILTERS}
+        wanted = {name: value for name, value in query.items() if name not in ignored}
+        oldest = time.time() - (self.max_age if max_age is None else max_age)
+
+        with self._lock:
+            candidates = self._conn.execute(
+                """
+                SELECT query_key, params FROM queries
+                WHERE country = ? AND what = ? AND fetched_at >= ?
+                ORDER BY result_count DESC
+                """,
+                (query.get("country"), query.get("what"), oldest),
+            ).fetchall()
+            for candidate in candidates:
+                params = json.loads(candidate["params"])
+                if any(params.get(name) for name in NARROWABLE_FILTERS):
+                    continue
+                if {name: value for name, value in params.items() if name not in ignored} != wanted:
+                    continue
+                filters = {NARROWABLE_FILTERS[name]: value for name, value in narrowing.items()}
+                results = self._results_for(candidate["query_key"], filters, limit)
+                if len(results) >= limit:
+                    self.narrowed_hits += 1
+                    return results
+        return None
+
+    def title_pairs(self, limit: int = 50000) -> List[Tuple[str, str]]:
+        """(searched title, listing title) for stored results, most recent queries first."""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT q.what, l.title
+                FROM queries q
+                JOIN query_results r ON r.query_key = q.query_key
+                JOIN listings l ON l.id = r.listing_id
+                WHERE q.what IS NOT NULL AND q.what != ''
+                ORDER BY q.fetched_at DESC
+                LIMIT ?
+                """,
+                (limit,),
+            ).fetchall()
+        return [(row[0], row[1]) for row in rows]
+
+    def purge(self, older_than: float) -> int:
+        """Deletes listings and queries fetched more than `older_than` seconds ago."""
+        cutoff = time.time() - older_than
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM query_results WHERE query_key IN (SELECT query_key FROM queries WHERE fetched_at < ?)",
+                (cutoff,),
+            )
+            self._conn.execute("DELETE FROM queries WHERE fetched_at < ?", (cutoff,))
+            return self._conn.execute("DELETE FROM listings WHERE fetched_at < ?", (cutoff,)).rowcount
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "narrowed_hits": self.narrowed_hits,
+            "misses": self.misses,
+            "writes": self.writes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,63 @@
+from typing import Any, Dict, List, Sequence
+
+from workmatch.utils.adzuna import JobListing
+
+# Columns sent to the LLM, in order. `id` is left out: the model never needs it.
+TABLE_COLUMNS = (
+    "title",
+    "company",
+    "location",
+    "employment_type",
+    "salary",
+    "description_snippet",
+    "url",
+)
+
+
+def pack_listings(
+    listings_by_title: Dict[str, List[JobListing]],
+    sample: Sequence[JobListing],
+) -> Dict[str, Any]:
+    """
+    Token-lean, table-style form of the tool's listings: each listing is
+    stored once as a row under shared column names, and `listings_by_title`
+    and `all_listings` refer to rows by index instead of repeating them.
+    `country` and `matched_titles` columns are only added when some listing has one.
+    """
+    columns = list(TABLE_COLUMNS)
+    if any(listing.get("country") for listings in listings_by_title.values() for listing in listings):
+        columns.append("country")
+    if any(listing.get("matched_titles") for listings in listings_by_title.values() for listing in listings):
+        columns.append("matched_titles")
+
+    rows: List[List[Any]] = []
+    row_of: Dict[int, int] = {}
+
+    def index(listing: JobListing) -> int:
+        if id(listing) not in row_of:
+            row_of[id(listing)] = len(rows)
+            rows.append([listing.get(column, "") for column in columns])
+        return row_of[id(listing)]
+
+    return {
+        "listing_columns": columns,
+        "listing_rows": rows,
+        "listings_by_title": {
+            title: [index(listing) for listing in listings]
+            for title, listings in listings_by_title.items()
+        },
+        "all_listings": [index(listing) for listing in sample],
+    }
+
+
+def unpack_listings(packed: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of pack_listings(): rebuilds `listings_by_title` and `all_listings` as dicts."""
+    columns = packed["listing_columns"]
+    listings = [dict(zip(columns, row)) for row in packed["listing_rows"]]
+    return {
+        "listings_by_title": {
+            title: [listings[i] for i in indices]
+            for title, indices in packed["listings_by_title"].items()
+        },
+        "all_listings": [listings[i] for i in packed["all_listings"]],
+    }
@@ -0,0 +1,94 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from workmatch.utils.adzuna import COUNTRY_CURRENCY_SYMBOLS, JobListing
+
+# Entries kept in the top locations / employers lists
+TOP_N = 5
+
+
+def listing_salary(listing: JobListing) -> Optional[float]:
+    """One annual salary per listing: the midpoint of min and max, or whichever is set."""
+    s_min, s_max = listing.get("salary_min"), listing.get("salary_max")
+    if s_min and s_max:
+        return (s_min + s_max) / 2
+    return s_min or s_max or None
+
+
+def _top(values: np.ndarray, n: int = TOP_N) -> Dict[str, int]:
+    names, counts = np.unique(values[values != "N/A"], return_counts=True)
+    order = np.lexsort((names, -counts))[:n]  # most common first, ties by name
+    return {str(names[i]): int(counts[i]) for i in order}
+
+
+def _salary_summary(values: np.ndarray, country: str) -> Dict[str, Any]:
+    low, median, p90 = np.percentile(values, [0, 50, 90])
+    return {
+        "count": int(values.size),
+        "min": int(round(low)),
+        "median": int(round(median)),
+        "p90": int(round(p90)),
+        "currency": COUNTRY_CURRENCY_SYMBOLS.get(country, ""),
+    }
+
+
+def _predicted_vs_listed(salaries: np.ndarray, predicted: np.ndarray) -> Dict[str, Any]:
+    has_salary = ~np.isnan(salaries)
+    estimated = salaries[has_salary & predicted]
+    advertised = salaries[has_salary & ~predicted]
+    ratio = None
+    if estimated.size and advertised.size:
+        ratio = round(float(np.median(estimated) / np.median(advertised)), 2)
+    return {"predicted": int(estimated.size), "listed": int(advertised.size), "median_ratio": ratio}
+
+
+def market_stats(listings_by_title: Dict[str, List[JobListing]], countries: Sequence[str]) -> Dict[str, Any]:
+    """
+    Aggregates over every fetched listing, so the model can quote pay and
+    market figures without reading each listing: per-title min / median /
+    p90 salary, employment-type mix, top locations and employers, and how
+    Adzuna's predicted salaries compare with advertised ones.
+
+    Salaries are never mixed across currencies: with several countries the
+    salary and predicted-vs-listed figures are given per country.
+    """
+    listings = [listing for title_listings in listings_by_title.values() for listing in title_listings]
+    if not listings:
+        return {"listings_analysed": 0}
+
+    titles = np.array([title for title, title_listings in listings_by_title.items() for _ in title_listings])
+    listing_countries = np.array([listing.get("country", countries[0]) for listing in listings])
+    salaries = np.array([listing_salary(listing) or np.nan for listing in listings], dtype=float)
+    predicted = np.array([bool(listing.get("salary_is_predicted")) for listing in listings])
+    has_salary = ~np.isnan(salaries)
+    several_countries = len(countries) > 1
+
+    salary_by_title: Dict[str, Dict[str, Any]] = {}
+    for title in listings_by_title:
+        for country in countries:
+            values = salaries[(titles == title) & (listing_countries == country) & has_salary]
+            if values.size:
+                key = f"{title} ({country})" if several_countries else title
+                salary_by_title[key] = _salary_summary(values, country)
+
+    kinds, kind_counts = np.unique(
+        np.array([listing.get("employment_type", "") for listing in listings]), return_counts=True
+    )
+    if several_countries:
+        predicted_vs_listed = {
+            country: _predicted_vs_listed(salaries[listing_countries == country], predicted[listing_countries == country])
+            for country in countries
+        }
+    else:
+        predicted_vs_listed = _predicted_vs_listed(salaries, predicted)
+
+    return {
+        "listings_analysed": len(listings),
+        "listings_with_salary": int(has_salary.sum()),
+        "salary_by_title": salary_by_title,
+        "employment_mix": {str(kind): round(float(count / len(listings)), 2) for kind, count in zip(kinds, kind_counts)},
+        "top_locations": _top(np.array([listing.get("location", "N/A") for listing in listings])),
+        "top_employers": _top(np.array([listing.get("company", "N/A") for listing in listings])),
+        "predicted_vs_listed": predicted_vs_listed,
+    }
@@ -0,0 +1,67 @@
+import json
+import base64
+import random
+import hashlib
+import logging
+import binascii
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+CURSOR_VERSION = 1
+
+
+def normalise_title(title: str) -> str:
+    return " ".join(title.lower().split())
+
+
+def encode_cursor(pages: Dict[str, int], page_number: int, search_id: Optional[str] = None) -> str:
+    """
+    Opaque pagination cursor: the next Adzuna page to request for each
+    (normalised) title, 0 for titles with no more results, plus the number of
+    the page just served and, optionally, an id shared by every page of the
+    search (`q`).
+    """
+    payload = {"v": CURSOR_VERSION, "n": page_number, "p": pages}
+    if search_id:
+        payload["q"] = search_id
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _valid_cursor(payload: Any) -> bool:
+    """True if `payload` has the shape encode_cursor() produces."""
+    if not isinstance(payload, dict) or payload.get("v") != CURSOR_VERSION:
+        return False
+    pages = payload.get("p")
+    return (
+        isinstance(pages, dict)
+        and all(isinstance(slot, str) and _is_int(page) and page >= 0 for slot, page in pages.items())
+        and _is_int(payload.get("n")) and payload["n"] >= 0
+        and isinstance(payload.get("q", ""), str)
+    )
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Inverse of encode_cursor(); returns None for a missing or malformed cursor."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not _valid_cursor(payload):
+            raise ValueError("unsupported cursor")
+        return payload
+    except (ValueError, binascii.Error) as e:
+        logger.warning(f"[pagination] Ignoring invalid cursor {cursor[:40]!r}: {e}")
+        return None
+
+
+def seeded_rng(seed: str, parts: Iterable[Any]) -> random.Random:
+    """A Random seeded from `seed` plus the query parts, stable across processes and restarts."""
+    material = "|".join([seed, *(json.dumps(part, sort_keys=True, default=str) for part in parts)])
+    return random.Random(int.from_bytes(hashlib.sha256(material.encode()).digest()[:8], "big"))
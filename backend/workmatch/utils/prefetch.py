@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from workmatch.utils.adzuna import AsyncAdzunaAPI, JobListing, get_async_adzuna_api
+from workmatch.utils.cache import TTLCache, MISS
+from workmatch.utils.env import get_env_bool, get_env_float, get_env_int
+
+logger = logging.getLogger(__name__)
+
+# Defaults for WORKMATCH_PREFETCH_TTL / _CONCURRENCY / _MIN_HEADROOM / _MAX_ENTRIES
+DEFAULT_PREFETCH_TTL = 120.0
+DEFAULT_PREFETCH_CONCURRENCY = 2
+DEFAULT_PREFETCH_MIN_HEADROOM = 2.0
+DEFAULT_PREFETCH_MAX_ENTRIES = 256
+
+
+class Prefetcher:
+    """
+    Speculatively fetches the next results page for searches that were just
+    served, and parks the listings in a short-lived cache until a "next
+    page" request takes them.
+
+    Prefetching is best-effort: it runs in background tasks, at most
+    `concurrency` at a time, and is skipped whenever the Adzuna quota has
+    fewer than `min_headroom` tokens to spare or the circuit breaker is not
+    closed, so it never delays user-initiated searches.
+    """
+
+    def __init__(
+        self,
+        api: AsyncAdzunaAPI,
+        ttl: float = DEFAULT_PREFETCH_TTL,
+        concurrency: int = DEFAULT_PREFETCH_CONCURRENCY,
+        min_headroom: float = DEFAULT_PREFETCH_MIN_HEADROOM,
+        max_entries: int = DEFAULT_PREFETCH_MAX_ENTRIES,
+    ):
+        self.api = api
+        self.concurrency = max(1, concurrency)
+        self.min_headroom = min_headroom
+        self._parked = TTLCache(max_entries=max_entries, ttl=ttl, stale_ttl=0)
+        self._pending: set = set()
+        self._tasks: set = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.scheduled = 0
+        self.skipped = 0
+        self.completed = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _has_budget(self) -> bool:
+        return (
+            self.api.rate_limiter.headroom() >= self.min_headroom
+            and self.api.breaker.state == self.api.breaker.CLOSED
+        )
+
+    def schedule(self, searches: Iterable[Dict[str, Any]]) -> None:
+        """Starts background fetches for `searches` (AsyncAdzunaAPI.search_jobs kwargs)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._pending.clear()
+            self._loop = loop
+        for search in searches:
+            key = self.api.search_key(**search)
+            if key in self._pending or self._parked.peek(key) is not None:
+                continue
+            self._pending.add(key)
+            self.scheduled += 1
+            task = loop.create_task(self._prefetch(key, search))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _prefetch(self, key, search: Dict[str, Any]) -> None:
+        try:
+            async with self._semaphore:
+                if not self._has_budget():
+                    self.skipped += 1
+                    return
+                response = await self.api.search_jobs(**search)
+                if "error" in response:
+                    # A failed page must not later pass for an empty one
+                    logger.warning(f"[prefetch] Prefetch of {search.get('what')!r} page {search.get('page')} failed: {response['error']}")
+                    return
+                self._parked.set(key, response["results"])
+                self.completed += 1
+        except Exception as e:
+            logger.warning(f"[prefetch] Prefetch of {search.get('what')!r} page {search.get('page')} failed: {e}")
+        finally:
+            self._pending.discard(key)
+
+    def take(self, search: Dict[str, Any]) -> Optional[List[JobListing]]:
+        """Returns (and removes) prefetched listings for `search`, or None."""
+        key = self.api.search_key(**search)
+        listings, state = self._parked.get(key)
+        if state == MISS:
+            if search.get("page", 1) > 1:
+                self.misses += 1
+            return None
+        self._parked.discard(key)
+        self.hits += 1
+        return [dict(listing) for listing in listings]
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "scheduled": self.scheduled,
+            "skipped_no_budget": self.skipped,
+            "completed": self.completed,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "wasted": max(self.completed - self.hits, 0),
+        }
+
+
+_prefetcher: Optional[Prefetcher] = None
+_prefetcher_lock = threading.Lock()
+
+
+def get_prefetcher() -> Optional[Prefetcher]:
+    """The shared Prefetcher, or None unless WORKMATCH_PREFETCH=true."""
+    global _prefetcher
+    if not get_env_bool("WORKMATCH_PREFETCH"):
+        return None
+    try:
+        api = get_async_adzuna_api()
+    except ValueError as e:
+        logger.warning(f"[prefetch] Disabled: {e}")
+        return None
+    with _prefetcher_lock:
+        if _prefetcher is None or _prefetcher.api is not api:
+            _prefetcher = Prefetcher(
+                api,
+                ttl=get_env_float("WORKMATCH_PREFETCH_TTL", DEFAULT_PREFETCH_TTL),
+                concurrency=get_env_int("WORKMATCH_PREFETCH_CONCURRENCY", DEFAULT_PREFETCH_CONCURRENCY),
+                min_headroom=get_env_float("WORKMATCH_PREFETCH_MIN_HEADROOM", DEFAULT_PREFETCH_MIN_HEADROOM),
+                max_entries=get_env_int("WORKMATCH_PREFETCH_MAX_ENTRIES", DEFAULT_PREFETCH_MAX_ENTRIES),
+            )
+        return _prefetcher
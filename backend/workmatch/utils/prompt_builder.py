@@ -0,0 +1,60 @@
+import re
+import logging
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+# What ADK treats as a session-state placeholder in a string instruction
+_PLACEHOLDER = re.compile(r"\{+[^{}]*\}+")
+
+
+class PromptBuilder:
+    """
+    Composes agent instructions from shared fragments.
+
+    Fragments are registered once, in the order they always appear. An
+    instruction is the `always` fragments plus the ones the agent asks for,
+    in registration order, followed by the agent's own text. Agents that
+    share their opening fragments therefore send a byte-identical prefix,
+    which the model can serve from its prefix cache.
+    """
+
+    SEPARATOR = "\n\n---\n\n"
+
+    def __init__(self):
+        self._fragments: Dict[str, str] = {}
+        self._always: List[str] = []
+
+    def fragment(self, name: str, text: str, always: bool = False) -> str:
+        """Registers a shared fragment and returns its name."""
+        if name in self._fragments:
+            raise ValueError(f"Prompt fragment '{name}' is already registered")
+        # State placeholders would make the shared text differ between sessions
+        if _PLACEHOLDER.search(text):
+            raise ValueError(f"Prompt fragment '{name}' contains a {{placeholder}}")
+        self._fragments[name] = text.strip()
+        if always:
+            self._always.append(name)
+        return name
+
+    def fragments(self) -> Dict[str, str]:
+        return dict(self._fragments)
+
+    def build(self, body: str, *uses: str) -> str:
+        """The instruction for an agent: shared fragments (fixed order), then `body`."""
+        unknown = [name for name in uses if name not in self._fragments]
+        if unknown:
+            raise KeyError(f"Unknown prompt fragments: {unknown}")
+        wanted = set(self._always).union(uses)
+        parts = [text for name, text in self._fragments.items() if name in wanted]
+        return self.SEPARATOR.join([*parts, body.strip()]) + "\n"
+
+    def shared_prefix(self, instruction: str) -> str:
+        """The leading run of shared fragments in `instruction` ("" if it doesn't open with one)."""
+        shared = set(self._fragments.values())
+        prefix = ""
+        for part in instruction.split(self.SEPARATOR):
+            if part not in shared:
+                break
+            prefix += part + self.SEPARATOR
+        return prefix
@@ -0,0 +1,211 @@
+import time
+import asyncio
+import threading
+from typing import Callable, Dict, Optional
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request would have to queue longer than the limiter's max wait."""
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled at `rate` tokens/second up to `capacity`.
+
+    `reserve()` always takes a token and returns how long the caller must wait
+    before using it. The balance may go negative, so concurrent callers queue
+    up in arrival order instead of racing for the next token.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("TokenBucket rate and capacity must be positive.")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def cancel(self, tokens: float = 1.0) -> None:
+        """Returns a reservation that will not be used."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill(self._clock())
+            return self._tokens
+
+
+class QuotaLimiter:
+    """
+    Per-second and (optional) per-day token buckets for one API quota. A request
+    takes a token from each bucket and waits for the later of the two; if that
+    wait would exceed `max_wait`, the reservation is returned and
+    RateLimitExceeded is raised instead.
+    """
+
+    def __init__(
+        self,
+        per_second: float,
+        burst: Optional[float] = None,
+        per_day: Optional[int] = None,
+        max_wait: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.second_bucket = TokenBucket(per_second, burst or max(1.0, per_second), clock=clock)
+        self.day_bucket = TokenBucket(per_day / 86400.0, per_day, clock=clock) if per_day else None
+        self.per_day = per_day
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self.granted = 0
+        self.delayed = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+
+    def reserve(self) -> float:
+        """Reserves one request and returns the seconds to wait before sending it."""
+        wait = self.second_bucket.reserve()
+        if self.day_bucket is not None:
+            wait = max(wait, self.day_bucket.reserve())
+        with self._lock:
+            if wait > self.max_wait:
+                self.rejected += 1
+                self.release()
+                raise RateLimitExceeded(f"Adzuna quota exhausted; next slot in {wait:.1f}s")
+            self.granted += 1
+            if wait > 0:
+                self.delayed += 1
+                self.wait_seconds += wait
+        return wait
+
+    def release(self) -> None:
+        """Returns a reservation that will not be used."""
+        self.second_bucket.cancel()
+        if self.day_bucket is not None:
+            self.day_bucket.cancel()
+
+    async def acquire_async(self) -> None:
+        """Non-blocking reservation for asyncio callers; a cancelled wait gives its token back."""
+        wait = self.reserve()
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.release()
+                raise
+
+    def headroom(self) -> float:
+        """Tokens available right now in the tighter bucket (negative when requests are queued)."""
+        available = self.second_bucket.available
+        if self.day_bucket is not None:
+            available = min(available, self.day_bucket.available)
+        return available
+
+    def stats(self) -> Dict[str, float]:
+        stats = {
+            "per_second": self.second_bucket.rate,
+            "second_tokens": round(self.second_bucket.available, 2),
+            "granted": self.granted,
+            "delayed": self.delayed,
+            "rejected": self.rejected,
+            "wait_seconds": round(self.wait_seconds, 3),
+        }
+        if self.day_bucket is not None:
+            stats["per_day"] = self.per_day
+            stats["day_tokens"] = round(self.day_bucket.available, 2)
+            stats["day_used_pct"] = round(100 * (1 - max(self.day_bucket.available, 0) / self.per_day), 1)
+        return stats
+
+
+class AIMDController:
+    """
+    Additive-increase / multiplicative-decrease concurrency limit. Each
+    success below `latency_target` grows the limit by about one per window of
+    `limit` requests; a throttle (HTTP 429) or a slow response shrinks it by
+    `backoff`, at most once per `cooldown` seconds.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        minimum: int = 1,
+        latency_target: float = 2.0,
+        backoff: float = 0.5,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maximum = max(1, maximum)
+        self.minimum = max(1, min(minimum, self.maximum))
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.cooldown = cooldown
+        self._clock = clock
+        self._limit = float(self.maximum)
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def on_success(self, latency: float) -> None:
+        if latency > self.latency_target:
+            self.on_overload()
+            return
+        with self._lock:
+            if self._limit < self.maximum:
+                self._limit = min(self.maximum, self._limit + 1.0 / max(self._limit, 1.0))
+                self.increases += 1
+
+    def on_overload(self) -> None:
+        with self._lock:
+            now = self._clock()
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            self._limit = max(float(self.minimum), self._limit * self.backoff)
+            self.decreases += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "limit": self.limit,
+            "max": self.maximum,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
+
+class AsyncConcurrencyLimiter:
+    """Slot gate whose size follows an AIMDController; must be created inside its event loop."""
+
+    def __init__(self, controller: AIMDController):
+        self.controller = controller
+        self.in_flight = 0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < self.controller.limit)
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+        return False
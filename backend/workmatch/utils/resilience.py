@@ -0,0 +1,146 @@
+import time
+import random
+import logging
+import threading
+from typing import Callable, Dict
+
+from workmatch.utils.tracing import record_span_event
+
+logger = logging.getLogger(__name__)
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for idempotent requests: the wait
+    before retry n is uniform in [0, min(max_delay, base_delay * 2**(n-1))].
+    `attempts` counts the first try, so attempts=3 means up to two retries.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        base_delay: float = 0.2,
+        max_delay: float = 2.0,
+        rng: Callable[[], float] = random.random,
+    ):
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._rng = rng
+        self.retries = 0
+
+    def should_retry(self, attempt: int) -> bool:
+        return attempt < self.attempts
+
+    def delay(self, attempt: int) -> float:
+        self.retries += 1
+        return self._rng() * min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+
+
+class CircuitBreaker:
+    """
+    Classic three-state circuit breaker.
+
+    CLOSED: calls flow; `failure_threshold` consecutive failures open it.
+    OPEN: calls are refused for `reset_timeout` seconds.
+    HALF_OPEN: a single probe call is let through; success closes the
+    circuit, failure opens it again for another cool-down. A probe that
+    ends with neither (e.g. it was cancelled) must call `release()`; a probe
+    that never reports back is given up on after `reset_timeout`.
+
+    State changes are logged and recorded as OTEL span events.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+        self.rejected = 0
+        self.transitions = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _transition(self, new_state: str) -> None:
+        old_state, self._state = self._state, new_state
+        self.transitions += 1
+        logger.warning(f"[breaker] {self.name}: {old_state} -> {new_state} (failures={self._failures})")
+        record_span_event(
+            "circuit_breaker.state_change",
+            {
+                "breaker.name": self.name,
+                "breaker.from": old_state,
+                "breaker.to": new_state,
+                "breaker.failures": self._failures,
+            },
+        )
+
+    def _maybe_half_open(self) -> None:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._probe_in_flight = False
+            self._transition(self.HALF_OPEN)
+
+    def allow(self) -> bool:
+        """True if a call may proceed now; in HALF_OPEN only one probe is allowed at a time."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and (
+                not self._probe_in_flight or self._clock() - self._probe_started >= self.reset_timeout
+            ):
+                self._probe_in_flight = True
+                self._probe_started = self._clock()
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._probe_in_flight = False
+            if self._state != self.CLOSED:
+                self._transition(self.CLOSED)
+
+    def release(self) -> None:
+        """A call let through by allow() ended without a success or failure to report."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._opened_at = self._clock()
+                self._transition(self.OPEN)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "rejected": self.rejected,
+            "transitions": self.transitions,
+        }
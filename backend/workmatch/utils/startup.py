@@ -0,0 +1,45 @@
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Union
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """
+    Records how long each startup step (module import, env loading, tracer
+    set-up, agent build) took, in the order the steps finished.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._steps: List[Dict[str, Union[str, float]]] = []
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._steps.append({"step": name, "seconds": round(elapsed, 4)})
+            logger.debug(f"[startup] {name}: {elapsed * 1000:.1f} ms")
+
+    def steps(self) -> List[Dict[str, Union[str, float]]]:
+        with self._lock:
+            return list(self._steps)
+
+    def report(self) -> str:
+        """The recorded steps as an aligned text table, slowest first."""
+        steps = sorted(self.steps(), key=lambda step: -step["seconds"])
+        width = max((len(step["step"]) for step in steps), default=4)
+        lines = [f"{'step':<{width}}  {'ms':>9}"]
+        lines += [f"{step['step']:<{width}}  {step['seconds'] * 1000:>9.1f}" for step in steps]
+        lines.append(f"{'total':<{width}}  {sum(step['seconds'] for step in steps) * 1000:>9.1f}")
+        return "\n".join(lines)
+
+
+startup_timer = StartupTimer()
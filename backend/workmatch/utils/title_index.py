@@ -0,0 +1,268 @@
+import os
+import re
+import json
+import logging
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from workmatch.utils.adzuna import get_listing_store
+from workmatch.utils.env import get_env_bool, get_env_float, get_env_int
+from workmatch.utils.title_variant_cache import DEFAULT_SEED_PATH, get_title_variant_cache, title_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_VARIANTS = 5
+DEFAULT_MIN_SCORE = 0.3
+# Memory bounds: observed titles kept (curated ones are always kept), and neighbours kept per title
+DEFAULT_MAX_TITLES = 20000
+DEFAULT_MAX_NEIGHBOURS = 50
+# Evidence weights: a curated pairing counts as much as five sightings in search results
+SEED_WEIGHT = 5.0
+OBSERVED_WEIGHT = 1.0
+# Pseudo-count in score = weight / (weight + PRIOR): one sighting scores 0.25, a curated pair 0.63
+PRIOR = 3.0
+# Listing titles longer than this are descriptions, not titles
+MAX_TITLE_WORDS = 6
+# An unknown title borrows the neighbours of known titles sharing this share of its words
+MIN_TOKEN_OVERLAP = 0.5
+
+# Advert noise after the title proper: "Data Analyst - Remote", "Nurse (Band 5)", "Chef | Live-in"
+_TRAILER = re.compile(r"\s+[-–|:]\s+.*$|\s*[(\[,].*$")
+_NON_WORD = re.compile(r"[^\w+#/&]+")
+
+
+def clean_title(title: str) -> str:
+    """Listing or query title cut down to the job title itself, in its original case ("" if unusable)."""
+    title = _TRAILER.sub("", title or "").strip()
+    words = _NON_WORD.sub(" ", title).split()
+    return " ".join(words) if 0 < len(words) <= MAX_TITLE_WORDS else ""
+
+
+def title_tokens(title: str) -> Set[str]:
+    return set(title.lower().split())
+
+
+class TitleIndex:
+    """
+    Offline job-title synonym index. Titles that appear together (a curated
+    variant group, or a query and the listing titles it returned) gain
+    co-occurrence weight; a token index maps words to known titles so a new
+    phrasing borrows the neighbours of known titles that share its words.
+
+    `expand()` ranks variants by confidence in [0, 1) and returns [] for a
+    title it knows nothing about, so callers can fall back to the LLM.
+
+    Observed titles beyond `max_titles` are evicted least recently seen
+    first (curated titles are kept). A title's neighbours are pruned back
+    to its `max_neighbours` strongest once it has twice that many, so new
+    pairings get a chance to build up weight before pruning.
+    """
+
+    def __init__(self, max_titles: int = DEFAULT_MAX_TITLES, max_neighbours: int = DEFAULT_MAX_NEIGHBOURS):
+        self.max_titles = max(1, max_titles)
+        self.max_neighbours = max(1, max_neighbours)
+        self._lock = threading.Lock()
+        self._neighbours: Dict[str, Counter] = defaultdict(Counter)
+        self._display: Dict[str, str] = {}
+        self._by_token: Dict[str, Set[str]] = defaultdict(set)
+        self._curated: Set[str] = set()
+        self._recent: "OrderedDict[str, None]" = OrderedDict()  # observed titles, least recently seen first
+        self.evicted = 0
+
+    def _intern(self, title: str, curated: bool = False) -> Optional[str]:
+        cleaned = clean_title(title)
+        if not cleaned:
+            return None
+        key = cleaned.lower()
+        if key not in self._display:
+            self._display[key] = cleaned
+            for token in title_tokens(key):
+                self._by_token[token].add(key)
+        if curated:
+            self._curated.add(key)
+            self._recent.pop(key, None)
+        elif key not in self._curated:
+            self._recent[key] = None
+            self._recent.move_to_end(key)
+        return key
+
+    def _link(self, a: str, b: str, weight: float) -> None:
+        if a != b:
+            for key, other in ((a, b), (b, a)):
+                self._neighbours[key][other] += weight
+                if len(self._neighbours[key]) > 2 * self.max_neighbours:
+                    self._prune(key)
+
+    def _prune(self, key: str) -> None:
+        """Keeps the `max_neighbours` strongest links of `key`."""
+        neighbours = self._neighbours[key]
+        kept = {other for other, _ in neighbours.most_common(self.max_neighbours)}
+        for other in [other for other in neighbours if other not in kept]:
+            del neighbours[other]
+            self._unlink(other, key)
+
+    def _unlink(self, key: str, other: str) -> None:
+        neighbours = self._neighbours.get(key)
+        if neighbours is not None:
+            neighbours.pop(other, None)
+            if not neighbours:
+                del self._neighbours[key]
+
+    def _evict(self) -> None:
+        """Forgets the least recently seen observed titles while over `max_titles`."""
+        while len(self._display) > self.max_titles and self._recent:
+            key, _ = self._recent.popitem(last=False)
+            del self._display[key]
+            for token in title_tokens(key):
+                titles = self._by_token.get(token)
+                if titles is not None:
+                    titles.discard(key)
+                    if not titles:
+                        del self._by_token[token]
+            for other in self._neighbours.pop(key, {}):
+                self._unlink(other, key)
+            self.evicted += 1
+
+    def add_group(self, titles: Iterable[str], weight: float = SEED_WEIGHT, curated: bool = True) -> None:
+        """
+        Links every pair of `titles` (e.g. a title and its variants). Curated
+        groups are never evicted; others (title_variants_agent expansions)
+        age out like observed titles.
+        """
+        with self._lock:
+            keys = [key for key in (self._intern(title, curated=curated) for title in titles) if key]
+            for i, a in enumerate(keys):
+                for b in keys[i + 1:]:
+                    self._link(a, b, weight)
+            if not curated:
+                self._evict()
+
+    def observe(self, query: str, listing_titles: Iterable[str], weight: float = OBSERVED_WEIGHT) -> None:
+        """Links a searched title with each distinct listing title its search returned."""
+        with self._lock:
+            anchor = self._intern(query)
+            if anchor is None:
+                return
+            for key in {self._intern(title) for title in listing_titles} - {None}:
+                self._link(anchor, key, weight)
+            self._evict()
+
+    def _anchors(self, key: str) -> Dict[str, float]:
+        if key in self._neighbours:
+            return {key: 1.0}
+        tokens = title_tokens(key)
+        candidates = set().union(*(self._by_token.get(token, set()) for token in tokens)) if tokens else set()
+        anchors = {}
+        for candidate in candidates:
+            other = title_tokens(candidate)
+            overlap = len(tokens & other) / len(tokens | other)
+            if overlap >= MIN_TOKEN_OVERLAP and self._neighbours.get(candidate):
+                anchors[candidate] = overlap
+        return anchors
+
+    def expand(self, title: str, k: int = DEFAULT_MAX_VARIANTS, min_score: float = DEFAULT_MIN_SCORE) -> List[Tuple[str, float]]:
+        """Up to `k` (variant, confidence) pairs scoring at least `min_score`, best first."""
+        cleaned = clean_title(title)
+        if not cleaned:
+            return []
+        key = cleaned.lower()
+        with self._lock:
+            scores: Dict[str, float] = {}
+            for anchor, overlap in self._anchors(key).items():
+                if anchor != key:
+                    scores[anchor] = max(scores.get(anchor, 0.0), overlap)
+                for neighbour, weight in self._neighbours.get(anchor, {}).items():
+                    score = overlap * weight / (weight + PRIOR)
+                    if neighbour != key and score > scores.get(neighbour, 0.0):
+                        scores[neighbour] = score
+            ranked = sorted(
+                ((self._display[candidate], round(score, 3)) for candidate, score in scores.items() if score >= min_score),
+                key=lambda item: -item[1],  # ties keep seed / first-seen order
+            )
+        return ranked[:k]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "titles": len(self._display),
+                "links": sum(len(neighbours) for neighbours in self._neighbours.values()) // 2,
+                "evicted": self.evicted,
+            }
+
+
+_title_index: Optional[TitleIndex] = None
+_title_index_lock = threading.Lock()
+
+
+def get_title_index() -> Optional[TitleIndex]:
+    """
+    The shared index, built on first use from the curated seed list
+    (WORKMATCH_TITLE_INDEX_SEED, default the title-variant cache seed), the
+    title_variants_agent expansions in the title-variant cache, and the
+    query/listing titles in the Adzuna listing store when one is configured;
+    None when WORKMATCH_TITLE_INDEX=false. Its size is capped by
+    WORKMATCH_TITLE_INDEX_MAX_TITLES and WORKMATCH_TITLE_INDEX_MAX_NEIGHBOURS.
+
+    Building reads files and SQLite, so call it from a worker thread
+    (asyncio.to_thread) when on the event loop.
+    """
+    global _title_index
+    if not get_env_bool("WORKMATCH_TITLE_INDEX", default=True):
+        return None
+    with _title_index_lock:
+        if _title_index is None:
+            index = TitleIndex(
+                max_titles=get_env_int("WORKMATCH_TITLE_INDEX_MAX_TITLES", DEFAULT_MAX_TITLES),
+                max_neighbours=get_env_int("WORKMATCH_TITLE_INDEX_MAX_NEIGHBOURS", DEFAULT_MAX_NEIGHBOURS),
+            )
+            seeded: Set[str] = set()
+            seed_path = os.getenv("WORKMATCH_TITLE_INDEX_SEED", DEFAULT_SEED_PATH)
+            if seed_path:
+                try:
+                    with open(seed_path, encoding="utf-8") as f:
+                        for title, variants in json.load(f).items():
+                            index.add_group([title, *variants])
+                            seeded.add(title_key(title))
+                except (OSError, ValueError) as e:
+                    logger.warning(f"[TitleIndex] Could not read seed list {seed_path}: {e}")
+
+            # Expansions the agent produced in earlier runs (the cache holds the seed list too)
+            cache = get_title_variant_cache()
+            if cache is not None:
+                for title, variants in cache.entries().items():
+                    if title_key(title) not in seeded:
+                        index.add_group([title, *variants], curated=False)
+
+            store = get_listing_store()
+            if store is not None:
+                seen: Dict[str, List[str]] = defaultdict(list)
+                for query, listing_title in store.title_pairs():
+                    seen[query].append(listing_title)
+                for query, listing_titles in seen.items():
+                    index.observe(query, listing_titles)
+
+            logger.info(f"[TitleIndex] Built index: {index.stats()}")
+            _title_index = index
+        return _title_index
+
+
+def expand_title(title: str) -> List[str]:
+    """Variants of `title` from the shared index (WORKMATCH_TITLE_INDEX_K / _MIN_SCORE); [] if it is unknown."""
+    index = get_title_index()
+    if index is None:
+        return []
+    return [
+        variant for variant, _ in index.expand(
+            title,
+            k=get_env_int("WORKMATCH_TITLE_INDEX_K", DEFAULT_MAX_VARIANTS),
+            min_score=get_env_float("WORKMATCH_TITLE_INDEX_MIN_SCORE", DEFAULT_MIN_SCORE),
+        )
+    ]
+
+
+def learn_variants(title: str, variants: List[str]) -> None:
+    """Adds a fresh title_variants_agent expansion to the shared index, if there is one."""
+    index = get_title_index()
+    if index is not None and variants:
+        index.add_group([title, *variants], curated=False)
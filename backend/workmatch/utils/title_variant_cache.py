@@ -0,0 +1,218 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from workmatch.utils.env import get_env_bool, get_env_float, get_env_int
+from workmatch.utils.pagination import normalise_title
+
+logger = logging.getLogger(__name__)
+
+# Curated expansions of popular titles, loaded into the cache on start
+DEFAULT_SEED_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "title_variants.json")
+DEFAULT_TTL = 7 * 24 * 3600.0
+DEFAULT_MAX_ENTRIES = 5000
+
+# Longest request (in words, after trimming) still taken to be a bare job title
+MAX_TITLE_WORDS = 6
+
+_BULLET = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s+(.+?)\s*$")
+_NON_WORD = re.compile(r"[^\w+#/&]+")
+_QUOTED = re.compile(r"[\"'`‘“](.+?)[\"'`’”]")
+_LEAD_IN = re.compile(
+    r"^(?:job[_ ]title\s*[:=]\s*)?(?:please\s+)?(?:(?:expand|find|give me|list|suggest|show me|generate|get)\s+)?"
+    r"(?:(?:some|more|other)\s+)?(?:(?:related|similar|alternative)\s+)?(?:job\s+)?"
+    r"(?:(?:titles?|variants?|variations?|roles?|synonyms?)\s+)?(?:for|of|like|to|on)?\s*[:-]?\s*"
+    r"(?:(?:an?|the)\s+)?",
+    re.IGNORECASE,
+)
+_TRAILER = re.compile(r"(?:\s+(?:jobs?|roles?|positions?))?(?:\s+in\s+.+)?[\s.?!]*$", re.IGNORECASE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS title_variants (
+    key TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    variants TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    used_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_title_variants_used_at ON title_variants (used_at);
+"""
+
+
+def title_key(title: str) -> str:
+    """Cache key for a title: lowercase words, punctuation and quoting dropped."""
+    return normalise_title(_NON_WORD.sub(" ", title.lower()))
+
+
+def requested_title(request: str) -> str:
+    """
+    The job title in a request to title_variants_agent: a quoted title if
+    there is one, else the request minus lead-ins ("expand", "related titles
+    for", "a"...) and trailing "jobs" / "in <place>". "" when what is left
+    is too long to be a bare title, so the request is not cached.
+    """
+    request = " ".join((request or "").split())
+    quoted = _QUOTED.search(request)
+    if quoted:
+        title = quoted.group(1)
+    else:
+        title = _TRAILER.sub("", _LEAD_IN.sub("", request, count=1))
+    title = title.strip(" .?!:-")
+    return title if 0 < len(title.split()) <= MAX_TITLE_WORDS else ""
+
+
+def parse_variants(text: str) -> List[str]:
+    """Variant titles from the agent's markdown bullet list (or a JSON list)."""
+    text = (text or "").strip()
+    if text.startswith("["):
+        try:
+            return [str(title).strip() for title in json.loads(text) if str(title).strip()]
+        except ValueError:
+            pass
+    variants = []
+    for line in text.splitlines():
+        match = _BULLET.match(line.lstrip("> "))
+        if match:
+            variants.append(match.group(1).strip("*_ "))
+    return variants
+
+
+def format_variants(variants: List[str]) -> str:
+    """The agent's reply format, rebuilt from cached variants."""
+    bullets = "\n".join(f"- {title}" for title in variants)
+    return f"Here are some related job titles you might want to explore:\n\n{bullets}"
+
+
+class TitleVariantCache:
+    """
+    Persistent SQLite cache of title_variants_agent expansions keyed by the
+    normalised title. Entries expire after `ttl` seconds; past `max_entries`
+    the least recently used are evicted. `seed()` loads curated expansions.
+    """
+
+    def __init__(self, path: str = ":memory:", ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        with self._lock:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def get(self, title: str) -> Optional[List[str]]:
+        """Cached variants for `title`, or None if missing or expired."""
+        key = title_key(title)
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT variants FROM title_variants WHERE key = ? AND stored_at >= ?", (key, now - self.ttl)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE title_variants SET used_at = ?, hits = hits + 1 WHERE key = ?", (now, key))
+            self.hits += 1
+            return json.loads(row[0])
+
+    def put(self, title: str, variants: List[str]) -> None:
+        key = title_key(title)
+        if not key or not variants:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO title_variants (key, title, variants, stored_at, used_at) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    title = excluded.title, variants = excluded.variants, stored_at = excluded.stored_at
+                """,
+                (key, title, json.dumps(variants), now, now),
+            )
+            self._conn.execute(
+                """
+                DELETE FROM title_variants WHERE key IN (
+                    SELECT key FROM title_variants ORDER BY used_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+            self.writes += 1
+
+    def entries(self) -> Dict[str, List[str]]:
+        """Every fresh expansion as {title: variants}, without counting hits."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT title, variants FROM title_variants WHERE stored_at >= ?", (time.time() - self.ttl,)
+            ).fetchall()
+        return {title: json.loads(variants) for title, variants in rows}
+
+    def seed(self, expansions: Dict[str, List[str]]) -> int:
+        """Stores curated expansions that are not already cached and fresh; returns how many were added."""
+        added = 0
+        for title, variants in expansions.items():
+            if self.get(title) is None:
+                self.put(title, variants)
+                added += 1
+        self.misses -= added  # seeding lookups are not real misses
+        return added
+
+    def seed_from_file(self, path: str) -> int:
+        """seed() from a JSON file of {"title": ["variant", ...]}."""
+        with open(path, encoding="utf-8") as f:
+            return self.seed(json.load(f))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM title_variants").fetchone()[0]
+        return {"entries": entries, "hits": self.hits, "misses": self.misses, "writes": self.writes}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_title_variant_cache: Optional[TitleVariantCache] = None
+_title_variant_cache_lock = threading.Lock()
+
+
+def get_title_variant_cache() -> Optional[TitleVariantCache]:
+    """
+    The shared cache, configured from WORKMATCH_TITLE_CACHE_PATH (unset keeps
+    it in memory), WORKMATCH_TITLE_CACHE_TTL, WORKMATCH_TITLE_CACHE_MAX and
+    WORKMATCH_TITLE_CACHE_SEED; None when WORKMATCH_TITLE_CACHE=false.
+    """
+    global _title_variant_cache
+    if not get_env_bool("WORKMATCH_TITLE_CACHE", default=True):
+        return None
+    with _title_variant_cache_lock:
+        if _title_variant_cache is None:
+            path = os.getenv("WORKMATCH_TITLE_CACHE_PATH") or ":memory:"
+            try:
+                cache = TitleVariantCache(
+                    path,
+                    ttl=get_env_float("WORKMATCH_TITLE_CACHE_TTL", DEFAULT_TTL),
+                    max_entries=get_env_int("WORKMATCH_TITLE_CACHE_MAX", DEFAULT_MAX_ENTRIES),
+                )
+            except sqlite3.Error as e:
+                logger.error(f"[TitleVariantCache] Could not open cache at {path}: {e}")
+                return None
+            seed_path = os.getenv("WORKMATCH_TITLE_CACHE_SEED", DEFAULT_SEED_PATH)
+            if seed_path:
+                try:
+                    added = cache.seed_from_file(seed_path)
+                    logger.info(f"[TitleVariantCache] Seeded {added} titles from {seed_path}")
+                except (OSError, ValueError) as e:
+                    logger.warning(f"[TitleVariantCache] Could not seed from {seed_path}: {e}")
+            _title_variant_cache = cache
+        return _title_variant_cache
@@ -0,0 +1,114 @@
+import json
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from workmatch.utils.adzuna import JobListing
+
+logger = logging.getLogger(__name__)
+
+# Room kept free for the `trimmed` report added to a trimmed response
+REPORT_TOKENS = 40
+
+ResponseBuilder = Callable[[Dict[str, List[JobListing]], List[JobListing]], Dict[str, Any]]
+
+
+def estimate_tokens(value: Any) -> int:
+    """Rough token count of a string or JSON-serialisable value (about four characters per token)."""
+    text = value if isinstance(value, str) else json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+    return max(1, len(text) // 4) if text else 0
+
+
+def _smallest(count: int, fits: Callable[[int], bool]) -> Optional[int]:
+    """Smallest k in 0..count with fits(k), assuming fits is monotonic; None if even `count` does not fit."""
+    if not fits(count):
+        return None
+    low, high = 0, count
+    while low < high:
+        middle = (low + high) // 2
+        if fits(middle):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def fit_to_budget(
+    build: ResponseBuilder,
+    listings_by_title: Dict[str, List[JobListing]],
+    sample: Sequence[JobListing],
+    budget: int,
+) -> Dict[str, Any]:
+    """
+    Builds the tool response with `build(listings_by_title, sample)` and, while
+    its estimated size is over `budget` tokens, trims it in this order:
+
+    1. lower-ranked listings, deepest rank first, down to each title's top listing
+    2. per-title detail: `listings_by_title` and `market_stats.salary_by_title`
+    3. the remaining `all_listings` sample, from the end
+    4. `market_stats`
+
+    Summary counts are always kept. A trimmed response reports what was cut
+    under `trimmed`.
+    """
+    response = build(listings_by_title, list(sample))
+    estimated = estimate_tokens(response)
+    if estimated <= budget:
+        return response
+
+    def fits(candidate: Dict[str, Any]) -> bool:
+        return estimate_tokens(candidate) <= budget - REPORT_TOKENS
+
+    # Stage 1: drop listings rank by rank from the bottom, later titles first
+    deepest = max((len(listings) for listings in listings_by_title.values()), default=0)
+    drop_order = [
+        listings[rank]
+        for rank in range(deepest - 1, 0, -1)
+        for listings in reversed(list(listings_by_title.values()))
+        if rank < len(listings)
+    ]
+
+    def without(dropped: int):
+        gone = {id(listing) for listing in drop_order[:dropped]}
+        return (
+            {title: [l for l in listings if id(l) not in gone] for title, listings in listings_by_title.items()},
+            [l for l in sample if id(l) not in gone],
+        )
+
+    removed_sections: List[str] = []
+    dropped = _smallest(len(drop_order), lambda k: fits(build(*without(k))))
+    kept_by_title, kept_sample = without(len(drop_order) if dropped is None else dropped)
+    response = build(kept_by_title, kept_sample)
+
+    if dropped is None:
+        # Stage 2: per-title detail
+        def summary_only(sample_size: int) -> Dict[str, Any]:
+            trimmed = build({}, kept_sample[:sample_size])
+            stats = trimmed.get("market_stats")
+            if isinstance(stats, dict):
+                trimmed["market_stats"] = {key: value for key, value in stats.items() if key != "salary_by_title"}
+            return trimmed
+
+        kept_by_title = {}
+        removed_sections += ["listings_by_title", "salary_by_title"]
+
+        # Stage 3: the sample, from the end
+        cut = _smallest(len(kept_sample), lambda k: fits(summary_only(len(kept_sample) - k)))
+        kept_sample = kept_sample[:len(kept_sample) - (len(kept_sample) if cut is None else cut)]
+        response = summary_only(len(kept_sample))
+
+        # Stage 4: the aggregate statistics
+        if cut is None and response.pop("market_stats", None) is not None:
+            removed_sections.append("market_stats")
+
+    kept_ids = {id(l) for listings in kept_by_title.values() for l in listings} | {id(l) for l in kept_sample}
+    listings_removed = len({id(l) for listings in listings_by_title.values() for l in listings} - kept_ids)
+    response["trimmed"] = {
+        "token_budget": budget,
+        "estimated_tokens_before": estimated,
+        "listings_removed": listings_removed,
+        "sections_removed": removed_sections,
+    }
+    response["trimmed"]["estimated_tokens_after"] = estimate_tokens(response)
+    logger.info(f"[TokenBudget] Trimmed a ~{estimated}-token response to ~{response['trimmed']['estimated_tokens_after']} "
+                f"(budget {budget}): {listings_removed} listings, sections {removed_sections or 'none'}")
+    return response
@@ -91,4 +91,36 @@ def langfuse_span(name: str, input_data: dict = None, metadata: dict = None):
         except Exception as e:
             span.record_exception(e)
             span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
-            raise
\ No newline at end of file
+            raise
+
+def annotate_current_span(attributes: dict, prefix: str = "") -> None:
+    """
+    Sets `attributes` on the active OTEL span (e.g. the ADK tool-call span), if
+    one is recording. Nested dicts are flattened into dotted attribute names.
+    """
+    span = trace.get_current_span()
+    if not span.is_recording():
+        return
+    for key, value in attributes.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            annotate_current_span(value, prefix=f"{name}.")
+        elif value is not None:
+            try:
+                span.set_attribute(name, value)
+            except Exception:
+                span.set_attribute(name, str(value))
+
+
+def record_span_event(name: str, attributes: dict = None) -> None:
+    """
+    Adds an event to the active OTEL span. Outside any recording span, the
+    event gets a short span of its own so it still shows up in traces.
+    """
+    span = trace.get_current_span()
+    if span.is_recording():
+        span.add_event(name, attributes=attributes or {})
+        return
+    with langfuse_span(name, metadata=attributes) as own_span:
+        if own_span:
+            own_span.add_event(name, attributes=attributes or {})
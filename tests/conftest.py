@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+# devtools/ and workmatch/ live under backend/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+# Building agents initialises tracing; without a collector it would print every span
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+
+@pytest.fixture
+def make_listing():
+    """Builds JobListing dicts: `make_listing(n, **fields)` is listing n with `fields` overridden."""
+    def make(number=1, **fields):
+        listing = {
+            "id": f"job-{number}",
+            "title": f"Chef {number}",
+            "company": "Acme",
+            "location": "Leeds",
+            "employment_type": "Full-time",
+            "salary": "£28,000 - £32,000",
+            "description_snippet": "Cook things...",
+            "url": f"https://example.com/{number}",
+            "salary_min": 28000.0,
+            "salary_max": 32000.0,
+            "salary_is_predicted": False,
+        }
+        listing.update(fields)
+        return listing
+    return make
@@ -0,0 +1,166 @@
+import asyncio
+
+import httpx
+
+from devtools.adzuna_standin import AdzunaStandin
+from workmatch.utils.adzuna import AdzunaAPI, AsyncAdzunaAPI
+from workmatch.utils.cache import TTLCache
+from workmatch.utils.listing_store import ListingStore
+
+CREDENTIALS = {"app_id": "test-id", "app_key": "test-key"}
+
+
+def test_sync_client_wraps_the_async_client(monkeypatch):
+    with AdzunaStandin(total=3) as standin:
+        monkeypatch.setenv("ADZUNA_BASE_URL", standin.base_url)
+        api = AdzunaAPI(**CREDENTIALS, cache=None)
+        try:
+            first = api.search_jobs("nurse")
+            stats = api.pool_stats()
+            metrics = api.metrics()
+        finally:
+            api.close()
+        api.close()  # closing twice is harmless
+
+    assert isinstance(api._api, AsyncAdzunaAPI)
+    assert len(first["results"]) == 3
+    assert stats["opened"] >= 1
+    assert metrics["pool"] == stats
+
+
+def test_async_client_answers_repeats_from_the_store(monkeypatch, tmp_path):
+    store = ListingStore(str(tmp_path / "listings.db"))
+
+    async def run(base_url):
+        api = AsyncAdzunaAPI(**CREDENTIALS, cache=None, store=store)
+        try:
+            first = await api.search_jobs("chef")
+            again = await api.search_jobs("chef")
+            return first, again, api.pool_stats()
+        finally:
+            await api.aclose()
+
+    with AdzunaStandin(total=4) as standin:
+        monkeypatch.setenv("ADZUNA_BASE_URL", standin.base_url)
+        first, again, stats = asyncio.run(run(standin.base_url))
+        served = standin.stats()["requests"]
+
+    assert again["results"] == first["results"]
+    assert served == 1
+    assert stats["opened"] == 1
+
+
+def _failing_page(api, page, country="gb"):
+    """Makes requests for `page` in `country` fail with a non-retryable HTTP 400."""
+    send = api._send
+
+    async def fake_send(url, params, attempt):
+        if url.endswith(f"/{country}/search/{page}"):
+            request = httpx.Request("GET", url)
+            raise httpx.HTTPStatusError("400 Bad Request", request=request, response=httpx.Response(400, request=request))
+        return await send(url, params, attempt)
+
+    api._send = fake_send
+
+
+def test_failed_page_mid_bulk_reports_an_error_not_exhaustion(monkeypatch):
+    async def run():
+        api = AsyncAdzunaAPI(**CREDENTIALS, cache=None, store=None)
+        _failing_page(api, 2)
+        try:
+            return await api.search_jobs_bulk("data analyst", target_count=15, per_page=5)
+        finally:
+            await api.aclose()
+
+    with AdzunaStandin(total=50) as standin:
+        monkeypatch.setenv("ADZUNA_BASE_URL", standin.base_url)
+        bulk = asyncio.run(run())
+
+    assert len(bulk["results"]) == 5
+    assert bulk["pages_fetched"] == 2
+    assert bulk["exhausted"] is False
+    assert "400" in bulk["error"]
+
+
+def test_failed_search_serves_expired_cached_results_as_stale(monkeypatch):
+    now = [0.0]
+    cache = TTLCache(ttl=10, stale_ttl=10, clock=lambda: now[0])
+
+    async def run():
+        api = AsyncAdzunaAPI(**CREDENTIALS, cache=cache, store=None)
+        try:
+            first = await api.search_jobs("nurse")
+            now[0] = 60  # past the stale window: a miss, but still peekable
+            _failing_page(api, 1)
+            fallback = await api.search_jobs("nurse")
+            uncached = await api.search_jobs("chef")
+            return first, fallback, uncached
+        finally:
+            await api.aclose()
+
+    with AdzunaStandin(total=3) as standin:
+        monkeypatch.setenv("ADZUNA_BASE_URL", standin.base_url)
+        first, fallback, uncached = asyncio.run(run())
+
+    assert fallback == {"results": first["results"], "stale": True}
+    assert uncached["results"] == []
+    assert "400" in uncached["error"]
+
+
+def test_multi_country_search_keeps_results_and_reports_the_failed_country(monkeypatch):
+    async def run():
+        api = AsyncAdzunaAPI(**CREDENTIALS, cache=None, store=None)
+        _failing_page(api, 1, country="de")
+        try:
+            return await api.search_jobs("nurse", country=["gb", "de", "fr"], results_limit=2)
+        finally:
+            await api.aclose()
+
+    with AdzunaStandin(total=5) as standin:
+        monkeypatch.setenv("ADZUNA_BASE_URL", standin.base_url)
+        merged = asyncio.run(run())
+
+    assert merged["country_counts"] == {"gb": 2, "de": 0, "fr": 2}
+    assert [listing["country"] for listing in merged["results"]] == ["gb", "fr", "gb", "fr"]
+    assert merged["error"].startswith("de: ")
+
+
+def test_sequential_searches_reuse_one_pooled_connection(monkeypatch):
+    async def run():
+        api = AsyncAdzunaAPI(**CREDENTIALS, cache=None, store=None, pool_size=4)
+        try:
+            for title in ("nurse", "chef", "baker"):
+                await api.search_jobs(title)
+            return api.pool_stats()
+        finally:
+            await api.aclose()
+
+    with AdzunaStandin(total=2) as standin:
+        monkeypatch.setenv("ADZUNA_BASE_URL", standin.base_url)
+        stats = asyncio.run(run())
+
+    assert stats == {"pool_size": 4, "active": 0, "idle": 1, "opened": 1, "reused": 2}
+
+
+def _pooled_sockets(client):
+    return [
+        conn._connection._network_stream.get_extra_info("socket")._sock
+        for conn in client._transport._pool.connections
+    ]
+
+
+def test_switching_event_loops_closes_the_previous_pool(monkeypatch):
+    async def search(title):
+        await api.search_jobs(title)
+        return api._client
+
+    with AdzunaStandin(total=2) as standin:
+        monkeypatch.setenv("ADZUNA_BASE_URL", standin.base_url)
+        api = AsyncAdzunaAPI(**CREDENTIALS, cache=None, store=None)
+        first_client = asyncio.run(search("nurse"))
+        first_sockets = _pooled_sockets(first_client)
+        second_client = asyncio.run(search("chef"))
+        asyncio.run(api.aclose())
+
+    assert second_client is not first_client
+    assert first_sockets and all(sock.fileno() == -1 for sock in first_sockets)
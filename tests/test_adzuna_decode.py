@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from workmatch.utils import adzuna_decode
+from workmatch.utils.adzuna import AsyncAdzunaAPI
+from workmatch.utils.adzuna_decode import decode_search_response, json_backend
+
+RAW_RESPONSE = {
+    "__CLASS__": "Adzuna::API::Response::JobSearchResults",
+    "count": 1234,
+    "mean": 31000.5,
+    "results": [
+        {
+            "__CLASS__": "Adzuna::API::Response::Job",
+            "id": "4242",
+            "adref": "eyJhbGciOiJIUzI1NiJ9",
+            "title": "Sous Chef",
+            "company": {"__CLASS__": "Adzuna::API::Response::Company", "display_name": "Acme Kitchens"},
+            "location": {"display_name": "Leeds, West Yorkshire", "area": ["UK", "Yorkshire", "Leeds"]},
+            "category": {"tag": "hospitality-catering-jobs", "label": "Hospitality & Catering Jobs"},
+            "contract_time": "full_time",
+            "salary_min": 28000,
+            "salary_max": 32000,
+            "salary_is_predicted": "0",
+            "description": " ".join(f"word{n}" for n in range(100)),
+            "redirect_url": "https://www.adzuna.co.uk/jobs/land/ad/4242",
+        }
+    ],
+}
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def backend(request, monkeypatch):
+    if request.param == "orjson" and adzuna_decode.orjson is None:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setenv("ADZUNA_JSON_BACKEND", request.param)
+    assert json_backend() == request.param
+    return request.param
+
+
+def test_stdlib_is_the_default_backend(monkeypatch):
+    monkeypatch.delenv("ADZUNA_JSON_BACKEND", raising=False)
+
+    assert json_backend() == "stdlib"
+
+
+def test_decoding_keeps_the_results_and_count(backend):
+    decoded = decode_search_response(json.dumps(RAW_RESPONSE).encode("utf-8"))
+
+    assert decoded == {"results": RAW_RESPONSE["results"], "count": 1234}
+
+
+def test_both_backends_format_the_same_listing(backend):
+    api = AsyncAdzunaAPI(app_id="test-id", app_key="test-key", cache=None, store=None)
+
+    job = decode_search_response(json.dumps(RAW_RESPONSE).encode("utf-8"))["results"][0]
+    listing = api._format_job_listing(job)
+
+    assert listing["company"] == "Acme Kitchens"
+    assert listing["location"] == "Leeds, West Yorkshire"
+    assert listing["description_snippet"] == " ".join(f"word{n}" for n in range(20)) + "..."
+
+
+def test_decoding_an_empty_response(backend):
+    assert decode_search_response(b'{"results": []}') == {"results": [], "count": None}
+    assert decode_search_response(b"{}") == {"results": [], "count": None}
@@ -0,0 +1,77 @@
+import os
+import sys
+
+import httpx
+import pytest
+
+# devtools/ and workmatch/ live under backend/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from devtools.adzuna_standin import AdzunaStandin, fixture_key  # noqa: E402
+
+CREDENTIALS = {"app_id": "test-id", "app_key": "test-key"}
+
+
+def search(base_url: str, page: int = 1, **params) -> httpx.Response:
+    return httpx.get(f"{base_url}/gb/search/{page}", params={**CREDENTIALS, **params}, timeout=10)
+
+
+def test_synthetic_pages_are_deterministic_and_end_short():
+    with AdzunaStandin(total=12) as standin:
+        first = search(standin.base_url, what="data analyst", results_per_page=5)
+        again = search(standin.base_url, what="data analyst", results_per_page=5)
+        last = search(standin.base_url, page=3, what="data analyst", results_per_page=5)
+
+    assert first.status_code == 200
+    assert first.json() == again.json()
+    assert len(first.json()["results"]) == 5
+    assert len(last.json()["results"]) == 2
+    assert first.json()["count"] == 12
+
+
+def test_injected_throttling_sends_retry_after():
+    with AdzunaStandin(throttle_rate=1.0, retry_after=2) as standin:
+        response = search(standin.base_url, what="nurse")
+        stats = standin.stats()
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "2"
+    assert stats["by_outcome"] == {"throttled": 1}
+
+
+def test_recorded_responses_replay_without_credentials(tmp_path):
+    with AdzunaStandin(total=8) as upstream:
+        recorder = AdzunaStandin(mode="record", fixtures_dir=str(tmp_path),
+                                 upstream=upstream.base_url.split("/v1/")[0])
+        with recorder:
+            recorded = search(recorder.base_url, what="chef", results_per_page=5)
+
+    fixture = tmp_path / fixture_key("gb", 1, {"what": "chef", "results_per_page": "5"})
+    assert fixture.exists()
+    assert "test-key" not in fixture.read_text()
+
+    with AdzunaStandin(mode="replay", fixtures_dir=str(tmp_path), strict=True) as replay:
+        replayed = search(replay.base_url, what="chef", results_per_page=5)
+        missing = search(replay.base_url, what="baker", results_per_page=5)
+
+    assert replayed.json() == recorded.json()
+    assert missing.status_code == 404
+
+
+def test_adzuna_client_against_standin(monkeypatch):
+    try:
+        from workmatch.utils.adzuna import AdzunaAPI
+    except Exception as e:  # importing workmatch loads the agents, which need GCP credentials
+        pytest.skip(f"workmatch not importable here: {e}")
+
+    with AdzunaStandin(total=7) as standin:
+        monkeypatch.setenv("ADZUNA_BASE_URL", standin.base_url)
+        api = AdzunaAPI(**CREDENTIALS, cache=None)
+        try:
+            bulk = api.search_jobs_bulk("data analyst", target_count=20, per_page=5)
+        finally:
+            api.close()
+
+    assert len(bulk["results"]) == 7
+    assert bulk["exhausted"] is True
+    assert all(listing["salary"].startswith(("£", "From £")) for listing in bulk["results"])
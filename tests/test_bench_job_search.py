@@ -0,0 +1,59 @@
+import asyncio
+import tracemalloc
+
+from devtools.adzuna_standin import AdzunaStandin
+from devtools.bench_job_search import compare, percentile, run_scenario, scenario_name
+from workmatch.tools import career_tools
+from workmatch.utils.adzuna import AsyncAdzunaAPI
+
+
+def test_percentile_uses_the_nearest_rank():
+    values = [float(n) for n in range(1, 11)]
+
+    assert percentile(values, 50) == 5.0
+    assert percentile(values, 95) == 10.0
+    assert percentile(values, 0) == 1.0
+    assert percentile([0.3], 99) == 0.3
+
+
+def test_compare_flags_scenarios_slower_than_the_tolerance(capsys):
+    baseline = {"scenarios": {
+        "steady": {"p50_s": 1.0, "p95_s": 2.0},
+        "slower": {"p50_s": 1.0, "p95_s": 2.0},
+    }}
+    results = {"scenarios": {
+        "steady": {"p50_s": 1.1, "p95_s": 2.2},
+        "slower": {"p50_s": 1.0, "p95_s": 2.5},
+        "added": {"p50_s": 9.0, "p95_s": 9.0},
+    }}
+
+    assert compare(results, baseline, tolerance=0.2) == ["slower"]
+    assert "(new)" in capsys.readouterr().out
+
+
+def test_scenario_reports_one_request_per_title_and_page(monkeypatch):
+    monkeypatch.setenv("WORKMATCH_TITLE_INDEX", "false")
+    monkeypatch.setenv("ADZUNA_CACHE_TTL", "0")  # as the benchmark runs: every call reaches the stand-in
+
+    async def run(standin):
+        api = AsyncAdzunaAPI(app_id="test-id", app_key="test-key", cache=None, store=None)
+        monkeypatch.setattr(career_tools, "get_async_adzuna_api", lambda: api)
+        tracemalloc.start()
+        try:
+            return await run_scenario(
+                career_tools.summarise_expanded_job_roles_tool, api, standin,
+                titles=3, page_size=5, employer=False, iterations=2, warmup=1,
+            )
+        finally:
+            tracemalloc.stop()
+            await api.aclose()
+
+    with AdzunaStandin(total=20) as standin:
+        monkeypatch.setenv("ADZUNA_BASE_URL", standin.base_url)
+        stats = asyncio.run(run(standin))
+
+    assert scenario_name(3, 5, False) == "titles=3,page_size=5,employer=no"
+    assert stats["requests"] == 6  # 3 titles x 2 timed iterations; the warmup is not counted
+    assert stats["bytes_decoded"] > 0
+    assert stats["listings_per_call"] > 0
+    assert stats["p50_s"] <= stats["p99_s"]
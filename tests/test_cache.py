@@ -0,0 +1,80 @@
+import asyncio
+
+from devtools.adzuna_standin import AdzunaStandin
+from workmatch.utils.adzuna import AsyncAdzunaAPI
+from workmatch.utils.cache import FRESH, MISS, STALE, TTLCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_age_from_fresh_to_stale_to_miss():
+    clock = Clock()
+    cache = TTLCache(ttl=10, stale_ttl=5, clock=clock)
+    cache.set("k", "v")
+
+    assert cache.get("k") == ("v", FRESH)
+    clock.now = 10
+    assert cache.get("k") == ("v", STALE)
+    clock.now = 15
+    assert cache.get("k") == (None, MISS)
+    assert cache.get("other") == (None, MISS)
+    assert cache.stats() == {
+        "hits": 1, "stale_hits": 1, "misses": 2, "evictions": 0, "expirations": 1, "size": 1,
+    }
+
+
+def test_peek_serves_expired_entries_without_counting():
+    clock = Clock()
+    cache = TTLCache(ttl=1, stale_ttl=0, clock=clock)
+    cache.set("k", "v")
+    clock.now = 100
+
+    assert cache.peek("k") == "v"
+    assert cache.peek("missing") is None
+    assert cache.stats()["misses"] == 0
+
+
+def test_full_cache_evicts_the_least_recently_used_entry():
+    cache = TTLCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.peek("b") is None
+    assert cache.peek("a") == 1 and cache.peek("c") == 3
+    assert cache.evictions == 1
+
+
+def test_stale_search_is_served_at_once_and_refreshed_in_the_background(monkeypatch):
+    clock = Clock()
+    cache = TTLCache(ttl=10, stale_ttl=10, clock=clock)
+
+    async def run(standin):
+        api = AsyncAdzunaAPI(app_id="test-id", app_key="test-key", cache=cache, store=None)
+        try:
+            first = await api.search_jobs("chef")
+            clock.now = 12
+            stale = await api.search_jobs("chef")
+            await asyncio.gather(*api._background)
+            requests = standin.stats()["requests"]
+            refreshed = await api.search_jobs("chef")
+            return first, stale, refreshed, requests
+        finally:
+            await api.aclose()
+
+    with AdzunaStandin(total=3) as standin:
+        monkeypatch.setenv("ADZUNA_BASE_URL", standin.base_url)
+        first, stale, refreshed, requests = asyncio.run(run(standin))
+
+    assert stale["results"] == first["results"]
+    assert requests == 2  # the original search plus one background refresh
+    assert refreshed["results"] == first["results"]
+    assert cache.stats()["stale_hits"] == 1
+    assert cache.stats()["hits"] == 1
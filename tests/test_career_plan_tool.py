@@ -0,0 +1,70 @@
+import asyncio
+
+from workmatch.tools.career_plan_tool import make_career_plan_tool, plan_request
+
+
+class FakeSectionTool:
+    """Stands in for a section AgentTool: answers after `delay` seconds, or raises `error`."""
+
+    def __init__(self, text, delay=0.0, error=None):
+        self.text = text
+        self.delay = delay
+        self.error = error
+        self.requests = []
+
+    async def run_async(self, args, tool_context):
+        self.requests.append(args["request"])
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.text
+
+
+def test_plan_request_includes_only_the_details_given():
+    assert plan_request("Analyst", None, None) == "Current role: Analyst."
+    assert plan_request("Analyst", "Lead a team", "Leeds") == "Current role: Analyst. Goal: Lead a team. Location: Leeds."
+
+
+def test_sections_run_concurrently_and_keep_the_requested_order():
+    tools = {
+        "skills": FakeSectionTool("SQL", delay=0.2),
+        "leadership": FakeSectionTool("Mentor", delay=0.2),
+        "networking": FakeSectionTool("Meetups", delay=0.2),
+    }
+    build_career_plan_tool = make_career_plan_tool(tools)
+
+    result = asyncio.run(build_career_plan_tool(
+        "Analyst", goal="Lead a team", sections=["networking", "skills", "leadership", "skills"],
+    ))
+
+    assert list(result["sections"]) == ["networking", "skills", "leadership"]
+    assert result["elapsed_seconds"] < 0.5  # about one section's time, not three
+    assert all(tool.requests == ["Current role: Analyst. Goal: Lead a team."] for tool in tools.values())
+
+
+def test_slow_failed_and_unknown_sections_are_reported_not_raised(monkeypatch):
+    monkeypatch.setenv("WORKMATCH_PLAN_SECTION_TIMEOUT", "0.1")
+    build_career_plan_tool = make_career_plan_tool({
+        "skills": FakeSectionTool("SQL"),
+        "leadership": FakeSectionTool("Mentor", delay=1.0),
+        "networking": FakeSectionTool("", error=RuntimeError("model unavailable")),
+    })
+
+    result = asyncio.run(build_career_plan_tool(
+        "Analyst", sections=["skills", "leadership", "networking", "astrology"],
+    ))
+
+    assert result["sections"] == {"skills": "SQL"}
+    assert result["timed_out"] == ["leadership"]
+    assert result["failed"] == {"networking": "model unavailable"}
+    assert result["unknown_sections"] == ["astrology"]
+    assert set(result["section_seconds"]) == {"skills", "leadership", "networking"}
+
+
+def test_default_sections_are_limited_to_the_tools_available():
+    build_career_plan_tool = make_career_plan_tool({"skills": FakeSectionTool("SQL")})
+
+    result = asyncio.run(build_career_plan_tool("Analyst"))
+
+    assert result["sections"] == {"skills": "SQL"}
+    assert set(result["unknown_sections"]) == {"next_level_roles", "leadership", "certifications", "networking"}
@@ -0,0 +1,215 @@
+import json
+import inspect
+import base64
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from devtools.adzuna_standin import AdzunaStandin
+from workmatch.tools import career_tools
+from workmatch.utils.adzuna import AsyncAdzunaAPI
+from workmatch.utils.pagination import decode_cursor
+from workmatch.utils.rate_limit import QuotaLimiter
+
+CREDENTIALS = {"app_id": "test-id", "app_key": "test-key"}
+
+
+@pytest.fixture
+def standin(monkeypatch):
+    """A stand-in Adzuna plus a fresh client for the tool; yields a function that sets both up."""
+    monkeypatch.setenv("WORKMATCH_TITLE_INDEX", "false")
+    monkeypatch.setenv("WORKMATCH_LISTING_ORDER", "seeded")
+    servers = []
+
+    def start(**options):
+        server = AdzunaStandin(**options)
+        server.__enter__()
+        servers.append(server)
+        monkeypatch.setenv("ADZUNA_BASE_URL", server.base_url)
+        api = AsyncAdzunaAPI(**CREDENTIALS, cache=None, store=None)
+        monkeypatch.setattr(career_tools, "get_async_adzuna_api", lambda: api)
+        return server, api
+
+    yield start
+    for server in servers:
+        server.__exit__(None, None, None)
+
+
+def run_tool(**arguments):
+    return asyncio.run(career_tools.summarise_expanded_job_roles_tool(**arguments))
+
+
+def test_quota_refusals_surface_as_rate_limited(standin):
+    server, api = standin(total=10)
+    api.rate_limiter = QuotaLimiter(per_second=0.01, burst=1, max_wait=0)
+
+    result = run_tool(job_title="nurse", expanded_titles=["staff nurse"])
+
+    assert result["rate_limited"] is True
+    assert result["total_listings_found"] == 5
+    assert len(result["errors"]) == 1
+    assert "quota" in next(iter(result["errors"].values()))
+
+
+def test_adzuna_throttling_after_retries_surfaces_as_rate_limited(standin):
+    server, api = standin(throttle_rate=1.0, retry_after=5)
+    api.rate_limiter = QuotaLimiter(per_second=100, max_wait=1)
+
+    result = run_tool(job_title="nurse", expanded_titles=["staff nurse"])
+
+    assert result["rate_limited"] is True
+    assert set(result["errors"]) == {"nurse", "staff nurse"}
+    assert result["total_listings_found"] == 0
+
+
+def test_healthy_search_reports_no_errors(standin):
+    standin(total=10)
+
+    result = run_tool(job_title="nurse", expanded_titles=["staff nurse"])
+
+    assert "errors" not in result and "rate_limited" not in result
+    assert result["total_listings_found"] == 10
+
+
+class RepeatingAdzuna:
+    """Returns the same listings for every page, like a search whose results barely move."""
+
+    def __init__(self, listings):
+        self.listings = listings
+
+    async def search_jobs(self, **search):
+        return {"results": [dict(listing) for listing in self.listings]}
+
+
+def test_next_page_does_not_repeat_listings_already_shown(monkeypatch):
+    monkeypatch.setenv("WORKMATCH_TITLE_INDEX", "false")
+    listings = [
+        {"id": str(n), "title": "Nurse", "company": f"Trust {n}", "location": "York"}
+        for n in range(5)
+    ]
+    monkeypatch.setattr(career_tools, "get_async_adzuna_api", lambda: RepeatingAdzuna(listings))
+    context = SimpleNamespace(state={})
+
+    first = run_tool(job_title="nurse", expanded_titles=["staff nurse"], tool_context=context)
+    second = run_tool(job_title="nurse", expanded_titles=["staff nurse"],
+                      cursor=first["next_cursor"], tool_context=context)
+    fresh = run_tool(job_title="nurse", expanded_titles=["staff nurse"], tool_context=context)
+
+    assert first["total_listings_found"] == 5
+    assert second["total_listings_found"] == 0
+    assert second["duplicates_removed"] == 10
+    assert fresh["total_listings_found"] == 5  # a new search starts with a clean slate
+    assert len(context.state[career_tools.SEEN_LISTINGS_STATE_KEY]) == 2
+
+
+def test_same_cursor_twice_returns_the_same_page(standin):
+    standin(total=40)
+    context = SimpleNamespace(state={})
+
+    first = run_tool(job_title="nurse", expanded_titles=["staff nurse"], tool_context=context)
+    second = run_tool(job_title="nurse", expanded_titles=["staff nurse"],
+                      cursor=first["next_cursor"], tool_context=context)
+    repeated = run_tool(job_title="nurse", expanded_titles=["staff nurse"],
+                        cursor=first["next_cursor"], tool_context=context)
+
+    assert second["total_listings_found"] == 10
+    assert repeated["total_listings_found"] == 10
+    assert repeated["duplicates_removed"] == second["duplicates_removed"]
+    assert repeated["listings_by_title"] == second["listings_by_title"]
+
+
+def test_malformed_cursor_is_treated_as_no_cursor(standin):
+    standin(total=40)
+    bad_cursor = base64.urlsafe_b64encode(json.dumps({"v": 1, "n": "2", "p": {"gb:nurse": "x"}}).encode()).decode()
+
+    fresh = run_tool(job_title="nurse", expanded_titles=["staff nurse"])
+    result = run_tool(job_title="nurse", expanded_titles=["staff nurse"], cursor=bad_cursor)
+
+    assert result["total_listings_found"] == fresh["total_listings_found"] == 10
+    assert decode_cursor(result["next_cursor"])["n"] == 1
+
+
+def test_seen_listings_are_kept_per_page_and_bounded(monkeypatch):
+    context = SimpleNamespace(state={})
+    monkeypatch.setattr(career_tools, "MAX_SEEN_KEYS", 4)
+
+    for page in (1, 2, 3):
+        career_tools._remember_seen(context, "search", page, [f"id:{page}-{k}" for k in range(2)])
+    assert career_tools._seen_listings(context, "search", 3) == ["id:2-0", "id:2-1"]  # page 1 made way
+
+    career_tools._remember_seen(context, "search", 2, ["id:2-0"])  # page 2 again: page 3 is dropped
+    assert list(context.state[career_tools.SEEN_LISTINGS_STATE_KEY]["search"]) == ["2"]
+
+    for n in range(career_tools.MAX_SEEN_SEARCHES + 1):
+        career_tools._remember_seen(context, f"search-{n}", 1, [])
+    assert list(context.state[career_tools.SEEN_LISTINGS_STATE_KEY]) == [
+        f"search-{n}" for n in range(1, career_tools.MAX_SEEN_SEARCHES + 1)
+    ]
+
+
+class FlakyAdzuna:
+    """Fails the first search for `failing` and records the requests it gets."""
+
+    def __init__(self, failing):
+        self.failing = failing
+        self.requests = []
+
+    async def search_jobs(self, **search):
+        return await self.search_jobs_bulk(target_count=search.pop("results_limit"), **search)
+
+    async def search_jobs_bulk(self, target_count, **search):
+        self.requests.append((search["what"], search["page"], target_count))
+        if search["what"] == self.failing and len(self.requests) <= 2:
+            return {"results": [], "error": "503 Service Unavailable"}
+        return {"results": [
+            {"id": f"{search['what']}-{search['page']}-{n}", "title": search["what"], "company": f"Co {n}", "location": "Hull"}
+            for n in range(target_count)
+        ]}
+
+
+def test_failed_search_keeps_its_page_in_the_cursor(monkeypatch):
+    monkeypatch.setenv("WORKMATCH_TITLE_INDEX", "false")
+    api = FlakyAdzuna(failing="staff nurse")
+    monkeypatch.setattr(career_tools, "get_async_adzuna_api", lambda: api)
+
+    first = run_tool(job_title="nurse", expanded_titles=["staff nurse"])
+    second = run_tool(job_title="nurse", expanded_titles=["staff nurse"], cursor=first["next_cursor"])
+
+    cursor = decode_cursor(first["next_cursor"])
+    assert cursor["p"] == {"gb:nurse": 2, "gb:staff nurse": 1}
+    assert first["errors"] == {"staff nurse": "503 Service Unavailable"}
+    assert sorted(request[:2] for request in api.requests[2:]) == [("nurse", 2), ("staff nurse", 1)]
+    assert "errors" not in second
+
+
+def test_results_per_title_is_capped_at_the_bulk_limit(monkeypatch):
+    monkeypatch.setenv("WORKMATCH_TITLE_INDEX", "false")
+    monkeypatch.setenv("ADZUNA_BULK_MAX_RESULTS", "40")
+    api = FlakyAdzuna(failing=None)
+    monkeypatch.setattr(career_tools, "get_async_adzuna_api", lambda: api)
+
+    result = run_tool(job_title="nurse", expanded_titles=["staff nurse"], results_per_title=500)
+
+    assert {request[2] for request in api.requests} == {40}
+    assert decode_cursor(result["next_cursor"])["p"] == {"gb:nurse": 2, "gb:staff nurse": 2}
+
+
+def test_expand_false_searches_only_the_titles_given(monkeypatch):
+    api = FlakyAdzuna(failing=None)
+    monkeypatch.setattr(career_tools, "get_async_adzuna_api", lambda: api)
+    monkeypatch.setattr(career_tools, "expand_title", lambda title: ["staff nurse", "charge nurse"])
+
+    single = run_tool(job_title="nurse", expand=False)
+    expanded = run_tool(job_title="nurse")
+
+    assert single["total_titles_found"] == 1 and "title_expansion" not in single
+    assert expanded["title_expansion"] == {"source": "index", "titles": ["staff nurse", "charge nurse"]}
+    assert expanded["total_titles_found"] == 3
+
+
+def test_expand_comes_last_so_positional_arguments_keep_their_meaning():
+    parameters = list(inspect.signature(career_tools.summarise_expanded_job_roles_tool).parameters)
+
+    assert parameters[:3] == ["job_title", "expanded_titles", "country_code"]
+    assert parameters[-2:] == ["expand", "tool_context"]
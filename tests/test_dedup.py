@@ -0,0 +1,50 @@
+from workmatch.utils.dedup import ListingDeduplicator, dedupe_listings_by_title, listing_fingerprint, listing_keys
+
+
+def job(listing_id, title="Data Analyst", company="Acme", location="Leeds"):
+    return {"id": listing_id, "title": title, "company": company, "location": location}
+
+
+def test_fingerprint_ignores_case_and_punctuation():
+    assert listing_fingerprint(job("1", title="Data-Analyst ", company="ACME")) == ("data analyst", "acme", "leeds")
+
+
+def test_same_posting_under_several_titles_is_kept_once_with_its_sources():
+    mapping, removed = dedupe_listings_by_title({
+        "data analyst": [job("1"), job("2", company="Beta")],
+        "bi analyst": [job("1"), job("3", title="BI Analyst")],
+    })
+
+    assert removed == 1
+    assert [listing["id"] for listing in mapping["data analyst"]] == ["1", "2"]
+    assert mapping["data analyst"][0]["matched_titles"] == ["data analyst", "bi analyst"]
+    assert "matched_titles" not in mapping["bi analyst"][0]
+
+
+def test_reposted_job_with_a_new_id_is_a_near_duplicate():
+    dedup = ListingDeduplicator()
+
+    assert dedup.add(job("1")) is True
+    assert dedup.add(job("9", title="Data analyst.")) is False
+    assert dedup.removed == 1
+
+
+def test_titles_left_empty_are_dropped():
+    mapping, removed = dedupe_listings_by_title({"a": [job("1")], "b": [job("1")]})
+
+    assert list(mapping) == ["a"]
+    assert removed == 1
+
+
+def test_listings_seen_on_earlier_pages_are_dropped():
+    first = ListingDeduplicator()
+    dedupe_listings_by_title({"a": [job("1"), job("2", company="Beta")]}, first)
+
+    second = ListingDeduplicator(seen=first.seen_keys())
+    mapping, removed = dedupe_listings_by_title({"a": [job("2", company="Beta"), job("7", company="Acme")], "b": [job("3", company="Gamma")]}, second)
+
+    # id 2 by id, id 7 by fingerprint (same title, company and location as id 1)
+    assert removed == 2
+    assert mapping == {"b": [job("3", company="Gamma")]}
+    assert second.seen_keys()[:4] == first.seen_keys()
+    assert listing_keys(job("3", company="Gamma"))[0] in second.seen_keys()
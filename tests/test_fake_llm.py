@@ -0,0 +1,41 @@
+import asyncio
+import json
+
+from google.adk.models import LlmRequest
+from google.genai import types
+
+from workmatch.utils import fake_llm
+
+
+def ask(llm, text):
+    request = LlmRequest(
+        contents=[types.Content(role="user", parts=[types.Part(text=text)])],
+        config=types.GenerateContentConfig(system_instruction='You are an agent. Your internal name is "career_guidance_agent".'),
+    )
+
+    async def run():
+        return [response async for response in llm.generate_content_async(request)]
+
+    return asyncio.run(run())[0]
+
+
+def test_script_rules_are_loaded_from_the_file_named_by_the_env_var(monkeypatch, tmp_path):
+    script = tmp_path / "rules.json"
+    script.write_text(json.dumps([{"agent": "career_guidance", "match": "nurse", "text": "Scripted reply"}]))
+    monkeypatch.setenv("WORKMATCH_FAKE_LLM_SCRIPT", str(script))
+    monkeypatch.setattr(fake_llm, "_fake_llm", None)
+
+    llm = fake_llm.get_fake_llm()
+
+    assert ask(llm, "I want to be a nurse").content.parts[0].text == "Scripted reply"
+    assert "Scripted reply" not in ask(llm, "I want to be a chef").content.parts[0].text
+
+
+def test_usage_metadata_reports_estimated_tokens():
+    llm = fake_llm.FakeGeminiLlm(output_tokens=7)
+
+    response = ask(llm, "hello")
+
+    assert response.usage_metadata.candidates_token_count == 7
+    assert response.usage_metadata.prompt_token_count > 0
+    assert llm.stats()["calls"] == 1
@@ -0,0 +1,88 @@
+import time
+import sqlite3
+
+import pytest
+
+from workmatch.utils.listing_store import ListingStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ListingStore(str(tmp_path / "listings.db"))
+    yield store
+    store.close()
+
+
+def test_lookup_returns_saved_listings_in_order(store, make_listing):
+    query = {"what": "chef", "country": "gb", "page": 1}
+    store.save(query, [make_listing(2), make_listing(1), {"title": "no id, not stored"}])
+
+    results = store.lookup(query, limit=5)
+
+    assert [listing["id"] for listing in results] == ["job-2", "job-1"]
+    assert results[0]["salary_min"] == 28000.0
+    assert results[0]["salary_is_predicted"] is False
+    assert store.lookup({"what": "baker", "country": "gb", "page": 1}, limit=5) is None
+    assert store.stats() == {"hits": 1, "narrowed_hits": 0, "misses": 1, "writes": 1}
+
+
+def test_lookup_ignores_queries_older_than_max_age(store, make_listing):
+    query = {"what": "chef", "country": "gb", "page": 1}
+    store.save(query, [make_listing(1)], fetched_at=time.time() - 7200)
+
+    assert store.lookup(query, limit=5) is None
+    assert store.lookup(query, limit=5, max_age=10800) is not None
+
+
+def test_narrowed_lookup_filters_a_broader_stored_query(store, make_listing):
+    store.save(
+        {"what": "chef", "country": "gb", "page": 1, "results_per_page": 10},
+        [make_listing(1), make_listing(2, location="London"), make_listing(3, location="London, Camden")],
+    )
+
+    narrowed = store.lookup_narrowed({"what": "chef", "country": "gb", "page": 1, "where": "london"}, limit=2)
+    too_few = store.lookup_narrowed({"what": "chef", "country": "gb", "page": 1, "where": "leeds"}, limit=2)
+    later_page = store.lookup_narrowed({"what": "chef", "country": "gb", "page": 2, "where": "london"}, limit=1)
+
+    assert [listing["id"] for listing in narrowed] == ["job-2", "job-3"]
+    assert too_few is None
+    assert later_page is None
+    assert store.narrowed_hits == 1
+
+
+def test_resaving_a_listing_updates_it_in_place(store, make_listing):
+    store.save({"what": "chef", "country": "gb", "page": 1}, [make_listing(1)])
+    store.save({"what": "cook", "country": "gb", "page": 1}, [make_listing(1, title="Head Chef")])
+
+    results = store.lookup({"what": "chef", "country": "gb", "page": 1}, limit=5)
+
+    assert results[0]["title"] == "Head Chef"
+    assert store.title_pairs() == [("cook", "Head Chef"), ("chef", "Head Chef")]
+
+
+def test_opening_an_old_database_adds_the_numeric_columns(tmp_path, make_listing):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE listings (id TEXT PRIMARY KEY, title TEXT NOT NULL, company TEXT, location TEXT, "
+                 "employment_type TEXT, salary TEXT, description_snippet TEXT, url TEXT, query_key TEXT, "
+                 "fetched_at REAL NOT NULL)")
+    conn.commit()
+    conn.close()
+
+    store = ListingStore(path)
+    try:
+        store.save({"what": "chef", "country": "gb", "page": 1}, [make_listing(1)])
+        results = store.lookup({"what": "chef", "country": "gb", "page": 1}, limit=1)
+    finally:
+        store.close()
+
+    assert results[0]["salary_max"] == 32000.0
+
+
+def test_purge_drops_old_listings_and_queries(store, make_listing):
+    store.save({"what": "chef", "country": "gb", "page": 1}, [make_listing(1)], fetched_at=time.time() - 100)
+    store.save({"what": "cook", "country": "gb", "page": 1}, [make_listing(2)])
+
+    assert store.purge(older_than=50) == 1
+    assert store.lookup({"what": "chef", "country": "gb", "page": 1}, limit=5, max_age=1000) is None
+    assert len(store.lookup({"what": "cook", "country": "gb", "page": 1}, limit=5)) == 1
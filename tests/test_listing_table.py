@@ -0,0 +1,48 @@
+from workmatch.utils.adzuna import CompactListing
+from workmatch.utils.listing_table import TABLE_COLUMNS, pack_listings, unpack_listings
+
+
+def test_compact_listing_round_trips_and_fills_missing_fields(make_listing):
+    listing = make_listing(1)
+
+    compact = CompactListing.from_listing(listing)
+    partial = CompactListing.from_listing({"id": "job-2", "title": "Cook"})
+
+    assert compact.to_listing() == listing
+    assert not hasattr(compact, "__dict__")
+    assert partial.company == ""
+    assert partial.salary_min is None
+    assert partial.salary_is_predicted is False
+
+
+def test_shared_listings_are_packed_once_and_referenced_by_index(make_listing):
+    chef, cook = make_listing(1), make_listing(2)
+
+    packed = pack_listings({"chef": [chef, cook], "cook": [cook]}, sample=[cook])
+
+    assert packed["listing_columns"] == list(TABLE_COLUMNS)
+    assert len(packed["listing_rows"]) == 2
+    assert packed["listings_by_title"] == {"chef": [0, 1], "cook": [1]}
+    assert packed["all_listings"] == [1]
+    assert "job-1" not in str(packed["listing_rows"])
+
+
+def test_optional_columns_are_added_only_when_used(make_listing):
+    plain = pack_listings({"chef": [make_listing(1)]}, sample=[])
+    tagged = pack_listings(
+        {"chef": [make_listing(1, country="de", matched_titles=["chef", "cook"]), make_listing(2)]}, sample=[]
+    )
+
+    assert "country" not in plain["listing_columns"]
+    assert tagged["listing_columns"][-2:] == ["country", "matched_titles"]
+    assert tagged["listing_rows"][1][-2:] == ["", ""]
+
+
+def test_unpack_rebuilds_the_listing_dicts(make_listing):
+    chef = make_listing(1)
+    packed = pack_listings({"chef": [chef]}, sample=[chef])
+
+    unpacked = unpack_listings(packed)
+
+    expected = {column: chef[column] for column in TABLE_COLUMNS}
+    assert unpacked == {"listings_by_title": {"chef": [expected]}, "all_listings": [expected]}
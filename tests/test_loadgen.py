@@ -0,0 +1,53 @@
+import asyncio
+
+import httpx
+
+from devtools.loadgen import APP_NAME, ROOT_AGENT_NAME, LoadStats, virtual_user
+
+PERSONA = {"name": "Tester", "turns": ["Hi", "Find jobs", "Next page"]}
+
+
+def play(handler, persona=PERSONA):
+    stats = LoadStats()
+
+    async def run():
+        async with httpx.AsyncClient(base_url="http://loadgen.test", transport=httpx.MockTransport(handler)) as client:
+            await virtual_user(client, persona, stats, (0.0, 0.0), timeout=5)
+
+    asyncio.run(run())
+    return stats.summary(wall=1.0)
+
+
+def reply(text="Hello!"):
+    return httpx.Response(200, json=[{"author": ROOT_AGENT_NAME, "content": {"parts": [{"text": text}]}}])
+
+
+def test_successful_user_has_no_errors():
+    summary = play(lambda request: reply() if request.url.path == "/run" else httpx.Response(200, json={}))
+
+    assert summary["turns"] == 3
+    assert summary["error_rate"] == 0.0
+    assert summary["users_completed"] == 1
+
+
+def test_failed_session_creation_counts_all_its_turns_as_errors():
+    summary = play(lambda request: httpx.Response(503))
+
+    assert summary["failed_sessions"] == 1
+    assert summary["turns"] == 0
+    assert summary["skipped_turns"] == 3
+    assert summary["error_rate"] == 1.0
+    assert summary["errors"] == {"session_http_503": 1}
+
+
+def test_turns_skipped_after_a_5xx_count_as_errors():
+    def handler(request):
+        if request.url.path.startswith(f"/apps/{APP_NAME}/"):
+            return httpx.Response(200, json={})
+        return reply() if b"Hi" in request.content else httpx.Response(500)
+
+    summary = play(handler)
+
+    assert (summary["turns"], summary["failed_turns"], summary["skipped_turns"]) == (2, 1, 1)
+    assert summary["error_rate"] == round(2 / 3, 4)
+    assert summary["users_completed"] == 0
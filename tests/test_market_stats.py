@@ -0,0 +1,63 @@
+from workmatch.utils.adzuna import AsyncAdzunaAPI
+from workmatch.utils.market_stats import listing_salary, market_stats
+
+
+def test_formatted_listings_carry_numeric_salaries():
+    api = AsyncAdzunaAPI(app_id="test-id", app_key="test-key", cache=None, store=None)
+
+    listing = api._format_job_listing(
+        {"salary_min": 28000, "salary_max": 32000.5, "salary_is_predicted": "1"}, country="us"
+    )
+    unsalaried = api._format_job_listing({"salary_is_predicted": "0"})
+
+    assert listing["salary"] == "$28,000 - $32,000 (est.)"
+    assert (listing["salary_min"], listing["salary_max"], listing["salary_is_predicted"]) == (28000.0, 32000.5, True)
+    assert (unsalaried["salary_min"], unsalaried["salary_max"], unsalaried["salary"]) == (None, None, "Not listed")
+
+
+def test_listing_salary_is_the_midpoint_or_whichever_bound_is_set(make_listing):
+    assert listing_salary(make_listing(salary_min=20000, salary_max=30000)) == 25000
+    assert listing_salary(make_listing(salary_min=20000, salary_max=None)) == 20000
+    assert listing_salary(make_listing(salary_min=None, salary_max=30000)) == 30000
+    assert listing_salary(make_listing(salary_min=None, salary_max=None)) is None
+
+
+def test_market_stats_summarise_every_listing(make_listing):
+    stats = market_stats(
+        {
+            "chef": [
+                make_listing(salary_min=20000, salary_max=30000),
+                make_listing(salary_min=30000, salary_max=40000, location="York"),
+                make_listing(salary_min=None, salary_max=None, employment_type="Part-time", company="Bistro"),
+            ],
+            "cook": [make_listing(salary_min=40000, salary_max=50000, salary_is_predicted=True, company="Bistro")],
+        },
+        countries=["gb"],
+    )
+
+    assert stats["listings_analysed"] == 4
+    assert stats["listings_with_salary"] == 3
+    assert stats["salary_by_title"]["chef"] == {"count": 2, "min": 25000, "median": 30000, "p90": 34000, "currency": "£"}
+    assert stats["salary_by_title"]["cook"]["median"] == 45000
+    assert stats["employment_mix"] == {"Full-time": 0.75, "Part-time": 0.25}
+    assert stats["top_locations"] == {"Leeds": 3, "York": 1}
+    assert stats["top_employers"] == {"Acme": 2, "Bistro": 2}
+    assert stats["predicted_vs_listed"] == {"predicted": 1, "listed": 2, "median_ratio": 1.5}
+
+
+def test_salaries_are_split_by_country_when_several_are_searched(make_listing):
+    stats = market_stats(
+        {"chef": [
+            make_listing(salary_min=20000, salary_max=30000, country="gb"),
+            make_listing(salary_min=40000, salary_max=50000, country="de"),
+        ]},
+        countries=["gb", "de"],
+    )
+
+    assert stats["salary_by_title"]["chef (gb)"]["currency"] == "£"
+    assert stats["salary_by_title"]["chef (de)"]["median"] == 45000
+    assert set(stats["predicted_vs_listed"]) == {"gb", "de"}
+
+
+def test_market_stats_without_listings():
+    assert market_stats({"chef": []}, countries=["gb"]) == {"listings_analysed": 0}
@@ -0,0 +1,55 @@
+import base64
+import json
+
+from workmatch.utils.pagination import decode_cursor, encode_cursor, normalise_title, seeded_rng
+
+
+def test_cursor_round_trips_pages_and_search_id():
+    cursor = encode_cursor({"gb:nurse": 3, "gb:staff nurse": 0}, 2, "abc123")
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == {"v": 1, "n": 2, "p": {"gb:nurse": 3, "gb:staff nurse": 0}, "q": "abc123"}
+
+
+def test_cursor_without_search_id_has_no_q():
+    assert "q" not in decode_cursor(encode_cursor({"gb:nurse": 2}, 1))
+
+
+def test_missing_malformed_or_foreign_cursors_decode_to_none():
+    other_version = base64.urlsafe_b64encode(json.dumps({"v": 99, "n": 1, "p": {}}).encode()).decode()
+
+    assert decode_cursor(None) is None
+    assert decode_cursor("") is None
+    assert decode_cursor("not a cursor!") is None
+    assert decode_cursor(other_version) is None
+
+
+def _raw_cursor(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def test_cursors_with_badly_typed_fields_decode_to_none():
+    for payload in (
+        ["v", 1],
+        {"v": 1, "p": {"gb:nurse": 2}},
+        {"v": 1, "n": "1", "p": {"gb:nurse": 2}},
+        {"v": 1, "n": True, "p": {"gb:nurse": 2}},
+        {"v": 1, "n": -1, "p": {"gb:nurse": 2}},
+        {"v": 1, "n": 1, "p": {"gb:nurse": "2"}},
+        {"v": 1, "n": 1, "p": {"gb:nurse": 2.5}},
+        {"v": 1, "n": 1, "p": {"gb:nurse": None}},
+        {"v": 1, "n": 1, "p": {"gb:nurse": 2}, "q": 7},
+    ):
+        assert decode_cursor(_raw_cursor(payload)) is None, payload
+
+
+def test_normalise_title_folds_case_and_spacing():
+    assert normalise_title("  Staff   NURSE ") == "staff nurse"
+
+
+def test_seeded_rng_is_stable_for_the_same_seed_and_query():
+    first = seeded_rng("session", ["nurse", 1]).random()
+
+    assert seeded_rng("session", ["nurse", 1]).random() == first
+    assert seeded_rng("session", ["nurse", 2]).random() != first
+    assert seeded_rng("other", ["nurse", 1]).random() != first
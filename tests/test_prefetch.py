@@ -0,0 +1,78 @@
+import asyncio
+
+from workmatch.utils.prefetch import Prefetcher
+from workmatch.utils.resilience import CircuitBreaker
+
+
+class FakeLimiter:
+    def __init__(self, headroom):
+        self._headroom = headroom
+
+    def headroom(self):
+        return self._headroom
+
+
+class FakeAdzuna:
+    """Stands in for AsyncAdzunaAPI: one listing per page, optionally failing."""
+
+    def __init__(self, headroom=10.0, fail=False):
+        self.rate_limiter = FakeLimiter(headroom)
+        self.breaker = CircuitBreaker("fake")
+        self.fail = fail
+        self.calls = []
+
+    def search_key(self, **search):
+        return tuple(sorted(search.items()))
+
+    async def search_jobs(self, **search):
+        self.calls.append(search)
+        if self.fail:
+            return {"results": [], "error": "Adzuna API returned 503"}
+        return {"results": [{"id": f"{search['what']}-{search['page']}"}]}
+
+
+def _prefetch(prefetcher, searches):
+    async def run():
+        prefetcher.schedule(searches)
+        await asyncio.gather(*prefetcher._tasks)
+    asyncio.run(run())
+
+
+def test_prefetched_page_is_taken_once():
+    api = FakeAdzuna()
+    prefetcher = Prefetcher(api)
+    search = {"what": "chef", "page": 2}
+
+    _prefetch(prefetcher, [search, search])
+
+    assert prefetcher.take(search) == [{"id": "chef-2"}]
+    assert prefetcher.take(search) is None
+    assert len(api.calls) == 1
+    assert prefetcher.stats() == {
+        "scheduled": 1, "skipped_no_budget": 0, "completed": 1,
+        "hits": 1, "misses": 1, "hit_rate": 0.5, "wasted": 0,
+    }
+
+
+def test_prefetch_is_skipped_without_quota_headroom_or_with_an_open_breaker():
+    low_quota = Prefetcher(FakeAdzuna(headroom=1.0), min_headroom=2.0)
+    broken_api = FakeAdzuna()
+    for _ in range(broken_api.breaker.failure_threshold):
+        broken_api.breaker.record_failure()
+    broken = Prefetcher(broken_api)
+
+    for prefetcher in (low_quota, broken):
+        _prefetch(prefetcher, [{"what": "chef", "page": 2}])
+        assert prefetcher.api.calls == []
+        assert prefetcher.stats()["skipped_no_budget"] == 1
+        assert prefetcher.take({"what": "chef", "page": 2}) is None
+
+
+def test_failed_prefetch_is_not_parked_as_an_empty_page():
+    prefetcher = Prefetcher(FakeAdzuna(fail=True))
+
+    _prefetch(prefetcher, [{"what": "chef", "page": 2}])
+
+    assert prefetcher.take({"what": "chef", "page": 2}) is None
+    assert prefetcher.stats()["completed"] == 0
+
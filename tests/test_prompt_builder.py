@@ -0,0 +1,47 @@
+import pytest
+
+from workmatch import prompt
+from workmatch.registry import AGENT_TREE
+from workmatch.utils.prompt_builder import PromptBuilder
+
+
+def test_fragments_keep_registration_order_and_always_fragments_lead():
+    builder = PromptBuilder()
+    builder.fragment("intro", "You are helpful.", always=True)
+    menus = builder.fragment("menus", "Menus are numbered.")
+    links = builder.fragment("links", "Only real links.")
+
+    instruction = builder.build("Agent body.", links, menus)
+
+    assert instruction == "You are helpful.\n\n---\n\nMenus are numbered.\n\n---\n\nOnly real links.\n\n---\n\nAgent body.\n"
+    assert builder.shared_prefix(instruction) == instruction[:-len("Agent body.\n")]
+    assert builder.shared_prefix("Agent body only") == ""
+
+
+def test_fragments_reject_placeholders_duplicates_and_unknown_names():
+    builder = PromptBuilder()
+    builder.fragment("intro", "Hello")
+
+    with pytest.raises(ValueError):
+        builder.fragment("state", "Hello {user_name}")
+    with pytest.raises(ValueError):
+        builder.fragment("intro", "Again")
+    with pytest.raises(KeyError):
+        builder.build("Body", "missing")
+
+
+@pytest.mark.parametrize("options", [
+    prompt._STARTER_ROLES_OPTIONS,
+    prompt._JOB_OVERVIEW_OPTIONS,
+    prompt._BEGINNER_SKILLS_OPTIONS,
+    prompt._MOTIVATION_OPTIONS,
+])
+def test_entry_level_prompt_routes_every_option_of_each_menu(options):
+    menu, routes = prompt._menu(*options), prompt._routes(*options)
+    numbers = [line.split(".")[0].lstrip("> ") for line in menu.splitlines()[1:]]
+
+    assert routes in prompt.ENTRY_LEVEL_PROMPT
+    assert [part.split(" → ")[0].split()[-1] for part in routes.split(" · ")] == numbers
+    assert routes.endswith(f"{numbers[-1]} → `career_guidance_agent`")
+    for _, agent in options[1:]:
+        assert agent in AGENT_TREE["entry_level_agent"].tools
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from workmatch.utils.rate_limit import (
+    AIMDController,
+    AsyncConcurrencyLimiter,
+    QuotaLimiter,
+    RateLimitExceeded,
+    TokenBucket,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_queues_callers_in_arrival_order():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+    waits = [bucket.reserve() for _ in range(4)]
+
+    assert waits == [0.0, 0.0, 0.5, 1.0]
+    clock.now = 2.0
+    assert bucket.available == pytest.approx(2 - 4 + 4)
+
+
+def test_quota_limiter_rejects_waits_over_max_wait_and_returns_the_token():
+    clock = FakeClock()
+    limiter = QuotaLimiter(per_second=1, burst=1, max_wait=1.5, clock=clock)
+
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 1.0
+    with pytest.raises(RateLimitExceeded):
+        limiter.reserve()
+
+    stats = limiter.stats()
+    assert (stats["granted"], stats["delayed"], stats["rejected"]) == (2, 1, 1)
+    assert limiter.headroom() == pytest.approx(-1.0)
+
+
+def test_cancelled_wait_gives_the_reserved_token_back():
+    clock = FakeClock()
+    limiter = QuotaLimiter(per_second=1, burst=1, per_day=100, max_wait=10, clock=clock)
+    limiter.reserve()
+
+    async def run():
+        waiter = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0)
+        assert limiter.headroom() == pytest.approx(-1.0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(run())
+    assert limiter.headroom() == pytest.approx(0.0)
+    assert limiter.day_bucket.available == pytest.approx(99.0)
+
+
+def test_quota_limiter_daily_bucket_caps_requests():
+    clock = FakeClock()
+    limiter = QuotaLimiter(per_second=100, per_day=2, max_wait=5, clock=clock)
+
+    limiter.reserve()
+    limiter.reserve()
+    with pytest.raises(RateLimitExceeded):
+        limiter.reserve()
+    assert limiter.stats()["day_used_pct"] == 100.0
+
+
+def test_aimd_halves_on_overload_once_per_cooldown_and_grows_back():
+    clock = FakeClock()
+    aimd = AIMDController(maximum=8, latency_target=1.0, cooldown=1.0, clock=clock)
+
+    aimd.on_overload()
+    aimd.on_overload()  # within the cooldown: ignored
+    assert aimd.limit == 4
+
+    aimd.on_success(latency=5.0)  # still in the cooldown, so a slow response does not shrink it again
+    assert aimd.limit == 4
+    for _ in range(5):  # about one step per window of `limit` fast responses
+        aimd.on_success(latency=0.1)
+    assert aimd.limit == 5
+
+    clock.now = 2.0
+    aimd.on_success(latency=5.0)  # slow responses count as overload
+    assert aimd.limit == 2
+    assert aimd.stats()["decreases"] == 2
+
+
+def test_concurrency_limiter_follows_the_controller_limit():
+    aimd = AIMDController(maximum=2)
+
+    async def run():
+        slots = AsyncConcurrencyLimiter(aimd)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            async with slots:
+                peak = max(peak, slots.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        return peak
+
+    assert asyncio.run(run()) == 2
@@ -0,0 +1,65 @@
+import pytest
+
+from workmatch import registry
+
+
+@pytest.fixture(autouse=True)
+def fake_model(monkeypatch):
+    # Building agents needs no model access; the fake model avoids loading secrets
+    monkeypatch.setenv("WORKMATCH_FAKE_LLM", "true")
+
+
+def tool_names(agent):
+    return [getattr(tool, "name", getattr(tool, "__name__", None)) for tool in agent.tools]
+
+
+def test_expanded_insights_can_fall_back_to_title_variants_agent():
+    agent = registry.get_agent("expanded_insights_agent")
+
+    assert tool_names(agent) == ["summarise_expanded_job_roles_tool", "title_variants_agent"]
+
+
+@pytest.fixture
+def fresh_registry(monkeypatch):
+    """An empty agent cache, so builds in the test are observable (modules stay imported)."""
+    monkeypatch.setattr(registry, "_agents", {})
+
+
+def test_every_spec_names_registered_agents():
+    for spec in registry.AGENT_TREE.values():
+        assert set(spec.tools) <= set(registry.AGENT_TREE), spec.name
+
+
+def test_coordinator_tools_are_declared_without_building_their_agents(fresh_registry):
+    tools = registry.agent_tools(registry.ROOT_AGENT)
+    specs = [registry.AGENT_TREE[name] for name in registry.AGENT_TREE[registry.ROOT_AGENT].tools]
+
+    assert [tool.name for tool in tools] == [spec.name for spec in specs]
+    assert [tool.description for tool in tools] == [spec.description for spec in specs]
+    assert all(isinstance(tool, registry.LazyAgentTool) and not tool._built for tool in tools)
+    assert registry._agents == {}
+
+
+def test_lazy_tool_builds_its_agent_on_first_use(fresh_registry):
+    tool = registry.agent_tools("advanced_pathways_agent")[0]
+
+    tool._ensure_built()
+
+    assert tool.agent is registry.get_agent(tool.spec.name)
+    assert list(registry._agents) == [tool.spec.name]
+
+
+def test_agents_are_built_once_and_timed(fresh_registry):
+    first = registry.get_agent("networking_agent")
+    again = registry.get_agent("networking_agent")
+
+    assert first is again
+    assert first.name == "networking_agent"
+    assert registry.startup_timer.steps()[-1]["step"] == "build networking_agent"
+
+
+def test_build_all_builds_the_whole_tree(fresh_registry):
+    agents = registry.build_all()
+
+    assert list(agents) == list(registry.AGENT_TREE)
+    assert all(agent.name == name for name, agent in agents.items())
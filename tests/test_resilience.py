@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from workmatch.utils.adzuna import AsyncAdzunaAPI
+from workmatch.utils.resilience import CircuitBreaker, RetryPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def open_breaker(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker
+
+
+def test_retry_delays_grow_and_are_capped():
+    policy = RetryPolicy(attempts=3, base_delay=0.5, max_delay=1.5, rng=lambda: 1.0)
+
+    assert [policy.should_retry(n) for n in (1, 2, 3)] == [True, True, False]
+    assert [policy.delay(n) for n in (1, 2, 3)] == [0.5, 1.0, 1.5]
+    assert policy.retries == 3
+
+
+def test_breaker_opens_after_consecutive_failures_and_fails_fast():
+    clock = FakeClock()
+    breaker = open_breaker(clock)
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow() is False
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_half_open_lets_one_probe_through_and_closes_on_success():
+    clock = FakeClock()
+    breaker = open_breaker(clock)
+    clock.now = 10
+
+    assert breaker.allow() is True
+    assert breaker.allow() is False  # one probe at a time
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failed_probe_reopens_the_breaker():
+    clock = FakeClock()
+    breaker = open_breaker(clock)
+    clock.now = 10
+
+    assert breaker.allow() is True
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_released_probe_lets_the_next_call_probe():
+    clock = FakeClock()
+    breaker = open_breaker(clock)
+    clock.now = 10
+
+    assert breaker.allow() is True
+    breaker.release()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow() is True
+
+
+def test_probe_that_never_reports_back_is_given_up_on():
+    clock = FakeClock()
+    breaker = open_breaker(clock)
+    clock.now = 10
+    assert breaker.allow() is True
+
+    clock.now = 15
+    assert breaker.allow() is False
+    clock.now = 20
+    assert breaker.allow() is True
+
+
+def test_cancelled_probe_request_does_not_wedge_the_client_breaker():
+    clock = FakeClock()
+
+    async def run():
+        api = AsyncAdzunaAPI(app_id="test-id", app_key="test-key", cache=None, store=None)
+        api.breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=10, clock=clock)
+        api.breaker.record_failure()
+        clock.now = 10
+
+        async def hang(url, params, attempt):
+            await asyncio.sleep(10)
+
+        api._send = hang
+        probe = asyncio.ensure_future(api._get("http://adzuna.invalid/gb/search/1"))
+        await asyncio.sleep(0)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        return api.breaker.allow()
+
+    assert asyncio.run(run()) is True
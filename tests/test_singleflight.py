@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from devtools.adzuna_standin import AdzunaStandin
+from workmatch.utils.adzuna import AsyncAdzunaAPI
+from workmatch.utils.singleflight import AsyncSingleFlight
+
+
+def test_concurrent_callers_share_one_call():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "listings"
+
+    async def run():
+        flights = AsyncSingleFlight()
+        results = await asyncio.gather(*(flights.do("key", fetch) for _ in range(3)))
+        return results, flights.stats()
+
+    results, stats = asyncio.run(run())
+    assert results == ["listings"] * 3
+    assert len(calls) == 1
+    assert stats == {"coalesced": 2, "in_flight": 0}
+
+
+def test_errors_reach_every_caller_and_are_not_kept():
+    async def fail():
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    async def run():
+        flights = AsyncSingleFlight()
+        results = await asyncio.gather(flights.do("key", fail), flights.do("key", fail), return_exceptions=True)
+        return results, flights.stats()
+
+    results, stats = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert stats["in_flight"] == 0
+
+
+def test_cancelling_one_caller_keeps_the_shared_call_running():
+    async def run():
+        flights = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "listings"
+
+        first = asyncio.ensure_future(flights.do("key", fetch))
+        second = asyncio.ensure_future(flights.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return await second, first.cancelled()
+
+    assert asyncio.run(run()) == ("listings", True)
+
+
+def test_cancelling_the_last_caller_cancels_the_shared_call():
+    async def run():
+        flights = AsyncSingleFlight()
+        started, stopped = asyncio.Event(), asyncio.Event()
+
+        async def fetch():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                stopped.set()
+                raise
+
+        caller = asyncio.ensure_future(flights.do("key", fetch))
+        await started.wait()
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.wait_for(stopped.wait(), 1)
+        in_flight = flights.stats()["in_flight"]
+
+        async def fresh():
+            return "fresh"
+
+        return in_flight, await flights.do("key", fresh)
+
+    assert asyncio.run(run()) == (0, "fresh")
+
+
+def test_identical_concurrent_searches_send_one_request(monkeypatch):
+    async def run():
+        api = AsyncAdzunaAPI(app_id="test-id", app_key="test-key", cache=None, store=None)
+        try:
+            return await asyncio.gather(*(api.search_jobs("welder") for _ in range(5)))
+        finally:
+            await api.aclose()
+
+    with AdzunaStandin(total=3) as standin:
+        monkeypatch.setenv("ADZUNA_BASE_URL", standin.base_url)
+        responses = asyncio.run(run())
+        requests = standin.stats()["requests"]
+
+    assert requests == 1
+    assert all(response["results"] == responses[0]["results"] for response in responses)
+    # Each caller gets its own copy of the shared listings
+    assert responses[0]["results"][0] is not responses[1]["results"][0]
@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from workmatch.utils import title_index
+from workmatch.utils.title_index import SEED_WEIGHT, TitleIndex, clean_title
+from workmatch.utils.title_variant_cache import TitleVariantCache
+
+
+def test_clean_title_drops_advert_noise():
+    assert clean_title("Data Analyst - Remote") == "Data Analyst"
+    assert clean_title("Nurse (Band 5)") == "Nurse"
+    assert clean_title("We are looking for a motivated and passionate individual to join") == ""
+
+
+def test_curated_group_expands_both_ways():
+    index = TitleIndex()
+    index.add_group(["Data Analyst", "BI Analyst", "Reporting Analyst"])
+
+    variants = dict(index.expand("data analyst"))
+    assert set(variants) == {"BI Analyst", "Reporting Analyst"}
+    assert all(0.6 < score < 0.7 for score in variants.values())
+    assert "Data Analyst" in dict(index.expand("BI analyst"))
+
+
+def test_observed_listing_titles_need_repeated_evidence():
+    index = TitleIndex()
+    index.observe("chef", ["Sous Chef - Live-in", "Kitchen Porter"])
+    assert index.expand("chef") == []  # one sighting scores below the default threshold
+
+    index.observe("chef", ["Sous Chef"])
+    assert [variant for variant, _ in index.expand("chef")] == ["Sous Chef"]
+
+
+def test_unknown_phrasing_borrows_neighbours_of_titles_sharing_its_words():
+    index = TitleIndex()
+    index.add_group(["Senior Data Analyst", "Lead Data Analyst"])
+
+    assert [variant for variant, _ in index.expand("senior data analyst remote")] == ["Senior Data Analyst", "Lead Data Analyst"]
+    assert index.expand("astronaut") == []
+
+
+def test_observed_titles_are_evicted_least_recently_seen_first_but_curated_ones_stay():
+    index = TitleIndex(max_titles=4)
+    index.add_group(["Nurse", "Staff Nurse"])
+    index.observe("chef", ["Sous Chef"])
+    index.observe("baker", ["Pastry Chef"])
+
+    stats = index.stats()
+    assert stats["titles"] == 4
+    assert stats["evicted"] == 2
+    assert index.expand("staff nurse")
+    assert "chef" not in index._display and "sous chef" not in index._display
+    assert "sous" not in index._by_token and "chef" not in index._neighbours
+    assert set(index._neighbours["baker"]) == {"pastry chef"}
+
+
+def test_neighbours_are_pruned_to_the_strongest():
+    index = TitleIndex(max_neighbours=2)
+    index.add_group(["Nurse", "Staff Nurse"])
+    index.observe("nurse", [f"Nurse Role {n}" for n in range(4)])
+
+    neighbours = index._neighbours["nurse"]
+    assert len(neighbours) == 2
+    assert "staff nurse" in neighbours
+    assert all("nurse" in index._neighbours.get(other, {}) for other in neighbours)
+    assert index.stats()["links"] == 2
+
+
+def test_agent_expansions_age_out_like_observed_titles():
+    index = TitleIndex(max_titles=3)
+    index.add_group(["Nurse", "Staff Nurse"])
+    index.add_group(["Chef", "Sous Chef"], curated=False)
+
+    assert index.stats()["evicted"] == 1
+    assert index.expand("staff nurse")
+
+
+@pytest.fixture
+def shared_index(monkeypatch, tmp_path):
+    seed = tmp_path / "seed.json"
+    seed.write_text(json.dumps({"nurse": ["staff nurse"]}))
+    cache = TitleVariantCache()
+    cache.seed_from_file(str(seed))
+    cache.put("data analyst", ["BI Analyst", "Reporting Analyst"])
+    monkeypatch.setenv("WORKMATCH_TITLE_INDEX_SEED", str(seed))
+    monkeypatch.setattr(title_index, "_title_index", None)
+    monkeypatch.setattr(title_index, "get_title_variant_cache", lambda: cache)
+    monkeypatch.setattr(title_index, "get_listing_store", lambda: None)
+    return title_index.get_title_index()
+
+
+def test_shared_index_learns_the_cached_agent_expansions(shared_index):
+    assert title_index.expand_title("data analyst") == ["BI Analyst", "Reporting Analyst"]
+    assert title_index.expand_title("nurse") == ["staff nurse"]
+    assert shared_index._neighbours["nurse"]["staff nurse"] == SEED_WEIGHT  # the seed list is not added twice
+
+
+def test_new_agent_expansions_reach_the_shared_index(shared_index):
+    assert title_index.expand_title("barista") == []
+
+    title_index.learn_variants("Barista", ["Coffee Shop Assistant"])
+
+    assert title_index.expand_title("barista") == ["Coffee Shop Assistant"]
@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+from workmatch.utils.title_variant_cache import (
+    TitleVariantCache,
+    format_variants,
+    parse_variants,
+    requested_title,
+    title_key,
+)
+
+
+@pytest.mark.parametrize("request_text, title", [
+    ("data analyst", "data analyst"),
+    ("Data Analyst.", "Data Analyst"),
+    ('Expand "Data Analyst"', "Data Analyst"),
+    ("Give me related job titles for a data analyst in London", "data analyst"),
+    ("Find variants of: Senior UX Designer", "Senior UX Designer"),
+    ("nurse jobs", "nurse"),
+    ("job_title: data analyst", "data analyst"),
+])
+def test_requested_title_extracts_the_title(request_text, title):
+    assert requested_title(request_text) == title
+
+
+def test_requests_that_are_not_a_bare_title_are_not_cached():
+    assert requested_title("I am a teacher who wants to move into something in tech with good pay") == ""
+    assert requested_title("   ") == ""
+
+
+def test_phrasings_of_one_request_share_a_key():
+    keys = {title_key(requested_title(text)) for text in ("Data Analyst", "expand 'data analyst'", "related titles for a data analyst")}
+    assert keys == {"data analyst"}
+
+
+def test_variants_round_trip_through_the_reply_format():
+    variants = ["BI Analyst", "Reporting Analyst"]
+
+    assert parse_variants(format_variants(variants)) == variants
+    assert parse_variants(json.dumps(variants)) == variants
+    assert parse_variants("What kind of analyst do you mean?") == []
+
+
+def test_cache_hits_by_normalised_title_and_expires(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("workmatch.utils.title_variant_cache.time.time", lambda: now[0])
+    cache = TitleVariantCache(ttl=60)
+
+    cache.put("Data Analyst", ["BI Analyst"])
+
+    assert cache.get("  data   ANALYST ") == ["BI Analyst"]
+    now[0] += 61
+    assert cache.get("data analyst") is None
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1, "writes": 1}
+
+
+def test_cache_evicts_least_recently_used_past_max_entries():
+    cache = TitleVariantCache(max_entries=2)
+    cache.put("nurse", ["staff nurse"])
+    cache.put("chef", ["sous chef"])
+    cache.get("nurse")
+    cache.put("baker", ["pastry chef"])
+
+    assert cache.get("chef") is None
+    assert cache.get("nurse") == ["staff nurse"]
+
+
+def test_cache_persists_in_its_database_file(tmp_path):
+    path = str(tmp_path / "titles.db")
+    cache = TitleVariantCache(path)
+    cache.put("nurse", ["staff nurse"])
+    cache.close()
+
+    assert TitleVariantCache(path).get("nurse") == ["staff nurse"]
+
+
+def test_seeding_keeps_existing_entries():
+    cache = TitleVariantCache()
+    cache.put("nurse", ["ward nurse"])
+
+    added = cache.seed({"nurse": ["staff nurse"], "chef": ["sous chef"]})
+
+    assert added == 1
+    assert cache.get("nurse") == ["ward nurse"]
+    assert cache.stats()["misses"] == 0
+
+
+def test_entries_lists_fresh_expansions_without_counting_hits(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("workmatch.utils.title_variant_cache.time.time", lambda: now[0])
+    cache = TitleVariantCache(ttl=60)
+    cache.put("nurse", ["staff nurse"])
+    now[0] += 30
+    cache.put("chef", ["sous chef"])
+    now[0] += 31
+
+    assert cache.entries() == {"chef": ["sous chef"]}
+    assert cache.stats()["hits"] == 0
@@ -0,0 +1,72 @@
+from workmatch.utils.token_budget import REPORT_TOKENS, estimate_tokens, fit_to_budget
+
+
+def build(listings_by_title, sample):
+    return {
+        "total_listings_found": 12,
+        "listings_by_title": listings_by_title,
+        "all_listings": sample,
+        "market_stats": {"listings_analysed": 12, "salary_by_title": {"chef": {"median": 30000}}},
+    }
+
+
+def _listings(make_listing):
+    by_title = {
+        title: [make_listing(title=f"{title} {rank}", description_snippet="x" * 200) for rank in range(3)]
+        for title in ("chef", "cook")
+    }
+    sample = [listings[0] for listings in by_title.values()]
+    return by_title, sample
+
+
+def test_estimate_tokens_counts_about_four_characters_per_token():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abc") == 1
+    assert estimate_tokens("x" * 400) == 100
+    assert estimate_tokens({"a": 1}) == estimate_tokens('{"a":1}')
+
+
+def test_response_within_budget_is_untouched(make_listing):
+    by_title, sample = _listings(make_listing)
+
+    response = fit_to_budget(build, by_title, sample, budget=10000)
+
+    assert response == build(by_title, sample)
+
+
+def test_lower_ranked_listings_go_first_and_each_title_keeps_its_top_listing(make_listing):
+    by_title, sample = _listings(make_listing)
+    full = estimate_tokens(build(by_title, sample))
+
+    response = fit_to_budget(build, by_title, sample, budget=full - 5)
+
+    kept = response["listings_by_title"]
+    assert [listing["title"] for listing in kept["chef"]] == ["chef 0", "chef 1", "chef 2"]
+    assert [listing["title"] for listing in kept["cook"]] == ["cook 0", "cook 1"]
+    assert response["trimmed"]["listings_removed"] == 1
+    assert response["trimmed"]["sections_removed"] == []
+    assert response["trimmed"]["estimated_tokens_after"] <= full - 5
+
+
+def test_tight_budget_drops_per_title_detail_then_the_sample(make_listing):
+    by_title, sample = _listings(make_listing)
+
+    response = fit_to_budget(build, by_title, sample, budget=REPORT_TOKENS + 100)
+
+    assert response["total_listings_found"] == 12
+    assert response["listings_by_title"] == {}
+    assert len(response["all_listings"]) < len(sample)
+    assert "salary_by_title" not in response["market_stats"]
+    assert response["trimmed"]["sections_removed"] == ["listings_by_title", "salary_by_title"]
+    assert response["trimmed"]["listings_removed"] == 6 - len(response["all_listings"])
+
+
+def test_impossible_budget_keeps_only_the_summary_counts(make_listing):
+    by_title, sample = _listings(make_listing)
+
+    response = fit_to_budget(build, by_title, sample, budget=1)
+
+    assert response["total_listings_found"] == 12
+    assert response["all_listings"] == []
+    assert "market_stats" not in response
+    assert response["trimmed"]["sections_removed"] == ["listings_by_title", "salary_by_title", "market_stats"]